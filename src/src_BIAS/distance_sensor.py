@@ -13,7 +13,7 @@ try:
     import time
     from scipy.interpolate import interp1d
     from analog import Analog  # selfmade
-    from fileR import FileR  # selfmade
+    from calibration_store import CALIBRATION_STORE  # selfmade
 except Exception as e:
     log(f'Import Exception: {str(e)}', important=True, in_exception=True)
 
@@ -30,8 +30,6 @@ class DistanceSensor(Analog):
             port (int): the integer value from where it is plugged in (the hardware). E.g.: 5; 2; 0; 4; 1; 3
         """
         super().__init__(port)
-        self.dist_arr_file_name = 'distances_arr.txt'
-        self.file_manager = FileR(BIAS_FOLDER)
         self._run_lookup()
 
     # ===================== PRIVATE METHODS =====================
@@ -65,11 +63,11 @@ class DistanceSensor(Analog):
         Returns:
             str: string object of the absolute file path
         """
-        return self.dist_arr_file_name
+        return CALIBRATION_STORE.path
 
     def get_distances(self, raises_exception: bool = True) -> tuple:
         """
-        Getting the distances from the distances_arr.txt file
+        Getting the calibrated distances from the calibration store
 
         Args:
             raises_exception (bool, optional): If it should raise an exception, if the file does not exist yet (True) or not (False)
@@ -79,24 +77,14 @@ class DistanceSensor(Analog):
                 (values: list, mm: list)
         """
         try:
-            if not self.file_manager.exists(self.dist_arr_file_name):
+            distances = CALIBRATION_STORE.get('distances')
+            if distances is None:
                 if raises_exception:
-                    log(f'{self.dist_arr_file_name} not found. Run calibration first.', in_exception=True)
-                    raise FileNotFoundError(f'{self.dist_arr_file_name} not found. Run calibration first.')
+                    log('No distances found. Run calibration first.', in_exception=True)
+                    raise FileNotFoundError('No distances found. Run calibration first.')
+                return [], []
 
-            with open(os.path.join(self.file_manager.get_base_directory() + '/' + self.dist_arr_file_name), "r") as f:
-                lines = f.readlines()
-
-            values = []
-            mm = []
-
-            for line in lines:
-                if line.startswith("value="):
-                    values = list(map(int, line.strip().split("=")[1].split(",")))
-                elif line.startswith("mm="):
-                    mm = list(map(int, line.strip().split("=")[1].split(",")))
-
-            return values, mm
+            return distances['value'], distances['mm']
         except Exception as e:
             log(str(e), in_exception=True)
 
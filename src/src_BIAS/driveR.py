@@ -1,6 +1,6 @@
 #!/usr/bin/python3
 import os, sys
-from functools import lru_cache
+from functools import lru_cache, partial
 
 sys.path.append("/usr/lib")
 
@@ -29,18 +29,14 @@ try:
     from distance_sensor import DistanceSensor  # selfmade
     from light_sensor import LightSensor  # selfmade
     from digital import Digital  # selfmade
-    from fileR import FileR  # selfmade
+    from calibration_store import CALIBRATION_STORE  # selfmade
+    from imu_sampler import IMU_SAMPLER  # selfmade
     from util import Util  # selfmade
 except Exception as e:
     log(f'Import Exception: {str(e)}', important=True, in_exception=True)
 
 
 BIAS_FOLDER = '/home/kipr/BotBall-data/bias_files'
-try:
-    file_Manager = FileR(BIAS_FOLDER)
-except Exception as e:
-    log(f'FileR Error: {str(e)}', important=True, in_exception=True)
-
 os.makedirs(BIAS_FOLDER, exist_ok=True)
 FILE_PATH = os.path.join(sys.path[0], __file__)
 breakable_function_name = None
@@ -149,8 +145,6 @@ class base_driver:
         self._next_motor_id = 0
         self.max_speed = 1500
         self.utility = Util()
-        self.mm_per_sec_file = 'mm_per_sec.txt'
-        self.axis_importance_file = 'axis_importance_level.txt'
         self.pseudo_distanceR = DistanceSensor(99999999999)  # just an imaginary port, which will never exist
         self.distance_far_values, self.distance_far_mm = self.pseudo_distanceR.get_distances(raises_exception=False)
         self.check_wheelr_instance(motors)
@@ -196,37 +190,41 @@ class base_driver:
 
         if most_important_axis.upper() == 'x'.upper():
             self.standard_bias_gyro = self.bias_gyro_x
-            self.standard_axis_function = k.gyro_x
+            self.standard_axis = 'gyro_x'
+            self.standard_axis_function = partial(IMU_SAMPLER.get_latest, 'gyro_x')
             self.standard_bias_accel = self.bias_accel_x
         elif most_important_axis.upper() == 'y'.upper():
             self.standard_bias_gyro = self.bias_gyro_y
-            self.standard_axis_function = k.gyro_y
+            self.standard_axis = 'gyro_y'
+            self.standard_axis_function = partial(IMU_SAMPLER.get_latest, 'gyro_y')
             self.standard_bias_accel = self.bias_accel_y
         elif most_important_axis.upper() == 'z'.upper():
             self.standard_bias_gyro = self.bias_gyro_z
-            self.standard_axis_function = k.gyro_z
+            self.standard_axis = 'gyro_z'
+            self.standard_axis_function = partial(IMU_SAMPLER.get_latest, 'gyro_z')
             self.standard_bias_accel = self.bias_accel_z
         else:
             log('RUN THE "threshold_identification" FUNCTION TO IDENTIFY THE NECESSARY AXIS (X, Y, Z)', important=True)
+            self.standard_axis = None
             self.standard_axis_function = None
 
 
     def _set_adjuster(self):
-        self.adjuster = file_Manager.reader('adjuster_file.txt', 'int')
+        self.adjuster = CALIBRATION_STORE.get('adjuster')
 
 
     def _set_threshold_strength(self):
-        self._threshold_strength = file_Manager.reader('threshold_file.txt').strip()
+        self._threshold_strength = CALIBRATION_STORE.get('threshold_strength')
 
     def _reverse_threshold_strength(self):
-        cur_strength = file_Manager.reader('threshold_file.txt').strip()
+        cur_strength = CALIBRATION_STORE.get('threshold_strength')
         msg = 'SMALLER' if cur_strength != 'SMALLER' else 'BIGGER'
-        file_Manager.writer('threshold_file.txt', 'w', msg)
+        CALIBRATION_STORE.set('threshold_strength', msg)
         self._set_threshold_strength()
 
 
     def _save_adjuster(self):
-        file_Manager.writer('adjuster_file.txt', 'w', str(self.adjuster))
+        CALIBRATION_STORE.set('adjuster', self.adjuster)
 
     def _hardware_orientation_identification(self, output: bool = True):
         x = abs(k.accel_x())
@@ -236,7 +234,7 @@ class base_driver:
         axis = max(x, y, z)
         axis_name = 'Y' if axis == y else 'X' if axis == x else 'Z'
         log(f'Needed axis: {axis_name}', with_print=output, important=True)
-        file_Manager.writer(self.axis_importance_file, 'w', axis_name)
+        CALIBRATION_STORE.set('axis_importance', axis_name)
 
 
     # ======================= SAVE BIAS ========================
@@ -250,12 +248,11 @@ class base_driver:
         Returns:
             None, but sets a class variable
         """
-        file_name = 'bias_gyro_x.txt'
-        temp_bias = file_Manager.reader(file_name, 'float')
+        temp_bias = CALIBRATION_STORE.get('bias_gyro_x')
         avg = (temp_bias + self.get_bias_gyro_x()) / 2
 
         self.bias_gyro_x = avg
-        file_Manager.writer(file_name, 'w', str(avg))
+        CALIBRATION_STORE.set('bias_gyro_x', avg)
 
 
     def save_bias_gyro_y(self) -> None:
@@ -268,12 +265,11 @@ class base_driver:
         Returns:
             None, but sets a class variable
         """
-        file_name = 'bias_gyro_y.txt'
-        temp_bias = file_Manager.reader(file_name, 'float')
+        temp_bias = CALIBRATION_STORE.get('bias_gyro_y')
         avg = (temp_bias + self.get_bias_gyro_y()) / 2
 
         self.bias_gyro_y = avg
-        file_Manager.writer(file_name, 'w', str(avg))
+        CALIBRATION_STORE.set('bias_gyro_y', avg)
 
 
     def save_bias_gyro_z(self) -> None:
@@ -286,12 +282,11 @@ class base_driver:
         Returns:
             None, but sets a class variable
         """
-        file_name = 'bias_gyro_z.txt'
-        temp_bias = file_Manager.reader(file_name, 'float')
+        temp_bias = CALIBRATION_STORE.get('bias_gyro_z')
         avg = (temp_bias + self.get_bias_gyro_z()) / 2
 
         self.bias_gyro_z = avg
-        file_Manager.writer(file_name, 'w', str(avg))
+        CALIBRATION_STORE.set('bias_gyro_z', avg)
 
 
     def save_bias_accel_x(self) -> None:
@@ -304,12 +299,11 @@ class base_driver:
         Returns:
             None, but sets a class variable
         """
-        file_name = 'bias_accel_x.txt'
-        temp_bias = file_Manager.reader(file_name, 'float')
+        temp_bias = CALIBRATION_STORE.get('bias_accel_x')
         avg = (temp_bias + self.get_bias_accel_x()) / 2
 
         self.bias_accel_x = avg
-        file_Manager.writer(file_name, 'w', str(avg))
+        CALIBRATION_STORE.set('bias_accel_x', avg)
 
 
     def save_bias_accel_y(self) -> None:
@@ -322,12 +316,11 @@ class base_driver:
         Returns:
             None, but sets a class variable
         """
-        file_name = 'bias_accel_y.txt'
-        temp_bias = file_Manager.reader(file_name, 'float')
+        temp_bias = CALIBRATION_STORE.get('bias_accel_y')
         avg = (temp_bias + self.get_bias_accel_y()) / 2
 
         self.bias_accel_y = avg
-        file_Manager.writer(file_name, 'w', str(avg))
+        CALIBRATION_STORE.set('bias_accel_y', avg)
 
 
     def save_bias_accel_z(self) -> None:
@@ -340,12 +333,11 @@ class base_driver:
         Returns:
             None, but sets a class variable
         """
-        file_name = 'bias_accel_z.txt'
-        temp_bias = file_Manager.reader(file_name, 'float')
+        temp_bias = CALIBRATION_STORE.get('bias_accel_z')
         avg = (temp_bias + self.get_bias_accel_z()) / 2
 
         self.bias_accel_z = avg
-        file_Manager.writer(file_name, 'w', str(avg))
+        CALIBRATION_STORE.set('bias_accel_z', avg)
 
 
     def save_degrees_time(self) -> None:
@@ -358,14 +350,13 @@ class base_driver:
         Returns:
             None, but sets class variables
         """
-        file_name = 'degrees_time.txt'
-        degrees_time = file_Manager.reader(file_name, 'float')
+        degrees_time = CALIBRATION_STORE.get('degrees_time')
         avg = (degrees_time + self.get_degrees_time()) / 2
 
         self.ONEEIGHTY_DEGREES_SECS = avg
         self.NINETY_DEGREES_SECS = self.ONEEIGHTY_DEGREES_SECS / 2
 
-        file_Manager.writer(file_name, 'w', str(avg))
+        CALIBRATION_STORE.set('degrees_time', avg)
 
 
 
@@ -383,17 +374,38 @@ class base_driver:
         v = values if isinstance(values, list) else self.distance_far_values
         m = mm if isinstance(mm, list) else self.distance_far_mm
 
-        try:
-            with open(self.pseudo_distanceR.get_file_path(), "w") as f:
-                f.write("value=" + ",".join(map(str, v)) + "\n")
-                f.write("mm=" + ",".join(map(str, m)) + "\n")
-            log(f"Distances saved to {self.pseudo_distanceR.get_file_path()}")
-
-        except Exception as e:
-            log(str(e), important=True, in_exception=True)
+        CALIBRATION_STORE.set('distances', {'value': v, 'mm': m})
+        log(f"Distances saved to {CALIBRATION_STORE.path}")
 
 
     # ================== GET / OVERWRITE BIAS ==================
+    def _collect_drift(self, sequence: int, last_bias: int) -> tuple:
+        """
+        Sums up the drift of every IMU sample on the standard axis since the last call. Like before, only values that changed count, but no sample gets missed if the loop is slower than the sampler.
+        Every sample counts as one step of the default sampling rate (IMU_SAMPLER.RATE, 200Hz), so theta grows with the time the robot turns and not with the speed of the loop. The thresholds of the driving functions are in this unit, and threshold_identification() / adjuster_identification() measure in it as well. If the rate gets changed with IMU_SAMPLER.set_rate(), the samples get scaled, so the unit stays the same
+
+        Args:
+            sequence (int): sequence number of the IMU sampler from the last call (IMU_SAMPLER.get_sequence() before the first one)
+            last_bias (int): last value that got counted
+
+        Returns:
+            tuple[
+                int: sequence number for the next call
+                int: last value that got counted
+                float: the drift to add to theta
+            ]
+        """
+        if self.standard_axis is None:
+            raise ValueError('No axis calibration done. Execute the "auto_calibration" function first')
+
+        sequence, values = IMU_SAMPLER.get_since(sequence, self.standard_axis)
+        drift = 0
+        for this_bias in values:
+            if last_bias != this_bias:
+                last_bias = this_bias
+                drift += this_bias - self.standard_bias_gyro
+        return sequence, last_bias, drift * IMU_SAMPLER.RATE / IMU_SAMPLER.get_rate()
+
     def get_current_standard_gyro(self) -> int:
         """
         Getting the current value of the bias depending on if the controller is standing or laying down
@@ -420,8 +432,7 @@ class base_driver:
         """
         degree_time = getattr(self, 'ONEEIGHTY_DEGREES_SECS', None)
         if not degree_time:
-            file_name = 'degrees_time.txt'
-            degree_time = file_Manager.reader(file_name, 'float')
+            degree_time = CALIBRATION_STORE.get('degrees_time')
 
         return degree_time
 
@@ -437,8 +448,7 @@ class base_driver:
         """
         bias = getattr(self, 'bias_gyro_z', None)
         if not bias:
-            file_name = 'bias_gyro_z.txt'
-            bias = file_Manager.reader(file_name, 'float')
+            bias = CALIBRATION_STORE.get('bias_gyro_z')
 
         return bias
 
@@ -454,8 +464,7 @@ class base_driver:
         """
         bias = getattr(self, 'bias_gyro_y', None)
         if not bias:
-            file_name = 'bias_gyro_y.txt'
-            bias = file_Manager.reader(file_name, 'float')
+            bias = CALIBRATION_STORE.get('bias_gyro_y')
 
         return bias
 
@@ -471,8 +480,7 @@ class base_driver:
         """
         bias = getattr(self, 'bias_gyro_x', None)
         if not bias:
-            file_name = 'bias_gyro_x.txt'
-            bias = file_Manager.reader(file_name, 'float')
+            bias = CALIBRATION_STORE.get('bias_gyro_x')
 
         return bias
 
@@ -488,8 +496,7 @@ class base_driver:
         """
         bias = getattr(self, 'bias_accel_z', None)
         if not bias:
-            file_name = 'bias_accel_z.txt'
-            bias = file_Manager.reader(file_name, 'float')
+            bias = CALIBRATION_STORE.get('bias_accel_z')
 
         return bias
 
@@ -505,8 +512,7 @@ class base_driver:
         """
         bias = getattr(self, 'bias_accel_y', None)
         if not bias:
-            file_name = 'bias_accel_y.txt'
-            bias = file_Manager.reader(file_name, 'float')
+            bias = CALIBRATION_STORE.get('bias_accel_y')
 
         return bias
 
@@ -523,8 +529,7 @@ class base_driver:
         bias = getattr(self, 'bias_accel_x', None)
 
         if not bias:
-            file_name = 'bias_accel_x.txt'
-            bias = file_Manager.reader(file_name, 'float')
+            bias = CALIBRATION_STORE.get('bias_accel_x')
 
         return bias
 
@@ -555,10 +560,7 @@ class base_driver:
                 - float: time in seconds for driving
                 - float: calculated value of mm/sec
         """
-        text = file_Manager.reader(self.mm_per_sec_file).split('\n')
-        total = float(text[0])
-        mm = int(text[1])
-        sec = float(text[2])
+        total, mm, sec = CALIBRATION_STORE.get('mm_per_sec')
 
         if only_mm and only_sec:
             return mm, sec
@@ -578,14 +580,13 @@ class base_driver:
         Returns:
             float: the distance in seconds calculated to the current default speed (ds_speed) between the front and rear light / brightness sensor
         """
-        file_name = 'light_sensor_distance_sec.txt'
         try:
-            distances_str = file_Manager.reader(file_name)
-            if distances_str == '0':  # not initialized
+            distance = CALIBRATION_STORE.get('light_sensor_distance_sec')
+            if not distance:  # not initialized
                 log('You need to calibrate the light sensor distance first!', in_exception=True)
                 raise ValueError('You need to calibrate the light sensor distance first!')
 
-            speed, value = distances_str.split(' ')
+            speed, value = distance
             speed_multi = int(speed) / self.ds_speed
             distance_sec = float(value) * speed_multi
 
@@ -603,7 +604,7 @@ class base_driver:
         Returns:
             list[str]: List with all axis sorted by importance (first element -> most important; last element -> least important)
         """
-        return file_Manager.reader(self.axis_importance_file).strip()
+        return CALIBRATION_STORE.get('axis_importance', '')
 
 
     # ======================== SETTER ========================
@@ -717,16 +718,12 @@ class base_driver:
             log(f'seconds need to stay as a float or int! seconds being a string: {str_instance}', important=True, in_exception=True)
             raise TypeError(f'seconds need to stay as a float or int! seconds being a string: {str_instance}')
 
-        text = file_Manager.reader(self.mm_per_sec_file).split('\n')
-        file_mm = int(text[1].strip())
-        file_sec = float(text[2].strip())
+        _, file_mm, file_sec = CALIBRATION_STORE.get('mm_per_sec')
         actual_sec = sec if sec is not None else file_sec
         actual_mm = mm if mm is not None else file_mm
 
         self.mm_per_sec = actual_mm / actual_sec
-        file_Manager.writer(self.mm_per_sec_file, 'w', str(self.mm_per_sec))
-        file_Manager.writer(self.mm_per_sec_file, 'a', '\n' + str(actual_mm))
-        file_Manager.writer(self.mm_per_sec_file, 'a', '\n' + str(actual_sec))
+        CALIBRATION_STORE.set('mm_per_sec', [self.mm_per_sec, actual_mm, actual_sec])
 
     def set_MM_mm_per_sec(self, mm: int) -> None:
         """
@@ -1094,6 +1091,7 @@ class base_driver:
                 log(f'You can only calibrate "gyro_z", "gyro_y", "gyro_x", "accel_z", "accel_y" or "accel_x" and not "{arg}"', in_exception=True)
                 raise ValueError(f'You can only calibrate "gyro_z", "gyro_y", "gyro_x", "accel_z", "accel_y" or "accel_x" and not "{arg}"')
 
+        CALIBRATION_STORE.flush()  # every process starts with the same calibration file
         for calibration in calibrations:
             calibration.start()
 
@@ -1105,6 +1103,10 @@ class base_driver:
                     calibration.join()
                     calibration.terminate()
                     calibrations.remove(calibration)
+        CALIBRATION_STORE.reload()  # the processes saved their bias into the calibration file
+        for axis in ('gyro_x', 'gyro_y', 'gyro_z', 'accel_x', 'accel_y', 'accel_z'):
+            setattr(self, f'bias_{axis}', CALIBRATION_STORE.get(f'bias_{axis}'))
+        self._handle_standard_bias()
 
         if output:
             log('Every hardware calibration finished.')
@@ -1121,12 +1123,12 @@ class base_driver:
             currently_driving_for_threshold = True
             collected_gyro_value = 0
             last_bias = 0
+            sequence = IMU_SAMPLER.get_sequence()
 
             while currently_driving_for_threshold:
-                this_bias = self.get_current_standard_gyro()
-                if last_bias != this_bias:
-                    last_bias = this_bias
-                    collected_gyro_value += this_bias - self.standard_bias_gyro
+                IMU_SAMPLER.wait(sequence, 0.1)  # sleeps until the next sample instead of spinning next to the control loop
+                sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                collected_gyro_value += drift
 
         @ForceDriveableFunction
         def create_test(speed):
@@ -1180,12 +1182,12 @@ class base_driver:
             collected_gyro_value = 0
             currently_driving_for_threshold = True
             last_bias = 0
+            sequence = IMU_SAMPLER.get_sequence()
 
             while currently_driving_for_threshold:
-                this_bias = self.get_current_standard_gyro()
-                if last_bias != this_bias:
-                    last_bias = this_bias
-                    collected_gyro_value += this_bias - self.standard_bias_gyro
+                IMU_SAMPLER.wait(sequence, 0.1)  # sleeps until the next sample instead of spinning next to the control loop
+                sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                collected_gyro_value += drift
 
         @ForceDriveableFunction
         def create_test(increaser):
@@ -1790,16 +1792,13 @@ class Solarbotic_Wheels_two(base_driver):
         self.light_sensor_distance_sec = light_sensor_distance_timer.stop_timer()
         self.break_all_motors()
 
-        file_name = 'light_sensor_distance_sec.txt'
         try:
-            distance_sec = file_Manager.reader(file_name)
-            if distance_sec != '0':
+            if CALIBRATION_STORE.get('light_sensor_distance_sec'):
                 distance_sec = self.get_light_sensor_distance_sec()
                 avg = (distance_sec + self.light_sensor_distance_sec) / 2
-                msg = str(self.ds_speed) + ' ' + str(avg)
+                CALIBRATION_STORE.set('light_sensor_distance_sec', [self.ds_speed, avg])
             else:
-                msg = str(self.ds_speed) + ' ' + str(self.light_sensor_distance_sec)
-            file_Manager.writer(file_name, 'w', msg)
+                CALIBRATION_STORE.set('light_sensor_distance_sec', [self.ds_speed, self.light_sensor_distance_sec])
 
 
         except Exception as e:
@@ -1927,22 +1926,17 @@ class Solarbotic_Wheels_two(base_driver):
                 break
             elif instances[2].is_pressed():
                 hit = True
-                instances[1].drive(0)
-                instances[0].drive(speed)
+                WheelR.drive_together({instances[1]: 0, instances[0]: speed})
             elif instances[3].is_pressed():
                 hit = True
-                instances[0].drive(0)
-                instances[1].drive(speed)
+                WheelR.drive_together({instances[0]: 0, instances[1]: speed})
             else:
                 if threshold > theta > -threshold:
-                    instances[1].drive(speed)
-                    instances[0].drive(speed)
+                    WheelR.drive_together({instances[1]: speed, instances[0]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[1].drive(speed + adjuster)
-                    instances[0].drive(speed - adjuster)
+                    WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
                 else:
-                    instances[1].drive(speed - adjuster)
-                    instances[0].drive(speed + adjuster)
+                    WheelR.drive_together({instances[1]: speed - adjuster, instances[0]: speed + adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -1997,14 +1991,11 @@ class Solarbotic_Wheels_two(base_driver):
                 self.right_wheel.drive_mbw()
             else:
                 if threshold > theta > -threshold:
-                    self.right_wheel.drive(speed)
-                    self.left_wheel.drive(speed)
+                    WheelR.drive_together({self.right_wheel: speed, self.left_wheel: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    self.right_wheel.drive(speed - adjuster)
-                    self.left_wheel.drive(speed + adjuster)
+                    WheelR.drive_together({self.right_wheel: speed - adjuster, self.left_wheel: speed + adjuster})
                 else:
-                    self.left_wheel.drive(speed - adjuster)
-                    self.right_wheel.drive(speed + adjuster)
+                    WheelR.drive_together({self.left_wheel: speed - adjuster, self.right_wheel: speed + adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -2088,14 +2079,11 @@ class Solarbotic_Wheels_two(base_driver):
         if condition == "==":
             while (instance.current_value() == value) and (straight_timer.stop_timer(False) < millis):
                 if threshold > theta > -threshold:
-                    instances[0].drive(speed)
-                    instances[1].drive(speed)
+                    WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[0].drive(speed + adjuster)
-                    instances[1].drive(speed - adjuster)
+                    WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                 else:
-                    instances[1].drive(speed + adjuster)
-                    instances[0].drive(speed - adjuster)
+                    WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -2104,14 +2092,11 @@ class Solarbotic_Wheels_two(base_driver):
         elif condition == "!=":
             while (instance.current_value() != value) and (straight_timer.stop_timer(False) < millis):
                 if threshold > theta > -threshold:
-                    instances[0].drive(speed)
-                    instances[1].drive(speed)
+                    WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[0].drive(speed + adjuster)
-                    instances[1].drive(speed - adjuster)
+                    WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                 else:
-                    instances[1].drive(speed + adjuster)
-                    instances[0].drive(speed - adjuster)
+                    WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -2155,14 +2140,11 @@ class Solarbotic_Wheels_two(base_driver):
         if condition == 'let' or condition == '<=':  # let -> less or equal than
             while instance.current_value() <= value and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    instances[0].drive(speed)
-                    instances[1].drive(speed)
+                    WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[0].drive(speed + adjuster)
-                    instances[1].drive(speed - adjuster)
+                    WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                 else:
-                    instances[1].drive(speed + adjuster)
-                    instances[0].drive(speed - adjuster)
+                    WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -2172,14 +2154,11 @@ class Solarbotic_Wheels_two(base_driver):
         elif condition == 'het' or condition == '>=':  # het -> higher or equal than
             while instance.current_value() >= value and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    instances[0].drive(speed)
-                    instances[1].drive(speed)
+                    WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[0].drive(speed + adjuster)
-                    instances[1].drive(speed - adjuster)
+                    WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                 else:
-                    instances[1].drive(speed + adjuster)
-                    instances[0].drive(speed - adjuster)
+                    WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -2189,14 +2168,11 @@ class Solarbotic_Wheels_two(base_driver):
         elif condition == 'ht' or condition == '>':  # ht -> higher than
             while instance.current_value() > value and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    instances[0].drive(speed)
-                    instances[1].drive(speed)
+                    WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[0].drive(speed + adjuster)
-                    instances[1].drive(speed - adjuster)
+                    WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                 else:
-                    instances[1].drive(speed + adjuster)
-                    instances[0].drive(speed - adjuster)
+                    WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -2206,14 +2182,11 @@ class Solarbotic_Wheels_two(base_driver):
         elif condition == 'lt' or condition == '<':  # lt -> less than
             while instance.current_value() < value and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    instances[0].drive(speed)
-                    instances[1].drive(speed)
+                    WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[0].drive(speed + adjuster)
-                    instances[1].drive(speed - adjuster)
+                    WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                 else:
-                    instances[1].drive(speed + adjuster)
-                    instances[0].drive(speed - adjuster)
+                    WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -2446,8 +2419,7 @@ class Solarbotic_Wheels_two(base_driver):
                     direction_one(i-1, speed)
                     speed = self.ds_speed if positive else -self.ds_speed
 
-                    instances[0].drive(-speed)
-                    instances[1].drive(-speed)
+                    WheelR.drive_together({instances[0]: -speed, instances[1]: -speed})
                     time.sleep(degree_try_time/divisor)
                 break
 
@@ -2490,11 +2462,9 @@ class Solarbotic_Wheels_two(base_driver):
         line_turner_timer.start_timer_millis()
         while True:
             if direction[0] == 'left':
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed)
+                WheelR.drive_together({wheels[0]: speed, wheels[1]: -speed})
             else:
-                wheels[0].drive(-speed)
-                wheels[1].drive(speed)
+                WheelR.drive_together({wheels[0]: -speed, wheels[1]: speed})
 
             if line_turner_timer.stop_timer(False) > max_duration:
                 self.turn_degrees_condition_analog(direction[1], light_sensor, '<', light_sensor.get_value_black_bias(), speed=speed, millis=int(self.ONEEIGHTY_DEGREES_SECS*1000*2)+max_duration)  # Since you are somewhere more on one side, but you did not find any line in (max_duration) time, you need to make a full circle to look for any line. If there is no line at all (after 360 degrees) you need to turn for (max_duration) time again, to face the direction in which you looked beforehand
@@ -2603,6 +2573,7 @@ class Solarbotic_Wheels_two(base_driver):
         theta = 0.0
         threshold = 10
         last_bias = 0
+        sequence = IMU_SAMPLER.get_sequence()
         adjuster = speed//self.adjuster
         instances = self.left_wheel, self.right_wheel
 
@@ -2612,19 +2583,14 @@ class Solarbotic_Wheels_two(base_driver):
         straight_timer.start_timer_millis()
         while straight_timer.stop_timer(False) < millis:
             if threshold > theta > -threshold:
-                instances[0].drive(speed)
-                instances[1].drive(speed)
+                WheelR.drive_together({instances[0]: speed, instances[1]: speed})
             elif self.check_threshold_strength(theta, threshold):
-                instances[0].drive(speed + adjuster)
-                instances[1].drive(speed - adjuster)
+                WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
             else:
-                instances[0].drive(speed - adjuster)
-                instances[1].drive(speed + adjuster)
+                WheelR.drive_together({instances[0]: speed - adjuster, instances[1]: speed + adjuster})
 
-            this_bias = self.get_current_standard_gyro()
-            if last_bias != this_bias:
-                last_bias = this_bias
-                theta += this_bias - self.standard_bias_gyro
+            sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+            theta += drift
         self.break_all_motors()
 
     @DriveableFunction
@@ -2789,6 +2755,7 @@ class Solarbotic_Wheels_two(base_driver):
         theta = 0.0
         adjuster = speed//self.adjuster
         last_bias = 0
+        sequence = IMU_SAMPLER.get_sequence()
         threshold = 10
         instances = self.left_wheel, self.right_wheel
 
@@ -2799,24 +2766,18 @@ class Solarbotic_Wheels_two(base_driver):
             while self.distance_sensor.current_value() > 1800 and (
                     not self.button_bl.is_pressed() and not self.button_br.is_pressed()):
                 if threshold > theta > -threshold:
-                    instances[0].drive(-speed)
-                    instances[1].drive(-speed)
+                    WheelR.drive_together({instances[0]: -speed, instances[1]: -speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    instances[0].drive(-speed + adjuster)
-                    instances[1].drive(-speed - adjuster)
+                    WheelR.drive_together({instances[0]: -speed + adjuster, instances[1]: -speed - adjuster})
                 else:
-                    instances[1].drive(-speed + adjuster)
-                    instances[0].drive(-speed - adjuster)
+                    WheelR.drive_together({instances[1]: -speed + adjuster, instances[0]: -speed - adjuster})
 
-                this_bias = self.get_current_standard_gyro()
-                if last_bias != this_bias:
-                    last_bias = this_bias
-                    theta += this_bias - self.standard_bias_gyro
+                sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                theta += drift
 
 
             if theta != 0.0:
-                self.left_wheel.drive(speed)
-                self.right_wheel.drive(speed)
+                WheelR.drive_together({self.left_wheel: speed, self.right_wheel: speed})
                 k.msleep(20)
 
         next_value = self.distance_sensor.get_estimated_mm_value(mm_to_object)
@@ -2846,26 +2807,23 @@ class Solarbotic_Wheels_two(base_driver):
 
         if speed > 0:
             self.drive_straight(500, speed)
+            sequence = IMU_SAMPLER.get_sequence()  # drive_straight() steered on its own in between
             if self.distance_sensor.current_value() < next_value:
                 threading.Thread(target=distance_stopper, args=(True,), daemon=True).start()
                 while not self.isClose:
                     if threshold > theta > -threshold:
-                        instances[0].drive(speed)
-                        instances[1].drive(speed)
+                        WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                     elif self.check_threshold_strength(theta, threshold):
-                        instances[0].drive(speed + adjuster)
-                        instances[1].drive(speed - adjuster)
+                        WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                     else:
-                        instances[1].drive(speed + adjuster)
-                        instances[0].drive(speed - adjuster)
+                        WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
-                    this_bias = self.get_current_standard_gyro()
-                    if last_bias != this_bias:
-                        last_bias = this_bias
-                        theta += this_bias - self.standard_bias_gyro
+                    sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                    theta += drift
                 self.break_all_motors()
             else:
                 self.drive_straight(500, -speed)
+                sequence = IMU_SAMPLER.get_sequence()  # drive_straight() steered on its own in between
 
             if mm_to_object < self.distance_sensor.get_mm()[0]:
                 counter = self.distance_sensor.get_mm()[0]
@@ -2873,38 +2831,28 @@ class Solarbotic_Wheels_two(base_driver):
                 while counter > mm_to_object:
                     counter -= (2 * mult)
                     if threshold > theta > -threshold:
-                        instances[0].drive(speed)
-                        instances[1].drive(speed)
+                        WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                     elif self.check_threshold_strength(theta, threshold):
-                        instances[0].drive(speed + adjuster)
-                        instances[1].drive(speed - adjuster)
+                        WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                     else:
-                        instances[1].drive(speed + adjuster)
-                        instances[0].drive(speed - adjuster)
+                        WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
-                    this_bias = self.get_current_standard_gyro()
-                    if last_bias != this_bias:
-                        last_bias = this_bias
-                        theta += this_bias - self.standard_bias_gyro
+                    sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                    theta += drift
         else:
             if self.distance_sensor.current_value() > next_value:
                 threading.Thread(target=distance_stopper, args=(False,), daemon=True).start()
 
                 while not self.isClose:
                     if threshold > theta > -threshold:
-                        instances[0].drive(speed)
-                        instances[1].drive(speed)
+                        WheelR.drive_together({instances[0]: speed, instances[1]: speed})
                     elif self.check_threshold_strength(theta, threshold):
-                        instances[0].drive(speed + adjuster)
-                        instances[1].drive(speed - adjuster)
+                        WheelR.drive_together({instances[0]: speed + adjuster, instances[1]: speed - adjuster})
                     else:
-                        instances[1].drive(speed + adjuster)
-                        instances[0].drive(speed - adjuster)
+                        WheelR.drive_together({instances[1]: speed + adjuster, instances[0]: speed - adjuster})
 
-                    this_bias = self.get_current_standard_gyro()
-                    if last_bias != this_bias:
-                        last_bias = this_bias
-                        theta += this_bias - self.standard_bias_gyro
+                    sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                    theta += drift
         self.break_all_motors()
 
     @DriveableFunction
@@ -3158,16 +3106,14 @@ class Solarbotic_Wheels_two(base_driver):
         if condition == "!=":
             while turn_timer.stop_timer(False) < millis and instance.current_value() != value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value != value:
                 found = True
 
         elif condition == "==":
             while turn_timer.stop_timer(False) < millis and instance.current_value() == value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value == value:
                 found = True
         else:
@@ -3222,43 +3168,37 @@ class Solarbotic_Wheels_two(base_driver):
         if condition == ">=" or condition == "heq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() >= value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value >= value:
                 found = True
         elif condition == "<=" or condition == "leq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() <= value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value <= value:
                 found = True
         elif condition == "<" or condition == "lt":
             while turn_timer.stop_timer(False) < millis and instance.current_value() < value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value < value:
                 found = True
         elif condition == ">" or condition == "ht":
             while turn_timer.stop_timer(False) < millis and instance.current_value() > value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value > value:
                 found = True
         elif condition == "==" or condition == "eq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() == value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value == value:
                 found = True
         elif condition == "!=" or condition == "neq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() != value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(-speed)
+                WheelR.drive_together({first_wheel: speed, second_wheel: -speed})
             if last_value != value:
                 found = True
         else:
@@ -3754,16 +3694,13 @@ class Mecanum_Wheels_four(base_driver):
         self.light_sensor_distance_sec = light_sensor_distance_timer.stop_timer()
         self.break_all_motors()
 
-        file_name = 'light_sensor_distance_sec.txt'
         try:
-            distance_sec = file_Manager.reader(file_name)
-            if distance_sec != '0':
+            if CALIBRATION_STORE.get('light_sensor_distance_sec'):
                 distance_sec = self.get_light_sensor_distance_sec()
                 avg = (distance_sec + self.light_sensor_distance_sec) / 2
-                msg = str(self.ds_speed) + ' ' + str(avg)
+                CALIBRATION_STORE.set('light_sensor_distance_sec', [self.ds_speed, avg])
             else:
-                msg = str(self.ds_speed) + ' ' + str(self.light_sensor_distance_sec)
-            file_Manager.writer(file_name, 'w', msg)
+                CALIBRATION_STORE.set('light_sensor_distance_sec', [self.ds_speed, self.light_sensor_distance_sec])
 
 
         except Exception as e:
@@ -3928,20 +3865,26 @@ class Mecanum_Wheels_four(base_driver):
         while side_timer.stop_timer(False) < millis:
             if straight_timer.stop_timer(False) > 150:
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(straight_speed)
-                    wheels[1].drive(straight_speed)
-                    wheels[2].drive(straight_speed)
-                    wheels[3].drive(straight_speed)
+                    WheelR.drive_together({
+                        wheels[0]: straight_speed,
+                        wheels[1]: straight_speed,
+                        wheels[2]: straight_speed,
+                        wheels[3]: straight_speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(lower_straight_speed)
-                    wheels[1].drive(higher_straight_speed)
-                    wheels[2].drive(lower_straight_speed)
-                    wheels[3].drive(higher_straight_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_straight_speed,
+                        wheels[1]: higher_straight_speed,
+                        wheels[2]: lower_straight_speed,
+                        wheels[3]: higher_straight_speed
+                    })
                 else:
-                    wheels[0].drive(higher_straight_speed)
-                    wheels[1].drive(lower_straight_speed)
-                    wheels[2].drive(higher_straight_speed)
-                    wheels[3].drive(lower_straight_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_straight_speed,
+                        wheels[1]: lower_straight_speed,
+                        wheels[2]: higher_straight_speed,
+                        wheels[3]: lower_straight_speed
+                    })
                 straight_timer.start_timer_millis()
 
             this_bias = self.get_current_standard_gyro()
@@ -3950,20 +3893,26 @@ class Mecanum_Wheels_four(base_driver):
                 theta_side += this_bias - self.standard_bias_gyro
 
             if threshold > theta_side > -threshold:
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed)
-                wheels[2].drive(-speed)
-                wheels[3].drive(speed)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: -speed,
+                    wheels[2]: -speed,
+                    wheels[3]: speed
+                })
             elif self.check_threshold_strength(theta_side, threshold):
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed + adjuster)
-                wheels[2].drive(-speed)
-                wheels[3].drive(speed + adjuster)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: -speed + adjuster,
+                    wheels[2]: -speed,
+                    wheels[3]: speed + adjuster
+                })
             else:
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed - adjuster)
-                wheels[2].drive(-speed)
-                wheels[3].drive(speed - adjuster)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: -speed - adjuster,
+                    wheels[2]: -speed,
+                    wheels[3]: speed - adjuster
+                })
 
             this_bias = self.get_current_standard_gyro()
             if last_bias != this_bias:
@@ -3994,6 +3943,7 @@ class Mecanum_Wheels_four(base_driver):
         theta = 0
         threshold = 10
         last_bias = 0
+        sequence = IMU_SAMPLER.get_sequence()
         counter_steer = speed//self.adjuster
         lower_speed = abs(speed) - counter_steer
         higher_speed = abs(speed) + counter_steer
@@ -4006,24 +3956,28 @@ class Mecanum_Wheels_four(base_driver):
         straight_timer.start_timer_millis()
         while straight_timer.stop_timer(False) < millis:
             if threshold > theta > -threshold:
-                wheels[0].drive(speed)
-                wheels[1].drive(speed)
-                wheels[2].drive(speed)
-                wheels[3].drive(speed)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: speed,
+                    wheels[2]: speed,
+                    wheels[3]: speed
+                })
             elif self.check_threshold_strength(theta, threshold):
-                wheels[0].drive(higher_speed)
-                wheels[1].drive(lower_speed)
-                wheels[2].drive(higher_speed)
-                wheels[3].drive(lower_speed)
+                WheelR.drive_together({
+                    wheels[0]: higher_speed,
+                    wheels[1]: lower_speed,
+                    wheels[2]: higher_speed,
+                    wheels[3]: lower_speed
+                })
             else:
-                wheels[0].drive(lower_speed)
-                wheels[1].drive(higher_speed)
-                wheels[2].drive(lower_speed)
-                wheels[3].drive(higher_speed)
-            this_bias = self.get_current_standard_gyro()
-            if last_bias != this_bias:
-                last_bias = this_bias
-                theta += this_bias - self.standard_bias_gyro
+                WheelR.drive_together({
+                    wheels[0]: lower_speed,
+                    wheels[1]: higher_speed,
+                    wheels[2]: lower_speed,
+                    wheels[3]: higher_speed
+                })
+            sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+            theta += drift
         self.break_all_motors()
 
     @DriveableFunction
@@ -4080,14 +4034,11 @@ class Mecanum_Wheels_four(base_driver):
         diagonal_timer.start_timer_millis()
         while diagonal_timer.stop_timer(False) < millis:
             if threshold > theta > -threshold:
-                wheels[0].drive(speed)
-                wheels[1].drive(speed)
+                WheelR.drive_together({wheels[0]: speed, wheels[1]: speed})
             elif self.check_threshold_strength(theta, threshold):
-                wheels[1].drive(speed)
-                wheels[0].drive(speed - adjuster)
+                WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
             else:
-                wheels[1].drive(speed)
-                wheels[0].drive(speed - adjuster)
+                WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
 
             this_bias = self.get_current_standard_gyro()
             if last_bias != this_bias:
@@ -4124,12 +4075,10 @@ class Mecanum_Wheels_four(base_driver):
         turn_far_timer.start_timer_sec()
         if drift_side == 'right':
             while turn_far_timer.stop_timer(False) < 2 * value:
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed)
+                WheelR.drive_together({wheels[0]: speed, wheels[1]: -speed})
         else:  # direction_side == 'left':
             while turn_far_timer.stop_timer(False) < 2 * value:
-                wheels[0].drive(-speed)
-                wheels[1].drive(speed)
+                WheelR.drive_together({wheels[0]: -speed, wheels[1]: speed})
         self.break_all_motors()
 
 
@@ -4187,12 +4136,10 @@ class Mecanum_Wheels_four(base_driver):
         turn_far_timer.start_timer_sec()
         if direction_side == 'right':
             while turn_far_timer.stop_timer(False) < 2 * value:
-                self.fl_wheel.drive(speed)
-                self.bl_wheel.drive(speed)
+                WheelR.drive_together({self.fl_wheel: speed, self.bl_wheel: speed})
         else: # direction_side == 'left':
             while turn_far_timer.stop_timer(False) < 2 * value:
-                self.fr_wheel.drive(speed)
-                self.br_wheel.drive(speed)
+                WheelR.drive_together({self.fr_wheel: speed, self.br_wheel: speed})
         self.break_all_motors()
 
     @DriveableFunction
@@ -4271,12 +4218,10 @@ class Mecanum_Wheels_four(base_driver):
 
         if condition == "!=":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() != value:
-                 wheels_to_drive[0].drive(speed)
-                 wheels_to_drive[1].drive(speed)
+                 WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         elif condition == "==":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() == value:
-                wheels_to_drive[0].drive(speed)
-                wheels_to_drive[1].drive(speed)
+                WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         else:
             log('The "condition" parameter can only be something like "==; !="', in_exception=True)
             raise ValueError('The "condition" parameter can only be something like "==; !="')
@@ -4317,28 +4262,22 @@ class Mecanum_Wheels_four(base_driver):
 
         if condition == ">=" or condition == "heq":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() >= value:
-                wheels_to_drive[0].drive(speed)
-                wheels_to_drive[1].drive(speed)
+                WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         elif condition == "<=" or condition == "leq":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() <= value:
-                wheels_to_drive[0].drive(speed)
-                wheels_to_drive[1].drive(speed)
+                WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         elif condition == "<" or condition == "lt":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() < value:
-                wheels_to_drive[0].drive(speed)
-                wheels_to_drive[1].drive(speed)
+                WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         elif condition == ">" or condition == "ht":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() > value:
-                wheels_to_drive[0].drive(speed)
-                wheels_to_drive[1].drive(speed)
+                WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         elif condition == "==" or condition == "eq":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() == value:
-                wheels_to_drive[0].drive(speed)
-                wheels_to_drive[1].drive(speed)
+                WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         elif condition == "!=" or condition == "neq":
             while turn_wheel_timer.stop_timer(False) < millis and instance.current_value() != value:
-                wheels_to_drive[0].drive(speed)
-                wheels_to_drive[1].drive(speed)
+                WheelR.drive_together({wheels_to_drive[0]: speed, wheels_to_drive[1]: speed})
         else:
             log('The "condition" parameter can only be something like ">; <; >=; <=; ==; !="', in_exception=True)
             raise ValueError('The "condition" parameter can only be something like ">; <; >=; <=; ==; !="')
@@ -4385,20 +4324,24 @@ class Mecanum_Wheels_four(base_driver):
         if condition == "!=":
             while turn_timer.stop_timer(False) < millis and instance.current_value() != value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value != value:
                 found = True
 
         elif condition == "==":
             while turn_timer.stop_timer(False) < millis and instance.current_value() == value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value == value:
                 found = True
         else:
@@ -4456,55 +4399,67 @@ class Mecanum_Wheels_four(base_driver):
         if condition == ">=" or condition == "heq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() >= value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value >= value:
                 found = True
         elif condition == "<=" or condition == "leq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() <= value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value <= value:
                 found = True
         elif condition == "<" or condition == "lt":
             while turn_timer.stop_timer(False) < millis and instance.current_value() < value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value < value:
                 found = True
         elif condition == ">" or condition == "ht":
             while turn_timer.stop_timer(False) < millis and instance.current_value() > value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value > value:
                 found = True
         elif condition == "==" or condition == "eq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() == value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value == value:
                 found = True
         elif condition == "!=" or condition == "neq":
             while turn_timer.stop_timer(False) < millis and instance.current_value() != value:
                 last_value = instance.current_value()
-                first_wheel.drive(speed)
-                second_wheel.drive(speed)
-                third_wheel.drive(-speed)
-                fourth_wheel.drive(-speed)
+                WheelR.drive_together({
+                    first_wheel: speed,
+                    second_wheel: speed,
+                    third_wheel: -speed,
+                    fourth_wheel: -speed
+                })
             if last_value != value:
                 found = True
         else:
@@ -4596,20 +4551,26 @@ class Mecanum_Wheels_four(base_driver):
         while not self.isClose and side_timer.stop_timer(False) < millis:
             if straight_timer.stop_timer(False) > 150:
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(straight_speed)
-                    wheels[1].drive(straight_speed)
-                    wheels[2].drive(straight_speed)
-                    wheels[3].drive(straight_speed)
+                    WheelR.drive_together({
+                        wheels[0]: straight_speed,
+                        wheels[1]: straight_speed,
+                        wheels[2]: straight_speed,
+                        wheels[3]: straight_speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(lower_straight_speed)
-                    wheels[1].drive(higher_straight_speed)
-                    wheels[2].drive(lower_straight_speed)
-                    wheels[3].drive(higher_straight_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_straight_speed,
+                        wheels[1]: higher_straight_speed,
+                        wheels[2]: lower_straight_speed,
+                        wheels[3]: higher_straight_speed
+                    })
                 else:
-                    wheels[0].drive(higher_straight_speed)
-                    wheels[1].drive(lower_straight_speed)
-                    wheels[2].drive(higher_straight_speed)
-                    wheels[3].drive(lower_straight_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_straight_speed,
+                        wheels[1]: lower_straight_speed,
+                        wheels[2]: higher_straight_speed,
+                        wheels[3]: lower_straight_speed
+                    })
                 straight_timer.start_timer_millis()
 
             this_bias = self.get_current_standard_gyro()
@@ -4618,20 +4579,26 @@ class Mecanum_Wheels_four(base_driver):
                 theta_side += this_bias - self.standard_bias_gyro
 
             if threshold > theta_side > -threshold:
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed)
-                wheels[2].drive(-speed)
-                wheels[3].drive(speed)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: -speed,
+                    wheels[2]: -speed,
+                    wheels[3]: speed
+                })
             elif self.check_threshold_strength(theta_side, threshold):
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed + adjuster)
-                wheels[2].drive(-speed)
-                wheels[3].drive(speed + adjuster)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: -speed + adjuster,
+                    wheels[2]: -speed,
+                    wheels[3]: speed + adjuster
+                })
             else:
-                wheels[0].drive(speed)
-                wheels[1].drive(-speed - adjuster)
-                wheels[2].drive(-speed)
-                wheels[3].drive(speed - adjuster)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: -speed - adjuster,
+                    wheels[2]: -speed,
+                    wheels[3]: speed - adjuster
+                })
 
             this_bias = self.get_current_standard_gyro()
             if last_bias != this_bias:
@@ -4674,6 +4641,7 @@ class Mecanum_Wheels_four(base_driver):
         lower_speed = -(abs(speed) - adjuster)
         higher_speed = -(abs(speed) + adjuster)
         last_bias = 0
+        sequence = IMU_SAMPLER.get_sequence()
         threshold = 10
         wheels = self.fl_wheel, self.fr_wheel, self.bl_wheel, self.br_wheel
 
@@ -4688,31 +4656,37 @@ class Mecanum_Wheels_four(base_driver):
             while self.distance_sensor.current_value() > 1800 and (
                     not self.button_bl.is_pressed() and not self.button_br.is_pressed()):  # this is because if it is already too close, it will back out a little bit to get the best result
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
-                    wheels[2].drive(speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: speed,
+                        wheels[2]: speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[0].drive(higher_speed)
-                    wheels[1].drive(lower_speed)
-                    wheels[2].drive(higher_speed)
-                    wheels[3].drive(lower_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_speed,
+                        wheels[1]: lower_speed,
+                        wheels[2]: higher_speed,
+                        wheels[3]: lower_speed
+                    })
                 else:
-                    wheels[0].drive(lower_speed)
-                    wheels[1].drive(higher_speed)
-                    wheels[2].drive(lower_speed)
-                    wheels[3].drive(higher_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_speed,
+                        wheels[1]: higher_speed,
+                        wheels[2]: lower_speed,
+                        wheels[3]: higher_speed
+                    })
 
-                this_bias = self.get_current_standard_gyro()
-                if last_bias != this_bias:
-                    last_bias = this_bias
-                    theta += this_bias - self.standard_bias_gyro
+                sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                theta += drift
 
             if theta != 0.0:
-                wheels[0].drive(speed)
-                wheels[1].drive(speed)
-                wheels[2].drive(speed)
-                wheels[3].drive(speed)
+                WheelR.drive_together({
+                    wheels[0]: speed,
+                    wheels[1]: speed,
+                    wheels[2]: speed,
+                    wheels[3]: speed
+                })
                 k.msleep(20)
             self.break_all_motors()
 
@@ -4744,32 +4718,38 @@ class Mecanum_Wheels_four(base_driver):
 
         if speed > 0:
             self.drive_straight(500, speed)
+            sequence = IMU_SAMPLER.get_sequence()  # drive_straight() steered on its own in between
             if self.distance_sensor.current_value() < next_value:
                 threading.Thread(target=distance_stopper, args=(True,), daemon=True).start()
                 while not self.isClose:
                     if threshold > theta > -threshold:
-                        wheels[0].drive(speed)
-                        wheels[1].drive(speed)
-                        wheels[2].drive(speed)
-                        wheels[3].drive(speed)
+                        WheelR.drive_together({
+                            wheels[0]: speed,
+                            wheels[1]: speed,
+                            wheels[2]: speed,
+                            wheels[3]: speed
+                        })
                     elif self.check_threshold_strength(theta, threshold):
-                        wheels[0].drive(higher_speed)
-                        wheels[1].drive(lower_speed)
-                        wheels[2].drive(higher_speed)
-                        wheels[3].drive(lower_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_speed,
+                            wheels[1]: lower_speed,
+                            wheels[2]: higher_speed,
+                            wheels[3]: lower_speed
+                        })
                     else:
-                        wheels[0].drive(lower_speed)
-                        wheels[1].drive(higher_speed)
-                        wheels[2].drive(lower_speed)
-                        wheels[3].drive(higher_speed)
-
-                    this_bias = self.get_current_standard_gyro()
-                    if last_bias != this_bias:
-                        last_bias = this_bias
-                        theta += this_bias - self.standard_bias_gyro
+                        WheelR.drive_together({
+                            wheels[0]: lower_speed,
+                            wheels[1]: higher_speed,
+                            wheels[2]: lower_speed,
+                            wheels[3]: higher_speed
+                        })
+
+                    sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                    theta += drift
                 self.break_all_motors()
             else:
                 self.drive_straight(500, -speed)
+                sequence = IMU_SAMPLER.get_sequence()  # drive_straight() steered on its own in between
 
             if mm_to_object < self.distance_sensor.get_mm()[0]:
                 counter = self.distance_sensor.get_mm()[0]
@@ -4777,50 +4757,58 @@ class Mecanum_Wheels_four(base_driver):
                 while counter > mm_to_object:
                     counter -= (2 * mult)
                     if threshold > theta > -threshold:
-                        wheels[0].drive(speed)
-                        wheels[1].drive(speed)
-                        wheels[2].drive(speed)
-                        wheels[3].drive(speed)
+                        WheelR.drive_together({
+                            wheels[0]: speed,
+                            wheels[1]: speed,
+                            wheels[2]: speed,
+                            wheels[3]: speed
+                        })
                     elif self.check_threshold_strength(theta, threshold):
-                        wheels[0].drive(higher_speed)
-                        wheels[1].drive(lower_speed)
-                        wheels[2].drive(higher_speed)
-                        wheels[3].drive(lower_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_speed,
+                            wheels[1]: lower_speed,
+                            wheels[2]: higher_speed,
+                            wheels[3]: lower_speed
+                        })
                     else:
-                        wheels[0].drive(lower_speed)
-                        wheels[1].drive(higher_speed)
-                        wheels[2].drive(lower_speed)
-                        wheels[3].drive(higher_speed)
-
-                    this_bias = self.get_current_standard_gyro()
-                    if last_bias != this_bias:
-                        last_bias = this_bias
-                        theta += this_bias - self.standard_bias_gyro
+                        WheelR.drive_together({
+                            wheels[0]: lower_speed,
+                            wheels[1]: higher_speed,
+                            wheels[2]: lower_speed,
+                            wheels[3]: higher_speed
+                        })
+
+                    sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                    theta += drift
         else:
             if self.distance_sensor.current_value() > next_value:
                 threading.Thread(target=distance_stopper, args=(False,), daemon=True).start()
 
                 while not self.isClose:
                     if threshold > theta > -threshold:
-                        wheels[0].drive(speed)
-                        wheels[1].drive(speed)
-                        wheels[2].drive(speed)
-                        wheels[3].drive(speed)
+                        WheelR.drive_together({
+                            wheels[0]: speed,
+                            wheels[1]: speed,
+                            wheels[2]: speed,
+                            wheels[3]: speed
+                        })
                     elif self.check_threshold_strength(theta, threshold):
-                        wheels[0].drive(higher_speed)
-                        wheels[1].drive(lower_speed)
-                        wheels[2].drive(higher_speed)
-                        wheels[3].drive(lower_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_speed,
+                            wheels[1]: lower_speed,
+                            wheels[2]: higher_speed,
+                            wheels[3]: lower_speed
+                        })
                     else:
-                        wheels[0].drive(lower_speed)
-                        wheels[1].drive(higher_speed)
-                        wheels[2].drive(lower_speed)
-                        wheels[3].drive(higher_speed)
-
-                    this_bias = self.get_current_standard_gyro()
-                    if last_bias != this_bias:
-                        last_bias = this_bias
-                        theta += this_bias - self.standard_bias_gyro
+                        WheelR.drive_together({
+                            wheels[0]: lower_speed,
+                            wheels[1]: higher_speed,
+                            wheels[2]: lower_speed,
+                            wheels[3]: higher_speed
+                        })
+
+                    sequence, last_bias, drift = self._collect_drift(sequence, last_bias)
+                    theta += drift
         self.break_all_motors()
 
     @DriveableFunction
@@ -4999,14 +4987,11 @@ class Mecanum_Wheels_four(base_driver):
         if condition == 'let' or condition == '<=':  # let -> less or equal than
             while instance.current_value() <= value and diagonal_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
+                    WheelR.drive_together({wheels[0]: speed, wheels[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
                 else:
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5015,14 +5000,11 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == 'het' or condition == '>=':  # het -> higher or equal than
             while instance.current_value() >= value and diagonal_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
+                    WheelR.drive_together({wheels[0]: speed, wheels[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
                 else:
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5033,14 +5015,11 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == 'ht' or condition == '>':  # ht -> higher than
             while instance.current_value() > value and diagonal_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
+                    WheelR.drive_together({wheels[0]: speed, wheels[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
                 else:
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5051,14 +5030,11 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == 'lt' or condition == '<':  # lt -> less than
             while instance.current_value() < value and diagonal_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
+                    WheelR.drive_together({wheels[0]: speed, wheels[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
                 else:
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5129,14 +5105,11 @@ class Mecanum_Wheels_four(base_driver):
         if condition == '!=':
             while instance.current_value() != value and diagonal_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
+                    WheelR.drive_together({wheels[0]: speed, wheels[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
                 else:
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5146,14 +5119,11 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == '==':
             while instance.current_value() == value and diagonal_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
+                    WheelR.drive_together({wheels[0]: speed, wheels[1]: speed})
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
                 else:
-                    wheels[1].drive(speed)
-                    wheels[0].drive(speed - adjuster)
+                    WheelR.drive_together({wheels[1]: speed, wheels[0]: speed - adjuster})
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5216,20 +5186,26 @@ class Mecanum_Wheels_four(base_driver):
             while (instance.current_value() <= value) and (side_timer.stop_timer(False) < millis):
                 if straight_timer.stop_timer(False) > 150:
                     if threshold > theta_side > -threshold:
-                        wheels[0].drive(straight_speed)
-                        wheels[1].drive(straight_speed)
-                        wheels[2].drive(straight_speed)
-                        wheels[3].drive(straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: straight_speed,
+                            wheels[1]: straight_speed,
+                            wheels[2]: straight_speed,
+                            wheels[3]: straight_speed
+                        })
                     elif self.check_threshold_strength(theta_side, threshold):
-                        wheels[0].drive(lower_straight_speed)
-                        wheels[1].drive(higher_straight_speed)
-                        wheels[2].drive(lower_straight_speed)
-                        wheels[3].drive(higher_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: lower_straight_speed,
+                            wheels[1]: higher_straight_speed,
+                            wheels[2]: lower_straight_speed,
+                            wheels[3]: higher_straight_speed
+                        })
                     else:
-                        wheels[0].drive(higher_straight_speed)
-                        wheels[1].drive(lower_straight_speed)
-                        wheels[2].drive(higher_straight_speed)
-                        wheels[3].drive(lower_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_straight_speed,
+                            wheels[1]: lower_straight_speed,
+                            wheels[2]: higher_straight_speed,
+                            wheels[3]: lower_straight_speed
+                        })
                     straight_timer.start_timer_millis()
 
                 this_bias = self.get_current_standard_gyro()
@@ -5238,20 +5214,26 @@ class Mecanum_Wheels_four(base_driver):
                     theta_side += this_bias - self.standard_bias_gyro
 
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed,
+                        wheels[2]: -speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed + adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed + adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed + adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed + adjuster
+                    })
                 else:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed - adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed - adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed - adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed - adjuster
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5263,20 +5245,26 @@ class Mecanum_Wheels_four(base_driver):
             while (instance.current_value() >= value) and (side_timer.stop_timer(False) < millis):
                 if straight_timer.stop_timer(False) > 150:
                     if threshold > theta_side > -threshold:
-                        wheels[0].drive(straight_speed)
-                        wheels[1].drive(straight_speed)
-                        wheels[2].drive(straight_speed)
-                        wheels[3].drive(straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: straight_speed,
+                            wheels[1]: straight_speed,
+                            wheels[2]: straight_speed,
+                            wheels[3]: straight_speed
+                        })
                     elif self.check_threshold_strength(theta_side, threshold):
-                        wheels[0].drive(lower_straight_speed)
-                        wheels[1].drive(higher_straight_speed)
-                        wheels[2].drive(lower_straight_speed)
-                        wheels[3].drive(higher_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: lower_straight_speed,
+                            wheels[1]: higher_straight_speed,
+                            wheels[2]: lower_straight_speed,
+                            wheels[3]: higher_straight_speed
+                        })
                     else:
-                        wheels[0].drive(higher_straight_speed)
-                        wheels[1].drive(lower_straight_speed)
-                        wheels[2].drive(higher_straight_speed)
-                        wheels[3].drive(lower_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_straight_speed,
+                            wheels[1]: lower_straight_speed,
+                            wheels[2]: higher_straight_speed,
+                            wheels[3]: lower_straight_speed
+                        })
                     straight_timer.start_timer_millis()
 
                 this_bias = self.get_current_standard_gyro()
@@ -5285,20 +5273,26 @@ class Mecanum_Wheels_four(base_driver):
                     theta_side += this_bias - self.standard_bias_gyro
 
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed,
+                        wheels[2]: -speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed + adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed + adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed + adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed + adjuster
+                    })
                 else:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed - adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed - adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed - adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed - adjuster
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5310,20 +5304,26 @@ class Mecanum_Wheels_four(base_driver):
             while (instance.current_value() > value) and (side_timer.stop_timer(False) < millis):
                 if straight_timer.stop_timer(False) > 150:
                     if threshold > theta_side > -threshold:
-                        wheels[0].drive(straight_speed)
-                        wheels[1].drive(straight_speed)
-                        wheels[2].drive(straight_speed)
-                        wheels[3].drive(straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: straight_speed,
+                            wheels[1]: straight_speed,
+                            wheels[2]: straight_speed,
+                            wheels[3]: straight_speed
+                        })
                     elif self.check_threshold_strength(theta_side, threshold):
-                        wheels[0].drive(lower_straight_speed)
-                        wheels[1].drive(higher_straight_speed)
-                        wheels[2].drive(lower_straight_speed)
-                        wheels[3].drive(higher_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: lower_straight_speed,
+                            wheels[1]: higher_straight_speed,
+                            wheels[2]: lower_straight_speed,
+                            wheels[3]: higher_straight_speed
+                        })
                     else:
-                        wheels[0].drive(higher_straight_speed)
-                        wheels[1].drive(lower_straight_speed)
-                        wheels[2].drive(higher_straight_speed)
-                        wheels[3].drive(lower_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_straight_speed,
+                            wheels[1]: lower_straight_speed,
+                            wheels[2]: higher_straight_speed,
+                            wheels[3]: lower_straight_speed
+                        })
                     straight_timer.start_timer_millis()
 
                 this_bias = self.get_current_standard_gyro()
@@ -5332,20 +5332,26 @@ class Mecanum_Wheels_four(base_driver):
                     theta_side += this_bias - self.standard_bias_gyro
 
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed,
+                        wheels[2]: -speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed + adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed + adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed + adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed + adjuster
+                    })
                 else:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed - adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed - adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed - adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed - adjuster
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5357,20 +5363,26 @@ class Mecanum_Wheels_four(base_driver):
             while (instance.current_value() < value) and (side_timer.stop_timer(False) < millis):
                 if straight_timer.stop_timer(False) > 150:
                     if threshold > theta_side > -threshold:
-                        wheels[0].drive(straight_speed)
-                        wheels[1].drive(straight_speed)
-                        wheels[2].drive(straight_speed)
-                        wheels[3].drive(straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: straight_speed,
+                            wheels[1]: straight_speed,
+                            wheels[2]: straight_speed,
+                            wheels[3]: straight_speed
+                        })
                     elif self.check_threshold_strength(theta_side, threshold):
-                        wheels[0].drive(lower_straight_speed)
-                        wheels[1].drive(higher_straight_speed)
-                        wheels[2].drive(lower_straight_speed)
-                        wheels[3].drive(higher_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: lower_straight_speed,
+                            wheels[1]: higher_straight_speed,
+                            wheels[2]: lower_straight_speed,
+                            wheels[3]: higher_straight_speed
+                        })
                     else:
-                        wheels[0].drive(higher_straight_speed)
-                        wheels[1].drive(lower_straight_speed)
-                        wheels[2].drive(higher_straight_speed)
-                        wheels[3].drive(lower_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_straight_speed,
+                            wheels[1]: lower_straight_speed,
+                            wheels[2]: higher_straight_speed,
+                            wheels[3]: lower_straight_speed
+                        })
                     straight_timer.start_timer_millis()
 
                 this_bias = self.get_current_standard_gyro()
@@ -5379,20 +5391,26 @@ class Mecanum_Wheels_four(base_driver):
                     theta_side += this_bias - self.standard_bias_gyro
 
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed,
+                        wheels[2]: -speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed + adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed + adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed + adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed + adjuster
+                    })
                 else:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed - adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed - adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed - adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed - adjuster
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5457,20 +5475,26 @@ class Mecanum_Wheels_four(base_driver):
             while (instance.current_value() == value) and (side_timer.stop_timer(False) < millis):
                 if straight_timer.stop_timer(False) > 150:
                     if threshold > theta_side > -threshold:
-                        wheels[0].drive(straight_speed)
-                        wheels[1].drive(straight_speed)
-                        wheels[2].drive(straight_speed)
-                        wheels[3].drive(straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: straight_speed,
+                            wheels[1]: straight_speed,
+                            wheels[2]: straight_speed,
+                            wheels[3]: straight_speed
+                        })
                     elif self.check_threshold_strength(theta_side, threshold):
-                        wheels[0].drive(lower_straight_speed)
-                        wheels[1].drive(higher_straight_speed)
-                        wheels[2].drive(lower_straight_speed)
-                        wheels[3].drive(higher_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: lower_straight_speed,
+                            wheels[1]: higher_straight_speed,
+                            wheels[2]: lower_straight_speed,
+                            wheels[3]: higher_straight_speed
+                        })
                     else:
-                        wheels[0].drive(higher_straight_speed)
-                        wheels[1].drive(lower_straight_speed)
-                        wheels[2].drive(higher_straight_speed)
-                        wheels[3].drive(lower_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_straight_speed,
+                            wheels[1]: lower_straight_speed,
+                            wheels[2]: higher_straight_speed,
+                            wheels[3]: lower_straight_speed
+                        })
                     straight_timer.start_timer_millis()
 
                 this_bias = self.get_current_standard_gyro()
@@ -5479,20 +5503,26 @@ class Mecanum_Wheels_four(base_driver):
                     theta_side += this_bias - self.standard_bias_gyro
 
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed,
+                        wheels[2]: -speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed + adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed + adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed + adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed + adjuster
+                    })
                 else:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed - adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed - adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed - adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed - adjuster
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5504,20 +5534,26 @@ class Mecanum_Wheels_four(base_driver):
             while (instance.current_value() != value) and (side_timer.stop_timer(False) < millis):
                 if straight_timer.stop_timer(False) > 150:
                     if threshold > theta_side > -threshold:
-                        wheels[0].drive(straight_speed)
-                        wheels[1].drive(straight_speed)
-                        wheels[2].drive(straight_speed)
-                        wheels[3].drive(straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: straight_speed,
+                            wheels[1]: straight_speed,
+                            wheels[2]: straight_speed,
+                            wheels[3]: straight_speed
+                        })
                     elif self.check_threshold_strength(theta_side, threshold):
-                        wheels[0].drive(lower_straight_speed)
-                        wheels[1].drive(higher_straight_speed)
-                        wheels[2].drive(lower_straight_speed)
-                        wheels[3].drive(higher_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: lower_straight_speed,
+                            wheels[1]: higher_straight_speed,
+                            wheels[2]: lower_straight_speed,
+                            wheels[3]: higher_straight_speed
+                        })
                     else:
-                        wheels[0].drive(higher_straight_speed)
-                        wheels[1].drive(lower_straight_speed)
-                        wheels[2].drive(higher_straight_speed)
-                        wheels[3].drive(lower_straight_speed)
+                        WheelR.drive_together({
+                            wheels[0]: higher_straight_speed,
+                            wheels[1]: lower_straight_speed,
+                            wheels[2]: higher_straight_speed,
+                            wheels[3]: lower_straight_speed
+                        })
                     straight_timer.start_timer_millis()
 
                 this_bias = self.get_current_standard_gyro()
@@ -5526,20 +5562,26 @@ class Mecanum_Wheels_four(base_driver):
                     theta_side += this_bias - self.standard_bias_gyro
 
                 if threshold > theta_side > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed,
+                        wheels[2]: -speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta_side, threshold):
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed + adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed + adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed + adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed + adjuster
+                    })
                 else:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(-speed - adjuster)
-                    wheels[2].drive(-speed)
-                    wheels[3].drive(speed - adjuster)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: -speed - adjuster,
+                        wheels[2]: -speed,
+                        wheels[3]: speed - adjuster
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5587,20 +5629,26 @@ class Mecanum_Wheels_four(base_driver):
         if condition == 'let' or condition == '<=':  # let -> less or equal than
             while (instance.current_value() <= value) and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
-                    wheels[2].drive(speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: speed,
+                        wheels[2]: speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[0].drive(higher_speed)
-                    wheels[1].drive(lower_speed)
-                    wheels[2].drive(higher_speed)
-                    wheels[3].drive(lower_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_speed,
+                        wheels[1]: lower_speed,
+                        wheels[2]: higher_speed,
+                        wheels[3]: lower_speed
+                    })
                 else:
-                    wheels[0].drive(lower_speed)
-                    wheels[1].drive(higher_speed)
-                    wheels[2].drive(lower_speed)
-                    wheels[3].drive(higher_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_speed,
+                        wheels[1]: higher_speed,
+                        wheels[2]: lower_speed,
+                        wheels[3]: higher_speed
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5610,20 +5658,26 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == 'het' or condition == '>=':  # het -> higher or equal than
             while (instance.current_value() >= value) and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
-                    wheels[2].drive(speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: speed,
+                        wheels[2]: speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[0].drive(higher_speed)
-                    wheels[1].drive(lower_speed)
-                    wheels[2].drive(higher_speed)
-                    wheels[3].drive(lower_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_speed,
+                        wheels[1]: lower_speed,
+                        wheels[2]: higher_speed,
+                        wheels[3]: lower_speed
+                    })
                 else:
-                    wheels[0].drive(lower_speed)
-                    wheels[1].drive(higher_speed)
-                    wheels[2].drive(lower_speed)
-                    wheels[3].drive(higher_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_speed,
+                        wheels[1]: higher_speed,
+                        wheels[2]: lower_speed,
+                        wheels[3]: higher_speed
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5633,20 +5687,26 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == 'ht' or condition == '>':  # ht -> higher than
             while (instance.current_value() > value) and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
-                    wheels[2].drive(speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: speed,
+                        wheels[2]: speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[0].drive(higher_speed)
-                    wheels[1].drive(lower_speed)
-                    wheels[2].drive(higher_speed)
-                    wheels[3].drive(lower_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_speed,
+                        wheels[1]: lower_speed,
+                        wheels[2]: higher_speed,
+                        wheels[3]: lower_speed
+                    })
                 else:
-                    wheels[0].drive(lower_speed)
-                    wheels[1].drive(higher_speed)
-                    wheels[2].drive(lower_speed)
-                    wheels[3].drive(higher_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_speed,
+                        wheels[1]: higher_speed,
+                        wheels[2]: lower_speed,
+                        wheels[3]: higher_speed
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5656,20 +5716,26 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == 'lt' or condition == '<':  # lt -> less than
             while (instance.current_value() < value) and straight_timer.stop_timer(False) < millis:
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
-                    wheels[2].drive(speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: speed,
+                        wheels[2]: speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[0].drive(higher_speed)
-                    wheels[1].drive(lower_speed)
-                    wheels[2].drive(higher_speed)
-                    wheels[3].drive(lower_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_speed,
+                        wheels[1]: lower_speed,
+                        wheels[2]: higher_speed,
+                        wheels[3]: lower_speed
+                    })
                 else:
-                    wheels[0].drive(lower_speed)
-                    wheels[1].drive(higher_speed)
-                    wheels[2].drive(lower_speed)
-                    wheels[3].drive(higher_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_speed,
+                        wheels[1]: higher_speed,
+                        wheels[2]: lower_speed,
+                        wheels[3]: higher_speed
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5718,20 +5784,26 @@ class Mecanum_Wheels_four(base_driver):
         if condition == "==":
             while (instance.current_value() == value) and (straight_timer.stop_timer(False) < millis):
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
-                    wheels[2].drive(speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: speed,
+                        wheels[2]: speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[0].drive(higher_speed)
-                    wheels[1].drive(lower_speed)
-                    wheels[2].drive(higher_speed)
-                    wheels[3].drive(lower_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_speed,
+                        wheels[1]: lower_speed,
+                        wheels[2]: higher_speed,
+                        wheels[3]: lower_speed
+                    })
                 else:
-                    wheels[0].drive(lower_speed)
-                    wheels[1].drive(higher_speed)
-                    wheels[2].drive(lower_speed)
-                    wheels[3].drive(higher_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_speed,
+                        wheels[1]: higher_speed,
+                        wheels[2]: lower_speed,
+                        wheels[3]: higher_speed
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5740,20 +5812,26 @@ class Mecanum_Wheels_four(base_driver):
         elif condition == "!=":
             while (instance.current_value() != value) and (straight_timer.stop_timer(False) < millis):
                 if threshold > theta > -threshold:
-                    wheels[0].drive(speed)
-                    wheels[1].drive(speed)
-                    wheels[2].drive(speed)
-                    wheels[3].drive(speed)
+                    WheelR.drive_together({
+                        wheels[0]: speed,
+                        wheels[1]: speed,
+                        wheels[2]: speed,
+                        wheels[3]: speed
+                    })
                 elif self.check_threshold_strength(theta, threshold):
-                    wheels[0].drive(higher_speed)
-                    wheels[1].drive(lower_speed)
-                    wheels[2].drive(higher_speed)
-                    wheels[3].drive(lower_speed)
+                    WheelR.drive_together({
+                        wheels[0]: higher_speed,
+                        wheels[1]: lower_speed,
+                        wheels[2]: higher_speed,
+                        wheels[3]: lower_speed
+                    })
                 else:
-                    wheels[0].drive(lower_speed)
-                    wheels[1].drive(higher_speed)
-                    wheels[2].drive(lower_speed)
-                    wheels[3].drive(higher_speed)
+                    WheelR.drive_together({
+                        wheels[0]: lower_speed,
+                        wheels[1]: higher_speed,
+                        wheels[2]: lower_speed,
+                        wheels[3]: higher_speed
+                    })
 
                 this_bias = self.get_current_standard_gyro()
                 if last_bias != this_bias:
@@ -5949,10 +6027,12 @@ class Mecanum_Wheels_four(base_driver):
 
         line_turner_timer.start_timer_millis()
         while True:
-            wheels[0].drive(speed)
-            wheels[1].drive(-speed)
-            wheels[2].drive(speed)
-            wheels[3].drive(-speed)
+            WheelR.drive_together({
+                wheels[0]: speed,
+                wheels[1]: -speed,
+                wheels[2]: speed,
+                wheels[3]: -speed
+            })
 
 
             if line_turner_timer.stop_timer(False) > max_duration:
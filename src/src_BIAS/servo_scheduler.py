@@ -8,37 +8,63 @@ from logger import *
 try:
     import _kipr as k
     import threading
-    from collections import defaultdict
     import time
+    import heapq
+    import itertools
+    import math
+    from fileR import FileR  # selfmade
 except Exception as e:
     log(f'ServoScheduler Import Exception: {str(e)}', important=True, in_exception=True)
 
 
+BIAS_FOLDER = '/home/kipr/BotBall-data/bias_files'
+
+
 class ServoScheduler:
-    AUTO_STOP_TIMEOUT = 0.3  # 50ms  -> time after which the port will reduce it's speed to 0
-    AUTO_SHUTDOWN_TIMEOUT = 5  # 200ms  - > time after which every motor immediately will shut off when no valid ID sent a new request (it will boot up automatically again, when there is a new command)
+    AUTO_SHUTDOWN_TIMEOUT = 5  # 5s  -> time without any servo event after which the loop ends (it will boot up automatically again, when there is a new command)
     TIME_RECOGNIZER = 0.5  # 500ms  -> time when a new tid will be created with the same thread id
+    SETTLE_DIVISOR = 3  # set_pos() and the motion profiles keep the servo enabled for abs(distance) // SETTLE_DIVISOR milliseconds (set_position() for abs(distance))
+    STEP_RATE = 50  # 50Hz  -> how often per second a motion profile moves the servo one step further (the servo signal itself runs at 50Hz)
+    TRAVEL_MARGIN = 1.15  # 15%  -> safety margin on top of the calibrated travel time
+    TRAVEL_FILE = 'servo_travel_times.txt'  # port=dead_ms,ms_per_tick per line
+
+    MOVE = 'move'
+    DISABLE = 'disable'
+
+    LINEAR = 'linear'  # same speed from the start until the end
+    EASE = 'ease'  # slow start, fast middle, slow end
+    VELOCITY = 'velocity'  # linear with a given speed (ticks per second) instead of a given duration
+    PROFILES = (LINEAR, EASE, VELOCITY)
 
     def __init__(self):
         """
-        Not for basic users! Schedules every servo that makes them threadsafe. Blocks old activities so only the newest calls can use the servo
+        Not for basic users! Schedules every servo that makes them threadsafe. Blocks old activities so only the newest calls can use the servo.
+        Every step of a move (enable + move, settle, disable) is an event with a deadline, so a servo that waits for its settle time never blocks any other servo or caller
 
         Args:
             None
         """
         self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
         self._running = False
         self.last_activity = None
+        self._generation = 0  # newest token that got handed out
+        self._valid_from = 0  # every token below this one is old and gets blocked
+        self._threads = threading.local()  # token and time of the last call of each thread (disappears with the thread)
         self._last_tid = None
-        self._last_valid_tid = None
-        self._all_tid = defaultdict(list)
-        self._tid_counter = 0
-        self.id_dict = {}
-        self.id_set = set()
-        self._commands = {}
-        self._old_funcs = set()
+        self._owner_tid = None
+        self._blocked_tid = None
+        self._commands = {}  # port -> command of the current owner
+        self._events = []  # heap of (deadline, sequence, port, command, event)
+        self._sequence = itertools.count()  # keeps events with the same deadline in the order they got scheduled
+        self._step_period = 1 / self.STEP_RATE
+        self._travel = None  # port -> (dead_ms, ms_per_tick), gets loaded from the bias folder when it is needed for the first time
+        self._commanded = {}  # port -> last position that got sent to the servo
+        self._motion = {}  # port -> (estimated position, commanded position, time.monotonic()) of the last position change
         self._thread = threading.Thread(target=self._loop)
 
+
+    # ======================== PRIVATE METHODS ========================
     def _setup_loop(self) -> None:
         """
         Start a new endless loop
@@ -53,40 +79,337 @@ class ServoScheduler:
         self._thread = threading.Thread(target=self._loop)
         self._thread.start()
 
-    def _get_ID(self) -> str:
+    def _get_token(self) -> int:
         """
-        Create an ID based on the thread and time of last call from the same thread
+        Receive the token of the calling thread. A thread gets a new (bigger) token if it calls again after some time (TIME_RECOGNIZER constant) and another thread used the servos in between
 
         Args:
             None
 
         Returns:
-            str: The ID which got created
+            int: token of the current thread (the bigger, the newer)
         """
-        tid = threading.current_thread().ident
-
-        if self._last_valid_tid != tid and tid not in self.id_set and \
-                (tid not in self.id_dict or time.time() - self.id_dict[tid] > self.TIME_RECOGNIZER):
-            if tid not in self._all_tid:
-                if len(self._all_tid[tid]) == 0 or self._all_tid[tid][-1] != self._tid_counter:  # does not exist yet
-                    self._tid_counter += 1
-                    self._all_tid[tid].append(self._tid_counter)
-            elif self._all_tid[tid][-1] - 1 != self._all_tid[self._last_valid_tid][-1]:  # exists, but is not up-to-date
-                self._tid_counter += 1
-                self._all_tid[tid].append(self._tid_counter)
+        tid = threading.get_ident()
+        now = time.monotonic()
+        token = getattr(self._threads, 'token', None)
 
-            if self._last_valid_tid in self.id_set:  # free the last tid from being blocked
-                self.id_set.remove(self._last_valid_tid)
-            self._last_valid_tid = tid
-            self.id_set.add(self._last_tid)  # block last tid from entering this function
+        if token is None or (tid != self._owner_tid and tid != self._blocked_tid and now - self._threads.last_call > self.TIME_RECOGNIZER):
+            self._generation += 1
+            token = self._threads.token = self._generation
+            self._blocked_tid = self._last_tid if self._last_tid != tid else None  # block last tid from getting a new token
+            self._owner_tid = tid
 
-        self.id_dict[tid] = time.time()
+        self._threads.last_call = now
         self._last_tid = tid
-        return f'{tid}-{self._all_tid[tid][-1]}'
+        return token
+
+    def _schedule(self, deadline: float, port: int, command: dict, event: str) -> None:
+        """
+        Adds an event to the queue and wakes up the loop (the lock needs to be held)
+
+        Args:
+            deadline (float): time.monotonic() when the event should happen
+            port (int): The port where the servo is plugged into
+            command (dict): the command the event belongs to (the event gets ignored if the port got a new command in between)
+            event (str): MOVE or DISABLE
+
+        Returns:
+            None
+        """
+        heapq.heappush(self._events, (deadline, next(self._sequence), port, command, event))
+        self._condition.notify()
+
+    def _load_travel_times(self) -> dict:
+        """
+        Reads the calibrated travel time model of every servo port from the bias folder
+
+        Args:
+            None
+
+        Returns:
+            dict: port -> (dead_ms, ms_per_tick) (empty if nothing got calibrated yet)
+        """
+        travel = {}
+        try:
+            file_manager = FileR(BIAS_FOLDER)
+            if file_manager.exists(self.TRAVEL_FILE):
+                for line in file_manager.reader(self.TRAVEL_FILE).splitlines():
+                    if '=' in line:
+                        port, model = line.strip().split('=')
+                        dead_ms, ms_per_tick = model.split(',')
+                        travel[int(port)] = (float(dead_ms), float(ms_per_tick))
+        except Exception as e:
+            log(f'Servo travel times could not be loaded: {str(e)}', important=True, in_exception=True)
+        return travel
+
+    def _save_travel_times(self) -> None:
+        """
+        Writes the travel time model of every calibrated servo port into the bias folder
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        lines = [f'{port}={dead_ms},{ms_per_tick}' for port, (dead_ms, ms_per_tick) in sorted(self._travel.items())]
+        FileR(BIAS_FOLDER).writer(self.TRAVEL_FILE, 'w', '\n'.join(lines) + '\n', atomic=True)
+
+    def _hold_millis(self, start: int, pos: int, port: int = None, divisor: int = SETTLE_DIVISOR) -> int:
+        """
+        Calculates how long the servo needs to stay enabled until it reaches the position. Uses the calibrated travel time of the port (see calibrate_travel_time()), otherwise abs(distance) // divisor
+
+        Args:
+            start (int): Where the servo is
+            pos (int): Where the servo should go
+            port (int, optional): The port where the servo is plugged into (default: None -> no calibration is used)
+            divisor (int, optional): milliseconds = abs(distance) // divisor if the port is not calibrated (default: SETTLE_DIVISOR)
+
+        Returns:
+            int: time in milliseconds
+        """
+        distance = abs(start - pos)
+        if distance == 0:
+            return 0
+
+        model = self._travel_model(port)
+        if model is None:
+            return distance // divisor
+        dead_ms, ms_per_tick = model
+        return math.ceil((dead_ms + distance * ms_per_tick) * self.TRAVEL_MARGIN)
+
+    def _travel_model(self, port: int) -> tuple:
+        """
+        Receive the calibrated travel time model of a port (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+
+        Returns:
+            tuple | None: (dead_ms, ms_per_tick) (None if the port is not calibrated)
+        """
+        if self._travel is None:
+            self._travel = self._load_travel_times()
+        return self._travel.get(port)
+
+    def _position(self, port: int) -> int:
+        """
+        Receive the commanded position of a port from memory. Only the very first call of a port asks the hardware (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+
+        Returns:
+            int: the last position that got sent to the servo
+        """
+        position = self._commanded.get(port)
+        if position is None:
+            position = self._commanded[port] = k.get_servo_position(port)
+        return position
+
+    def _estimate(self, port: int, now: float) -> float:
+        """
+        Estimates where the servo physically is, based on its last position change and its travel time (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+            now (float): time.monotonic()
+
+        Returns:
+            float: the estimated position
+        """
+        motion = self._motion.get(port)
+        if motion is None:
+            return self._position(port)
+
+        start, end, since = motion
+        distance = abs(end - start)
+        elapsed_ms = (now - since) * 1000
+        model = self._travel_model(port)
+        if model is None:
+            moved = elapsed_ms * self.SETTLE_DIVISOR
+        else:
+            dead_ms, ms_per_tick = model
+            moved = (elapsed_ms - dead_ms) / ms_per_tick if ms_per_tick > 0 else distance
+
+        if moved >= distance:
+            return end
+        if moved <= 0:
+            return start
+        return start + math.copysign(moved, end - start)
+
+    def _write_position(self, port: int, pos: int) -> None:
+        """
+        Sends a position to the servo and remembers it (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+            pos (int): Where the servo should go
+
+        Returns:
+            None
+        """
+        now = time.monotonic()
+        estimated = self._estimate(port, now)
+        k.set_servo_position(port, pos)
+        self._commanded[port] = pos
+        self._motion[port] = (estimated, pos, now)
+
+    def _trajectory(self, start: int, pos: int, millis: int, profile: str) -> list:
+        """
+        Calculates every position of a motion profile once, so the loop only needs to set them one after another
+
+        Args:
+            start (int): Where the servo is
+            pos (int): Where the servo should go
+            millis (int): how long the whole move should take
+            profile (str): LINEAR, EASE or VELOCITY
+
+        Returns:
+            list: the position of every step (the last one is always pos)
+        """
+        steps = max(1, math.ceil(millis / 1000 / self._step_period))
+        trajectory = []
+        for step in range(1, steps + 1):
+            progress = step / steps
+            if profile == self.EASE:
+                progress = progress * progress * (3 - 2 * progress)  # smoothstep -> the speed is 0 at the start and at the end
+            trajectory.append(int(round(start + (pos - start) * progress)))
+        return trajectory
+
+    def _claim(self, ports) -> int:
+        """
+        Checks if the calling thread may use every one of the servos (the lock needs to be held)
+
+        Args:
+            ports (iterable): The ports where the servos are plugged into
+
+        Returns:
+            int | None: token of the calling thread (None if it is getting blocked)
+        """
+        token = self._get_token()
+        if token < self._valid_from:
+            return None
+
+        takes_over = False
+        for port in ports:  # every port gets checked first, so a blocked claim changes nothing
+            current = self._commands.get(port)
+            if current is not None and current['token'] != token and current['token'] >= self._valid_from:
+                if current['token'] > token:  # a newer thread owns the servo
+                    return None
+                takes_over = True
+
+        if takes_over:
+            self._valid_from = max(self._valid_from, token)  # somebody new takes over -> every older command stops
+            for old_port, command in list(self._commands.items()):
+                if command['token'] < self._valid_from:
+                    k.disable_servo(old_port)
+                    self._finish(old_port)
+
+        if not self._running:
+            self._setup_loop()
+        self.last_activity = time.time()
+        return token
+
+    def _start_command(self, port: int, trajectory: list, millis: int, token: int, now: float, group: dict = None) -> None:
+        """
+        Replaces the command of a port and schedules its first step (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+            trajectory (list): the positions that should get set one step (STEP_RATE) after another
+            millis (int): how long the servo stays enabled after the last position got set
+            token (int): token of the calling thread
+            now (float): time.monotonic() when the move starts
+            group (dict, optional): the group move this command belongs to (default: None)
+
+        Returns:
+            None
+        """
+        self._finish(port)  # a previous move of this port is over now
+        command = {
+            'pos': trajectory[-1],
+            'trajectory': trajectory,
+            'step': 0,
+            'start': now,
+            'millis': millis,
+            'token': token,
+            'done': threading.Event(),
+            'group': group
+        }
+        self._commands[port] = command
+        self._schedule(now, port, command, self.MOVE)
+
+    def _submit(self, port: int, trajectory: list, millis: int) -> bool:
+        """
+        Checks if the calling thread may use the servo and schedules the move (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+            trajectory (list): the positions that should get set one step (STEP_RATE) after another
+            millis (int): how long the servo stays enabled after the last position got set
+
+        Returns:
+            bool: If the move got scheduled (True) or if it is getting blocked (False)
+        """
+        token = self._claim((port,))
+        if token is None:
+            return False
+        self._start_command(port, trajectory, millis, token, time.monotonic())
+        return True
+
+    def _finish(self, port: int) -> None:
+        """
+        Removes the command of a port and tells everyone who waits for it that it is over (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+
+        Returns:
+            None
+        """
+        command = self._commands.pop(port, None)
+        if command is not None:
+            command['done'].set()
+            group = command['group']
+            if group is not None:
+                group['remaining'] -= 1
+                if group['remaining'] == 0:
+                    group['done'].set()
+
+    def _run_event(self, port: int, command: dict, event: str) -> None:
+        """
+        Executes one due event (the lock needs to be held)
+
+        Args:
+            port (int): The port where the servo is plugged into
+            command (dict): the command the event belongs to
+            event (str): MOVE or DISABLE
+
+        Returns:
+            None
+        """
+        if self._commands.get(port) is not command:  # the port got a new command or got stopped in between
+            return
+
+        if event == self.MOVE:
+            step = command['step']
+            if step == 0:
+                k.enable_servo(port)
+            self._write_position(port, command['trajectory'][step])
+
+            command['step'] = step + 1
+            if command['step'] < len(command['trajectory']):
+                self._schedule(command['start'] + command['step'] * self._step_period, port, command, self.MOVE)  # fixed grid -> no drift
+            else:
+                self._schedule(time.monotonic() + command['millis'] / 1000, port, command, self.DISABLE)
+        elif event == self.DISABLE:
+            k.disable_servo(port)
+            self._finish(port)
 
     def _loop(self) -> None:
         """
-        Loop which will automatically end if no further instruction of movement came
+        Loop which executes every event as soon as its deadline is reached and sleeps until the next deadline in between. Ends automatically if there was nothing to do for some time
 
         Args:
             None
@@ -95,60 +418,27 @@ class ServoScheduler:
             None
         """
         try:
-            while self._running:
-                with self._lock:
-                    for key, data in list(self._commands.items()):
-                        fid = key[1]
-
-                        if fid in self._old_funcs:
-                            log('old', important=True)
-                            continue
-
-                        port = data['port']
-                        enabled = data['enabled']
-                        last_update = data['last_update']
-                        to_sleep = data['millis']
-                        pos = data['pos']
-                        already_set = data['already_set']
-
-                        log(f'{pos, port, to_sleep}')
-
-                        if enabled and not already_set:
-                            #log('here')
-                            self.enable_servo(port)
-                            k.set_servo_position(port, pos)
-                            k.msleep(to_sleep)
-                            #self.last_activity -= to_sleep/1000  # -> to_sleep is in milliseconds and you need to convert it into seconds
-                            self.disable_servo(port)
-                            self._commands[key].update({
-                                'already_set': True,
-                                'enabled': False
-                            })
-                        elif last_update - time.time() > self.AUTO_STOP_TIMEOUT:
-                            self.disable_servo(port)
-                            self._commands.pop(key)
-
-
-                if self.last_activity and time.time() - self.last_activity > self.AUTO_SHUTDOWN_TIMEOUT:
-                    print(time.time(), self.last_activity, time.time() - self.last_activity, flush=True)
-                    log('dead', important=True)
-                    self.disable_all()
-                    self._running = False
+            with self._condition:
+                while self._running:
+                    now = time.monotonic()
+                    if self._events and self._events[0][0] <= now:
+                        deadline, _, port, command, event = heapq.heappop(self._events)
+                        self._run_event(port, command, event)
+                        continue
+
+                    if not self._events and self.last_activity and time.time() - self.last_activity > self.AUTO_SHUTDOWN_TIMEOUT:
+                        self._running = False
+                        break
 
+                    self._condition.wait(self._events[0][0] - now if self._events else self.AUTO_SHUTDOWN_TIMEOUT)
         except Exception as e:
             log(str(e), in_exception=True)
 
-    def set_pos(self, port: int, pos: int):
-        k.enable_servo(port)
-        millis = abs(k.get_servo_position(port) - pos)//3
-
-        k.set_servo_position(port, pos)
-        k.msleep(millis)
-        k.disable_servo(port)
 
+    # ======================== PUBLIC METHODS ========================
     def set_position(self, port: int, pos: int) -> bool:
         """
-        Set the position of a servo
+        Set the position of a servo. Returns immediately, the servo gets enabled, moved and disabled again in the background (use wait() if you need it to be there)
 
         Args:
             port (int): The port where the servo is plugged into
@@ -157,50 +447,264 @@ class ServoScheduler:
         Returns:
             bool: If the value is set (True) or if it is getting blocked from being set (False)
         """
+        try:
+            with self._lock:
+                return self._submit(port, [pos], self._hold_millis(self._position(port), pos, port, divisor=1))
+        except Exception as e:
+            log(str(e), in_exception=True)
+            return False
+
+    def move_profile(self, port: int, pos: int, millis: int = None, profile: str = LINEAR, velocity: float = None, wait: bool = False) -> bool:
+        """
+        Moves a servo along a timed motion profile. Every position gets calculated once and the loop sets them at a fixed rate (STEP_RATE), so the calling thread does not need to do anything in between
+
+        Args:
+            port (int): The port where the servo is plugged into
+            pos (int): Where the servo should go
+            millis (int, optional): how long the move should take (needed for LINEAR and EASE) (default: None)
+            profile (str, optional): LINEAR, EASE or VELOCITY (default: LINEAR)
+            velocity (float, optional): speed in ticks per second (needed for VELOCITY) (default: None)
+            wait (bool, optional): If it should return once the servo is there (True) or immediately (False) (default: False)
+
+        Returns:
+            bool: If the move got scheduled (True) or if it is getting blocked (False)
+        """
+        if profile not in self.PROFILES:
+            log(f'profile can only be one of {self.PROFILES}', in_exception=True)
+            raise ValueError(f'profile can only be one of {self.PROFILES}')
+        if profile == self.VELOCITY and (velocity is None or velocity <= 0):
+            log('the velocity profile needs a velocity bigger than 0', in_exception=True)
+            raise ValueError('the velocity profile needs a velocity bigger than 0')
+        if profile != self.VELOCITY and (millis is None or millis < 0):
+            log(f'the {profile} profile needs a duration (millis) of at least 0', in_exception=True)
+            raise ValueError(f'the {profile} profile needs a duration (millis) of at least 0')
 
         try:
             with self._lock:
-                func_id = self._get_ID()
-                if func_id in self._old_funcs:
-                    log('old', important=True)
-                    return False
-
-                if not self._running:
-                    self._setup_loop()
-
-                key = (port, func_id)
-                self.last_activity = time.time()
-
-                millis = int((abs(k.get_servo_position(port) - pos)))
-
-                if key in self._commands:
-                    self._commands[key].update({
-                        'pos': pos,
-                        'millis': millis,
-                        'last_update': self.last_activity,
-                        'enabled': True,
-                        'already_set': False
-                    })
-                    return True
-                for old_key, data in list(self._commands.items()):
-                    if data['port'] == port:
-                        log('old', important=True)
-                        self._old_funcs.add(data['func_id'])
-                        self.disable_all()
-                        break
+                start = self._position(port)
+                if profile == self.VELOCITY:
+                    millis = abs(pos - start) / velocity * 1000
+                trajectory = self._trajectory(start, pos, millis, profile)
+                last_step = trajectory[-2] if len(trajectory) > 1 else start
+                submitted = self._submit(port, trajectory, self._hold_millis(last_step, pos, port))
+        except Exception as e:
+            log(str(e), in_exception=True)
+            return False
+
+        if submitted and wait:
+            self.wait(port)
+        return submitted
+
+    def move_group(self, targets: dict, millis: int = None, profile: str = LINEAR, wait: bool = False):
+        """
+        Moves multiple servos on one shared timeline, so all of them start together and arrive together. The whole move takes as long as the slowest servo needs (instead of the sum of all servos)
+
+        Args:
+            targets (dict): port -> where the servo should go (e.g.: {0: 1800, 2: 300})
+            millis (int, optional): how long the move should take (default: None -> as long as the slowest servo needs)
+            profile (str, optional): LINEAR or EASE (default: LINEAR)
+            wait (bool, optional): If it should return once every servo is there (True) or immediately (False) (default: False)
+
+        Returns:
+            threading.Event | None: gets set once every servo of the group is done (None if it is getting blocked)
+        """
+        if profile not in (self.LINEAR, self.EASE):
+            log(f'a group move can only use the profiles {self.LINEAR} and {self.EASE}', in_exception=True)
+            raise ValueError(f'a group move can only use the profiles {self.LINEAR} and {self.EASE}')
+
+        group = {'remaining': len(targets), 'done': threading.Event()}
+        if not targets:
+            group['done'].set()
+            return group['done']
+
+        try:
+            with self._lock:
+                token = self._claim(targets)
+                if token is None:
+                    return None
+
+                starts = {port: self._position(port) for port in targets}
+                if millis is None:
+                    millis = max(self._hold_millis(starts[port], pos, port) for port, pos in targets.items())
+
+                now = time.monotonic()
+                for port, pos in targets.items():
+                    trajectory = self._trajectory(starts[port], pos, millis, profile)
+                    last_step = trajectory[-2] if len(trajectory) > 1 else starts[port]
+                    self._start_command(port, trajectory, self._hold_millis(last_step, pos, port), token, now, group)
+        except Exception as e:
+            log(str(e), in_exception=True)
+            return None
+
+        if wait:
+            group['done'].wait()
+        return group['done']
+
+    def wait(self, port: int, timeout: float = None) -> bool:
+        """
+        Waits until the current move of a servo is done (only this servo, every other servo keeps moving)
+
+        Args:
+            port (int): The port where the servo is plugged into
+            timeout (float, optional): maximum time to wait in seconds (default: None -> no limit)
+
+        Returns:
+            bool: If the move is done (True) or the timeout was reached (False)
+        """
+        with self._lock:
+            command = self._commands.get(port)
+        if command is None:
+            return True
+        return command['done'].wait(timeout)
+
+    def set_pos(self, port: int, pos: int) -> bool:
+        """
+        Set the position of a servo and wait until it is there. Never gets blocked: a move of another thread on this port gets stopped
+
+        Args:
+            port (int): The port where the servo is plugged into
+            pos (int): Where the servo should go
 
-                self._commands[key] = {
-                    'port': port,
-                    'pos': pos,
-                    'millis': millis,
-                    'func_id': func_id,
-                    'enabled': True,
-                    'already_set': False,
-                    'last_update': self.last_activity
-                }
-                return True
+        Returns:
+            bool: If the value is set (True) or not (False)
+        """
+        try:
+            with self._lock:
+                self._finish(port)  # the loop must not move or disable the servo in between
+                millis = self._hold_millis(self._position(port), pos, port)
+                k.enable_servo(port)
+                self._write_position(port, pos)
+            k.msleep(millis)
+            with self._lock:
+                if port not in self._commands:  # a new move started in the meantime -> the loop disables it
+                    k.disable_servo(port)
+            return True
         except Exception as e:
             log(str(e), in_exception=True)
+            return False
+
+    def get_travel_time(self, port: int) -> tuple:
+        """
+        Lets you see the calibrated travel time model of a servo port
+
+        Args:
+            port (int): The port where the servo is plugged into
+
+        Returns:
+            tuple | None: (dead_ms, ms_per_tick) -> a move of d ticks takes dead_ms + d * ms_per_tick milliseconds (None if the port is not calibrated)
+        """
+        with self._lock:
+            return self._travel_model(port)
+
+    def get_position(self, port: int) -> int:
+        """
+        Lets you see the last position that got sent to a servo (from memory, without asking the hardware)
+
+        Args:
+            port (int): The port where the servo is plugged into
+
+        Returns:
+            int: the commanded position
+        """
+        with self._lock:
+            return self._position(port)
+
+    def get_estimated_position(self, port: int) -> int:
+        """
+        Lets you see where the servo physically is at the moment, estimated from its travel time (see calibrate_travel_time())
+
+        Args:
+            port (int): The port where the servo is plugged into
+
+        Returns:
+            int: the estimated position
+        """
+        with self._lock:
+            return int(round(self._estimate(port, time.monotonic())))
+
+    def get_target(self, port: int) -> int:
+        """
+        Lets you see where the current move of a servo ends
+
+        Args:
+            port (int): The port where the servo is plugged into
+
+        Returns:
+            int: the end position of the current move (the commanded position if there is no move)
+        """
+        with self._lock:
+            command = self._commands.get(port)
+            return command['pos'] if command is not None else self._position(port)
+
+    def calibrate_travel_time(self, port: int, reached, end: int, distances: tuple = (250, 500, 1000, 1500), repeats: int = 3, timeout: int = 3000, min_value: int = 0, max_value: int = 2047) -> tuple:
+        """
+        Measures how fast the servo really moves and saves it into the bias folder, so every following move only keeps the servo enabled as long as it really needs.
+        The servo starts at different distances from the end position and the time until reached() returns True gets measured (e.g. a button that gets pressed by the arm at the end position)
+
+        Args:
+            port (int): The port where the servo is plugged into
+            reached (callable): function without arguments that returns True as soon as the servo is at the end position
+            end (int): the position where reached() becomes True
+            distances (tuple, optional): distances (in ticks) from where the servo starts (default: (250, 500, 1000, 1500))
+            repeats (int, optional): how often every distance gets measured (default: 3)
+            timeout (int, optional): maximum time (in milliseconds) for one move (default: 3000)
+            min_value (int, optional): lowest position the servo may go to (default: 0)
+            max_value (int, optional): highest position the servo may go to (default: 2047)
+
+        Returns:
+            tuple: (dead_ms, ms_per_tick) of the new model
+        """
+        self.disable_servo(port)
+        samples = []
+        for distance in distances:
+            start = end - distance if end - distance >= min_value else end + distance
+            if not min_value <= start <= max_value:
+                log(f'Distance {distance} does not fit between {min_value} and {max_value}, skipped', important=True)
+                continue
+
+            for _ in range(repeats):
+                k.enable_servo(port)
+                k.set_servo_position(port, start)
+                k.msleep(max(1000, distance))  # way more than enough to get to the start
+                if reached():
+                    log(f'reached() is already True at position {start}, skipped', important=True)
+                    continue
+
+                begin = time.monotonic()
+                k.set_servo_position(port, end)
+                while not reached() and time.monotonic() - begin < timeout / 1000:
+                    k.msleep(1)
+                millis = (time.monotonic() - begin) * 1000
+
+                if millis >= timeout:
+                    log(f'Servo on port {port} did not reach {end} from {start} within {timeout}ms, skipped', important=True)
+                else:
+                    samples.append((distance, millis))
+        k.disable_servo(port)
+        with self._lock:  # the calibration moved the servo around the scheduler -> read the position from the hardware again next time
+            self._commanded.pop(port, None)
+            self._motion.pop(port, None)
+
+        if not samples:
+            log(f'No valid measurement for the servo on port {port}', in_exception=True)
+            raise ValueError(f'No valid measurement for the servo on port {port}')
+
+        mean_distance = sum(d for d, _ in samples) / len(samples)
+        mean_millis = sum(m for _, m in samples) / len(samples)
+        variance = sum((d - mean_distance) ** 2 for d, _ in samples)
+        if variance == 0:  # only one distance -> no dead time can be separated
+            dead_ms, ms_per_tick = 0.0, mean_millis / mean_distance
+        else:  # least squares: millis = dead_ms + distance * ms_per_tick
+            ms_per_tick = sum((d - mean_distance) * (m - mean_millis) for d, m in samples) / variance
+            dead_ms = max(0.0, mean_millis - ms_per_tick * mean_distance)
+
+        with self._lock:
+            if self._travel is None:
+                self._travel = self._load_travel_times()
+            self._travel[port] = (round(dead_ms, 2), round(ms_per_tick, 4))
+            self._save_travel_times()
+        log(f'Servo on port {port}: {dead_ms:.1f}ms + {ms_per_tick:.3f}ms per tick')
+        return self._travel[port]
 
     def enable_servo(self, port):
         """
@@ -212,20 +716,16 @@ class ServoScheduler:
         Returns:
             None
         """
-        #log(f'enabled: {port}')
         try:
             with self._lock:
-                for key, data in list(self._commands.items()):
-                    if data['port'] == port:
-                        self._commands[key]['enabled'] = True
-                        k.enable_servo(port)
-                        break
+                if port in self._commands:
+                    k.enable_servo(port)
         except Exception as e:
             log(str(e), in_exception=True)
 
     def disable_servo(self, port: int) -> None:
         """
-        Disable one specific servo port
+        Disable one specific servo port and cancel its current move
 
         Args:
             port (int): The port where the servo is plugged into
@@ -233,17 +733,14 @@ class ServoScheduler:
         Returns:
             None
         """
-        #log('disabled', important=True)
         with self._lock:
-            for key, data in list(self._commands.items()):
-                if data['port'] == port:
-                    self._commands[key]['enabled'] = False
-                    k.disable_servo(port)
-                    break
+            if port in self._commands:
+                k.disable_servo(port)
+                self._finish(port)
 
     def disable_all(self) -> None:
         """
-        Disable all active servos
+        Disable all active servos and cancel their moves
 
         Args:
             None
@@ -252,11 +749,10 @@ class ServoScheduler:
             None
         """
         try:
-            log('disabled', important=True)
             with self._lock:
-                for key, data in list(self._commands.items()):
-                    self._commands[key]['enabled'] = False
-                    k.disable_servo(data['port'])
+                for port in list(self._commands):
+                    k.disable_servo(port)
+                    self._finish(port)
         except Exception as e:
             log(str(e), in_exception=True)
 
@@ -273,10 +769,9 @@ class ServoScheduler:
         with self._lock:
             if len(self._commands) != 0:
                 self.shutdown()
-                for old_key, data in list(self._commands.items()):
-                    self._old_funcs.add(old_key[1])
-                    k.disable_servo(data['port'])
-                self._commands.clear()
+                self._valid_from = self._generation + 1
+                self.disable_all()
+                self._events.clear()
 
     def shutdown(self) -> None:
         """
@@ -290,6 +785,7 @@ class ServoScheduler:
         """
         with self._lock:
             self._running = False
+            self._condition.notify()
 
 
-SERVO_SCHEDULER = ServoScheduler()
\ No newline at end of file
+SERVO_SCHEDULER = ServoScheduler()
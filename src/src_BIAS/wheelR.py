@@ -39,23 +39,33 @@ class WheelR:
 
 
     # ======================== PRIVATE METHODS ========================
-    def _base_speed_func(self, speed: int) -> None:
+    def _clamp_speed(self, speed: int) -> int:
         """
-        Function where you can tell the robot the base function of how to drive / with which function and functionality it should drive
+        Limits the speed to the maximum speed of this wheel
 
         Args:
-            speed (int): The velocity the robot should go. Currently with the mav function (values range: -1500 to 1500)
+            speed (int): The velocity the robot should go
 
         Returns:
-            None
+            int: the speed between -max_speed and max_speed
         """
         if speed < -self.max_speed:
             speed = -self.max_speed
         elif speed > self.max_speed:
             speed = self.max_speed
+        return speed
 
+    def _base_speed_func(self, speed: int) -> None:
+        """
+        Function where you can tell the robot the base function of how to drive / with which function and functionality it should drive
 
-        MOTOR_SCHEDULER.set_speed(self.port, speed)
+        Args:
+            speed (int): The velocity the robot should go. Currently with the mav function (values range: -1500 to 1500)
+
+        Returns:
+            None
+        """
+        MOTOR_SCHEDULER.set_speed(self.port, self._clamp_speed(speed))
 
     def _hard_stop(self) -> None:
         """
@@ -299,6 +309,29 @@ class WheelR:
         speed = int(speed)
         self._base_speed_func(speed)
 
+    @staticmethod
+    def drive_together(speeds: dict) -> None:
+        """
+        Default Function for driving multiple wheels at once. All speeds get set together, so the wheels can not run out of sync (use this instead of calling drive() of every wheel one after another). If a wheel has its own _base_speed_func(), every wheel gets driven through its _base_speed_func() instead
+
+        Args:
+            speeds (dict): WheelR instance -> velocity to drive (e.g.: {right_wheel: 1000, left_wheel: 900})
+
+        Returns:
+            None
+        """
+        ports = {}
+        for wheel, speed in speeds.items():
+            if type(wheel)._base_speed_func is not WheelR._base_speed_func or '_base_speed_func' in wheel.__dict__:
+                break
+            ports[wheel.port] = wheel._clamp_speed(int(speed))
+        else:
+            MOTOR_SCHEDULER.set_speeds(ports)
+            return
+
+        for wheel, speed in speeds.items():  # a changed base function decides itself how the wheel drives
+            wheel._base_speed_func(int(speed))
+
     def drive_dfw(self, adjuster: int = None) -> None:
         """
         Function for driving forward with default speed (expects that the motor will move forwards when the value gets positive)
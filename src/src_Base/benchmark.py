@@ -0,0 +1,409 @@
+#!/usr/bin/python3
+import os, sys
+sys.path.append("/usr/lib")
+
+# Author: Joel Kalkusch
+# Email: kalkusch.joel@gmail.com
+# Notice: feel free to write me for questions or help!
+# Date of creation: 2026-10-17
+
+import kipr_sim  # selfmade  -> needs to be installed before any other selfmade module imports _kipr
+SIMULATION = kipr_sim.install()
+
+from logger import *  # selfmade
+
+try:
+    import argparse
+    import math
+    import shutil
+    import tempfile
+    import time
+    from collections import Counter
+    from functools import partial
+except Exception as e:
+    log(f'Import Exception: {str(e)}', important=True, in_exception=True)
+
+
+DEFAULT_BIAS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bias')
+DISTANCE_MM = [100, 200, 300, 400, 500, 600, 700, 800]
+DISTANCE_VALUES = [2800, 2000, 1500, 1150, 900, 750, 650, 600]
+
+KIPR_CALLS = Counter()
+
+
+def _seed_bias_folder() -> str:
+    """
+    Copies the default bias files into a new temporary folder (the same as bias_creater.sh does on the wombat), so the benchmark never touches the bias folder of the robot
+
+    Args:
+        None
+
+    Returns:
+        str: the temporary bias folder
+    """
+    folder = tempfile.mkdtemp(prefix='botball_benchmark_')
+    if os.path.isdir(DEFAULT_BIAS_FOLDER):
+        for file_name in os.listdir(DEFAULT_BIAS_FOLDER):
+            source = os.path.join(DEFAULT_BIAS_FOLDER, file_name)
+            if os.path.isfile(source):
+                shutil.copy(source, os.path.join(folder, file_name))
+    return folder
+
+
+def _count_kipr_calls() -> None:
+    """
+    Wraps every _kipr function of the simulation, so every call gets counted in KIPR_CALLS
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    def counted(name, func):
+        def wrapper(*args):
+            KIPR_CALLS[name] += 1
+            return func(*args)
+        wrapper.__name__ = name
+        return wrapper
+
+    for name, func in list(vars(kipr_sim).items()):
+        if callable(func) and getattr(func, '__module__', None) == kipr_sim.__name__ and not isinstance(func, type) \
+                and not name.startswith('_') and name != 'install':
+            setattr(kipr_sim, name, counted(name, func))
+
+
+BIAS_FOLDER = _seed_bias_folder()
+_count_kipr_calls()
+
+try:
+    from scipy.interpolate import interp1d
+    from wheelR import WheelR  # selfmade
+    from digital import Digital  # selfmade
+    from light_sensor import LightSensor  # selfmade
+    from distance_sensor import DistanceSensor  # selfmade
+    from motor_scheduler import MOTOR_SCHEDULER  # selfmade
+    from imu_sampler import IMU_SAMPLER  # selfmade
+    from servo_scheduler import SERVO_SCHEDULER  # selfmade
+    from calibration_store import CALIBRATION_STORE  # selfmade
+    from driveR import Solarbotic_Wheels_two, Mecanum_Wheels_four  # selfmade
+except Exception as e:
+    log(f'Import Exception: {str(e)}', important=True, in_exception=True)
+
+CALIBRATION_STORE.set_folder(BIAS_FOLDER)
+
+
+class ControlLoopBenchmark:
+    TWO_WHEEL_PORTS = (0, 1)  # left, right
+    FOUR_WHEEL_PORTS = (0, 1, 2, 3)  # front left, front right, back left, back right
+    LIGHT_SENSOR_OFFSET_MM = 60  # distance from the middle of the robot to the front / back light sensor
+    LINE_WIDTH_MM = 25
+    WALL_MM = 600  # distance from the start to the wall in front of the robot
+
+    def __init__(self, millis: int = 2000, speed: int = 1000, gyro_noise: float = 2.0, gyro_bias: float = 3.0, seed: int = 42):
+        """
+        Runs the control loops of the driveR primitives against the simulated _kipr module and measures how fast and how accurate they are
+
+        Args:
+            millis (int, optional): how long every time based primitive should run (default: 2000)
+            speed (int, optional): the default speed of the robot (default: 1000)
+            gyro_noise (float, optional): standard deviation of the simulated gyro noise (default: 2.0)
+            gyro_bias (float, optional): simulated bias of the gyro axis that is used for driving (default: 3.0)
+            seed (int, optional): seed of the simulated noise (default: 42)
+        """
+        self.millis = millis
+        self.speed = speed
+        self.gyro_noise = gyro_noise
+        self.gyro_bias = gyro_bias
+        self.seed = seed
+        self.scenarios = {
+            'two.drive_straight': self.bench_two_drive_straight,
+            'two.turn_degrees': self.bench_two_turn_degrees,
+            'two.drive_til_distance': self.bench_two_drive_til_distance,
+            'two.black_line': self.bench_two_black_line,
+            'four.drive_straight': self.bench_four_drive_straight,
+            'four.drive_side': self.bench_four_drive_side,
+            'four.drive_diagonal': self.bench_four_drive_diagonal,
+        }
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _install(self, drive: str, ports: tuple) -> kipr_sim.KiprSimulation:
+        """
+        Creates a fresh simulation for one run
+
+        Args:
+            drive (str): "differential" or "mecanum"
+            ports (tuple): the motor ports of the drive
+
+        Returns:
+            KiprSimulation: the new simulation
+        """
+        sim = kipr_sim.KiprSimulation(drive=drive, motor_ports=ports, gyro_bias={'z': self.gyro_bias},
+                                      gyro_noise=self.gyro_noise, real_sleep=True, seed=self.seed)  # the driveR loops use TimeR (real clock) -> the simulation has to run in real time as well
+        kipr_sim.SIMULATION = sim
+        for port in range(6):
+            sim.set_digital(port, 0)
+        return sim
+
+    def _calibrate(self, driver, sim: kipr_sim.KiprSimulation, turn_speed: int, threshold_strength: str) -> None:
+        """
+        Gives the driver the calibration values that fit to the simulation, instead of the ones from the bias files
+
+        Args:
+            driver (base_driver): the driver that needs to get calibrated
+            sim (KiprSimulation): the simulation the driver runs in
+            turn_speed (int): the speed of every wheel while turning on the spot
+            threshold_strength (str): "SMALLER" or "BIGGER" (depends on the direction the gyro is mounted)
+
+        Returns:
+            None
+        """
+        wheel_mm_per_sec = turn_speed * sim.mm_per_tick
+        if sim.drive == sim.DIFFERENTIAL:
+            turn_rate = 2 * wheel_mm_per_sec / sim.track_width_mm
+        else:
+            turn_rate = 2 * wheel_mm_per_sec / (sim.track_width_mm + sim.wheel_base_mm)
+        driver.ONEEIGHTY_DEGREES_SECS = math.pi / turn_rate
+        driver.NINETY_DEGREES_SECS = driver.ONEEIGHTY_DEGREES_SECS / 2
+        driver.standard_axis = 'gyro_z'
+        driver.standard_axis_function = partial(IMU_SAMPLER.get_latest, 'gyro_z')
+        driver.standard_bias_gyro = self.gyro_bias
+        driver.bias_gyro_z = self.gyro_bias
+        driver.adjuster = 10
+        driver._threshold_strength = threshold_strength
+
+    def _buttons(self) -> list:
+        """
+        Creates the four buttons (digital ports 0 - 3), which never get pressed
+
+        Args:
+            None
+
+        Returns:
+            list[Digital]: front right, front left, back right, back left
+        """
+        return [Digital(port) for port in range(4)]
+
+    def _two(self):
+        """
+        Creates a Solarbotic_Wheels_two robot with buttons, light sensors and a distance sensor in a fresh simulation
+
+        Args:
+            None
+
+        Returns:
+            tuple[Solarbotic_Wheels_two, KiprSimulation]
+        """
+        sim = self._install(kipr_sim.KiprSimulation.DIFFERENTIAL, self.TWO_WHEEL_PORTS)
+        offset = self.LIGHT_SENSOR_OFFSET_MM
+
+        def light(direction):
+            def value(s):
+                sensor_y = s.y_mm + direction * offset * math.sin(s.heading)
+                return 3000 if abs(sensor_y) <= self.LINE_WIDTH_MM / 2 else 300
+            return value
+
+        sim.set_analog(0, light(1))
+        sim.set_analog(1, light(-1))
+        sim.set_analog(2, lambda s: int(interp1d(DISTANCE_MM, DISTANCE_VALUES, fill_value=(DISTANCE_VALUES[0], DISTANCE_VALUES[-1]), bounds_error=False)(self.WALL_MM - s.x_mm)))
+
+        left = WheelR(self.TWO_WHEEL_PORTS[0], default_speed=self.speed)
+        right = WheelR(self.TWO_WHEEL_PORTS[1], default_speed=self.speed)
+        button_fr, button_fl, button_br, button_bl = self._buttons()
+        light_front = LightSensor('bench_front', 0, value_white=300, value_black=3000)
+        light_back = LightSensor('bench_back', 1, value_white=300, value_black=3000)
+        distance = DistanceSensor(2)
+        distance.values, distance.mm = list(DISTANCE_VALUES), list(DISTANCE_MM)
+        distance.lookup = interp1d(DISTANCE_VALUES, DISTANCE_MM, kind='linear', fill_value='extrapolate')
+
+        driver = Solarbotic_Wheels_two(right, left, True, DS_SPEED=self.speed,
+                                       Instance_button_front_right=button_fr, Instance_button_front_left=button_fl,
+                                       Instance_button_back_right=button_br, Instance_button_back_left=button_bl,
+                                       Instance_light_sensor_front=light_front, Instance_light_sensor_back=light_back,
+                                       Instance_distance_sensor=distance)
+        self._calibrate(driver, sim, self.speed, 'BIGGER')
+        driver.get_light_sensor_distance_sec = lambda: 2 * offset / (self.speed * sim.mm_per_tick)
+        return driver, sim
+
+    def _four(self):
+        """
+        Creates a Mecanum_Wheels_four robot in a fresh simulation
+
+        Args:
+            None
+
+        Returns:
+            tuple[Mecanum_Wheels_four, KiprSimulation]
+        """
+        sim = self._install(kipr_sim.KiprSimulation.MECANUM, self.FOUR_WHEEL_PORTS)
+        fl, fr, bl, br = [WheelR(port, default_speed=self.speed) for port in self.FOUR_WHEEL_PORTS]
+        driver = Mecanum_Wheels_four(fr, fl, bl, br, DS_SPEED=self.speed)
+        self._calibrate(driver, sim, self.speed, 'SMALLER')
+        return driver, sim
+
+    def _measure(self, name: str, driver, sim: kipr_sim.KiprSimulation, primitive, error, wheels: int = None) -> dict:
+        """
+        Runs one primitive and collects every measurement
+
+        Args:
+            name (str): the name of the scenario
+            driver (base_driver): the driver that runs the primitive
+            sim (KiprSimulation): the simulation the driver runs in
+            primitive (callable): function without arguments that runs the primitive
+            error (callable): function that gets the final pose (x_mm, y_mm, heading_degrees) and returns (heading_error, position_error)
+            wheels (int, optional): how many wheels the primitive drives per loop iteration (default: None -> every wheel of the driver)
+
+        Returns:
+            dict: every measurement of this run
+        """
+        set_speed = MOTOR_SCHEDULER.set_speed
+        set_speeds = MOTOR_SCHEDULER.set_speeds
+        wheel_updates = [0]
+
+        def counted_set_speed(port, speed):
+            wheel_updates[0] += 1
+            return set_speed(port, speed)
+
+        def counted_set_speeds(speeds):
+            wheel_updates[0] += len(speeds)
+            return set_speeds(speeds)
+
+        sim.reset()
+        KIPR_CALLS.clear()
+        MOTOR_SCHEDULER.set_speed = counted_set_speed
+        MOTOR_SCHEDULER.set_speeds = counted_set_speeds
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        thread_start = time.thread_time()
+
+        try:
+            primitive()
+        finally:
+            del MOTOR_SCHEDULER.set_speed
+            del MOTOR_SCHEDULER.set_speeds
+
+        thread_cpu = time.thread_time() - thread_start
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+        heading_error, position_error = error(sim.get_pose())
+
+        iterations = wheel_updates[0] // (wheels or len(driver.motors))  # every control loop sets the speed of every wheel once per iteration
+        calls = sum(KIPR_CALLS.values())
+        return {
+            'name': name,
+            'wall_s': wall,
+            'cpu_s': cpu,
+            'loop_cpu_s': thread_cpu,
+            'iterations': iterations,
+            'iterations_per_s': iterations / wall if wall else 0.0,
+            'kipr_calls': calls,
+            'kipr_calls_per_iteration': calls / iterations if iterations else float(calls),
+            'mav_calls': KIPR_CALLS['mav'],
+            'heading_error_deg': heading_error,
+            'position_error_mm': position_error,
+        }
+
+
+    # ======================== SCENARIOS ========================
+    def bench_two_drive_straight(self) -> dict:
+        driver, sim = self._two()
+        return self._measure('two.drive_straight', driver, sim, lambda: driver.drive_straight(self.millis),
+                             lambda pose: (pose[2], pose[1]))
+
+    def bench_two_turn_degrees(self) -> dict:
+        driver, sim = self._two()
+        return self._measure('two.turn_degrees', driver, sim, lambda: driver.turn_degrees('right', 90),
+                             lambda pose: (pose[2] + 90, math.hypot(pose[0], pose[1])))
+
+    def bench_two_drive_til_distance(self) -> dict:
+        driver, sim = self._two()
+        target = 200
+        return self._measure('two.drive_til_distance', driver, sim, lambda: driver.drive_til_distance(target),
+                             lambda pose: (pose[2], self.WALL_MM - pose[0] - target))
+
+    def bench_two_black_line(self) -> dict:
+        driver, sim = self._two()
+        return self._measure('two.black_line', driver, sim, lambda: driver.black_line(self.millis, True, pre_aligned=True),
+                             lambda pose: (pose[2], pose[1]))
+
+    def bench_four_drive_straight(self) -> dict:
+        driver, sim = self._four()
+        return self._measure('four.drive_straight', driver, sim, lambda: driver.drive_straight(self.millis),
+                             lambda pose: (pose[2], pose[1]))
+
+    def bench_four_drive_side(self) -> dict:
+        driver, sim = self._four()
+        return self._measure('four.drive_side', driver, sim, lambda: driver.drive_side('right', self.millis),
+                             lambda pose: (pose[2], pose[0]))
+
+    def bench_four_drive_diagonal(self) -> dict:
+        driver, sim = self._four()
+
+        def error(pose):
+            x, y, heading = pose
+            return heading, (x + y) / math.sqrt(2)  # distance from the line front right (45 degrees to the right)
+
+        return self._measure('four.drive_diagonal', driver, sim, lambda: driver.drive_diagonal('front', 'right', self.millis), error, wheels=2)
+
+
+    # ======================== PUBLIC METHODS =======================
+    def run(self, names: list = None) -> list:
+        """
+        Runs the wanted scenarios one after another
+
+        Args:
+            names (list[str], optional): the scenarios that should run (default: None -> every scenario)
+
+        Returns:
+            list[dict]: the measurements of every scenario
+        """
+        results = []
+        for name in names or list(self.scenarios):
+            if name not in self.scenarios:
+                log(f'Unknown scenario "{name}". Valid: {list(self.scenarios)}', in_exception=True)
+                raise ValueError(f'Unknown scenario "{name}". Valid: {list(self.scenarios)}')
+            results.append(self.scenarios[name]())
+            time.sleep(0.5)  # lets the motor scheduler shut down before the next scenario
+        return results
+
+    @staticmethod
+    def format_results(results: list) -> str:
+        """
+        Creates a table out of the measurements
+
+        Args:
+            results (list[dict]): the measurements from run()
+
+        Returns:
+            str: the table
+        """
+        header = f"{'scenario':<24}{'iter/s':>10}{'k/iter':>10}{'mav':>10}{'cpu s':>8}{'loop cpu':>10}{'wall s':>8}{'head err':>10}{'pos err':>10}"
+        lines = [header, '-' * len(header)]
+        for r in results:
+            lines.append(f"{r['name']:<24}{r['iterations_per_s']:>10.0f}{r['kipr_calls_per_iteration']:>10.1f}{r['mav_calls']:>10}"
+                         f"{r['cpu_s']:>8.2f}{r['loop_cpu_s']:>10.2f}{r['wall_s']:>8.2f}"
+                         f"{r['heading_error_deg']:>9.2f}°{r['position_error_mm']:>8.1f}mm")
+        return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of the driveR control loops against the simulated _kipr module')
+    parser.add_argument('scenarios', nargs='*', help='scenarios to run (default: all)')
+    parser.add_argument('--millis', type=int, default=2000, help='duration of the time based primitives')
+    parser.add_argument('--speed', type=int, default=1000, help='default speed of the robot')
+    parser.add_argument('--gyro-noise', type=float, default=2.0, help='standard deviation of the gyro noise')
+    parser.add_argument('--seed', type=int, default=42, help='seed of the noise')
+    parser.add_argument('--acceleration', type=float, default=None, help='acceleration limit of the motors in ticks/s² (default: no ramping)')
+    parser.add_argument('--jerk', type=float, default=None, help='jerk limit of the motors in ticks/s³ (default: trapezoidal profile)')
+    args = parser.parse_args()
+
+    MOTOR_SCHEDULER.set_motion_profile(args.acceleration, args.jerk)
+    benchmark = ControlLoopBenchmark(millis=args.millis, speed=args.speed, gyro_noise=args.gyro_noise, seed=args.seed)
+    print(ControlLoopBenchmark.format_results(benchmark.run(args.scenarios)), flush=True)
+
+    MOTOR_SCHEDULER.shutdown()
+    SERVO_SCHEDULER.shutdown()
+    IMU_SAMPLER.shutdown()
+    CALIBRATION_STORE.flush()
+    shutil.rmtree(BIAS_FOLDER, ignore_errors=True)
@@ -0,0 +1,349 @@
+#!/usr/bin/python3
+import os, sys
+sys.path.append("/usr/lib")
+
+from logger import *  # selfmade
+from fileR import FileR  # selfmade
+
+# Author: Joel Kalkusch
+# Email: kalkusch.joel@gmail.com
+# Notice: feel free to write me for questions or help!
+# Date of creation: 2026-10-17
+
+try:
+    import atexit
+    import copy
+    import fcntl
+    import json
+    import threading
+except Exception as e:
+    log(f'Import Exception: {str(e)}', important=True, in_exception=True)
+
+
+BIAS_FOLDER = '/home/kipr/BotBall-data/bias_files'
+
+
+def _parse_mm_per_sec(text: str) -> list:
+    """
+    converts the old mm_per_sec.txt (mm per sec, mm and sec in three lines)
+
+    Args:
+        text (str): content of the file
+
+    Returns:
+        list: [mm per sec, mm, sec]
+    """
+    lines = text.split('\n')
+    return [float(lines[0]), int(lines[1]), float(lines[2])]
+
+
+def _parse_light_sensor_distance_sec(text: str):
+    """
+    converts the old light_sensor_distance_sec.txt ("speed sec" or "0")
+
+    Args:
+        text (str): content of the file
+
+    Returns:
+        list | None: [speed, sec] (None if it was never calibrated)
+    """
+    if text.strip() == '0':  # not initialized
+        return None
+    speed, value = text.split(' ')
+    return [int(speed), float(value)]
+
+
+def _parse_distances(text: str) -> dict:
+    """
+    converts the old distances_arr.txt ("value=..." and "mm=..." lines)
+
+    Args:
+        text (str): content of the file
+
+    Returns:
+        dict: {'value': [...], 'mm': [...]}
+    """
+    distances = {'value': [], 'mm': []}
+    for line in text.split('\n'):
+        if line.startswith('value='):
+            distances['value'] = list(map(int, line.strip().split('=')[1].split(',')))
+        elif line.startswith('mm='):
+            distances['mm'] = list(map(int, line.strip().split('=')[1].split(',')))
+    return distances
+
+
+def _parse_str(text: str) -> str:
+    """
+    converts an old text file without the line breaks around it
+
+    Args:
+        text (str): content of the file
+
+    Returns:
+        str: the text
+    """
+    return text.strip()
+
+
+class CalibrationStore:
+    FILE = 'calibration.json'
+    WRITE_DELAY = 0.5  # 500ms  -> changes get collected for this long and are written with one write afterwards
+    LEGACY_FILES = {  # key -> (old bias file, how its text gets converted) -> a key that is not in the store yet gets taken over from its old file once
+        'bias_gyro_x': ('bias_gyro_x.txt', float),
+        'bias_gyro_y': ('bias_gyro_y.txt', float),
+        'bias_gyro_z': ('bias_gyro_z.txt', float),
+        'bias_accel_x': ('bias_accel_x.txt', float),
+        'bias_accel_y': ('bias_accel_y.txt', float),
+        'bias_accel_z': ('bias_accel_z.txt', float),
+        'degrees_time': ('degrees_time.txt', float),
+        'adjuster': ('adjuster_file.txt', int),
+        'threshold_strength': ('threshold_file.txt', _parse_str),
+        'axis_importance': ('axis_importance_level.txt', _parse_str),
+        'mm_per_sec': ('mm_per_sec.txt', _parse_mm_per_sec),  # [mm per sec, mm, sec]
+        'light_sensor_distance_sec': ('light_sensor_distance_sec.txt', _parse_light_sensor_distance_sec),  # [speed, sec] or None
+        'distances': ('distances_arr.txt', _parse_distances),  # {'value': [...], 'mm': [...]}
+    }
+    LEGACY_PREFIXES = {  # keys with a variable ending (e.g. the position of a light sensor)
+        'light_sensor_white_': int,
+        'light_sensor_black_': int,
+    }
+
+    def __init__(self, folder: str = BIAS_FOLDER):
+        """
+        Not for basic users! Keeps every calibration value (bias, degrees time, mm per sec, light sensor values, ...) in memory. The values get loaded with one read of calibration.json the first time they are needed, changes get written back in the background (write-behind)
+
+        Args:
+            folder (str, optional): the folder of the calibration file (default: '/home/kipr/BotBall-data/bias_files')
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, self.FILE)
+        self._lock = threading.RLock()
+        self._values = None  # key -> value, gets loaded with the first access
+        self._missing = set()  # keys that are neither in the store nor in an old bias file
+        self._changed = set()  # keys that changed since the last write
+        self._timer = None
+        self._write_through = False  # a forked child process (multiprocessing) never runs the exit handlers, so it writes right away
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _load(self) -> None:
+        """
+        Reads the calibration file (the lock needs to be held)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._values = {}
+        self._missing = set()
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    self._values = json.load(f)
+        except Exception as e:
+            log(f'{self.path} could not be read, the old bias files get used instead: {str(e)}', important=True, in_exception=True)
+
+    def _converter(self, key: str):
+        """
+        Receive the old bias file of a key and the function that converts its text
+
+        Args:
+            key (str): name of the calibration value
+
+        Returns:
+            tuple | None: (file name, converter) (None if the key never had a bias file)
+        """
+        if key in self.LEGACY_FILES:
+            return self.LEGACY_FILES[key]
+        for prefix, converter in self.LEGACY_PREFIXES.items():
+            if key.startswith(prefix):
+                return f'{key}.txt', converter
+        return None
+
+    def _migrate(self, key: str) -> bool:
+        """
+        Takes over the value of a key from its old bias file (the lock needs to be held)
+
+        Args:
+            key (str): name of the calibration value
+
+        Returns:
+            bool: If the value got taken over (True) or there is no old value (False)
+        """
+        legacy = self._converter(key)
+        if legacy is None:
+            return False
+        file_name, converter = legacy
+        file_path = os.path.join(self.folder, file_name)
+        if not os.path.exists(file_path):
+            return False
+        try:
+            with open(file_path, 'r') as f:
+                self._values[key] = converter(f.read())
+        except Exception as e:
+            log(f'{file_path}: {str(e)}', important=True, in_exception=True)
+            return False
+        self._mark_dirty(key)
+        return True
+
+    def _mark_dirty(self, key: str) -> None:
+        """
+        Remembers that a value changed and makes sure it gets written soon (the lock needs to be held)
+
+        Args:
+            key (str): name of the calibration value
+
+        Returns:
+            None
+        """
+        self._changed.add(key)
+        if self._write_through:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.WRITE_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _reset_after_fork(self) -> None:
+        """
+        The child process gets its own lock and writes every change right away
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._lock = threading.RLock()
+        self._timer = None
+        self._write_through = True
+
+
+    # ======================== PUBLIC METHODS ========================
+    def get(self, key: str, default=None):
+        """
+        Receive a calibration value
+
+        Args:
+            key (str): name of the calibration value (e.g. 'bias_gyro_z', 'light_sensor_white_front')
+            default (any, optional): what you get if the value was never calibrated (default: None)
+
+        Returns:
+            any: the value (a copy for lists and dicts, so the store cannot get changed by accident)
+        """
+        with self._lock:
+            if self._values is None:
+                self._load()
+            if key not in self._values:
+                if key in self._missing or not self._migrate(key):
+                    self._missing.add(key)
+                    return default
+            value = self._values[key]
+        return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+    def set(self, key: str, value) -> None:
+        """
+        Change a calibration value. It is usable right away and gets written into the calibration file in the background
+
+        Args:
+            key (str): name of the calibration value
+            value (any): the new value (needs to be JSON compatible)
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._values is None:
+                self._load()
+            self._values[key] = copy.deepcopy(value)
+            self._missing.discard(key)
+            self._mark_dirty(key)
+
+    def exists(self, key: str) -> bool:
+        """
+        Lets you see if a calibration value exists
+
+        Args:
+            key (str): name of the calibration value
+
+        Returns:
+            bool: If the value exists (True) or not (False)
+        """
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def flush(self) -> None:
+        """
+        Writes every change into the calibration file right away (gets called automatically after WRITE_DELAY and at exit). Only the changed values get written into the current file, so processes that calibrate at the same time do not overwrite each other
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._changed:
+                return
+            try:
+                os.makedirs(self.folder, exist_ok=True)
+                with open(self.path + '.lock', 'a') as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)  # one process at a time
+                    values = {}
+                    if os.path.exists(self.path):
+                        try:
+                            with open(self.path, 'r') as f:
+                                values = json.load(f)
+                        except ValueError:  # broken file -> gets replaced with everything this process knows
+                            values = dict(self._values)
+                    for key in self._changed:
+                        values[key] = self._values[key]
+
+                    created = not os.path.exists(self.path)
+                    if not FileR(self.folder).writer(self.FILE, 'w', json.dumps(values, indent=4), atomic=True):  # a power cut never leaves a half written calibration file behind
+                        return
+                    if created:
+                        os.chmod(self.path, 0o666)  # every user can calibrate, the same as the bias files of bias_creater.sh
+                self._changed.clear()
+            except Exception as e:
+                log(f'{self.path}: {str(e)}', important=True, in_exception=True)
+
+    def set_folder(self, folder: str) -> None:
+        """
+        Use the calibration file (and the old bias files) of another folder, e.g. a temporary folder for the benchmark. Every change gets written into the old folder first
+
+        Args:
+            folder (str): the new folder
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.flush()
+            self.folder = folder
+            self.path = os.path.join(folder, self.FILE)
+            self._values = None  # gets loaded from the new folder with the next access
+
+    def reload(self) -> None:
+        """
+        Writes every change and reads the calibration file again (e.g. after other processes calibrated something)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.flush()
+            self._load()
+
+
+CALIBRATION_STORE = CalibrationStore()
+atexit.register(CALIBRATION_STORE.flush)
+os.register_at_fork(after_in_child=CALIBRATION_STORE._reset_after_fork)
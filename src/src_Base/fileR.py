@@ -5,6 +5,7 @@ sys.path.append("/usr/lib")
 from logger import *  # selfmade
 import threading
 import builtins
+import copy
 import pathlib
 # Author: Joel Kalkusch
 # Email: kalkusch.joel@gmail.com
@@ -12,7 +13,7 @@ import pathlib
 # Date of creation: 2025-07-28
 
 class FileR:
-	def __init__(self, base_directory: str = '/home/kipr/BotBall-data/', allowed_path_seperator: str = '/', forbidden_path_seperator: str = '\\'):
+	def __init__(self, base_directory: str = '/home/kipr/BotBall-data/', allowed_path_seperator: str = '/', forbidden_path_seperator: str = '\\', cache: bool = False):
 		"""
         Class for threadsafe file management (reading, writing, cleaning)
 
@@ -20,11 +21,14 @@ class FileR:
             base_directory (str, optional): The path at which this instance should reference all the time (default: '/home/kipr/BotBall-data/')
             allowed_path_seperator (str, optional): The string to separate paths (default: '/')
             forbidden_path_seperator (str, optional): The string that needs to be replaced if found in a path (default: '\\')
+            cache (bool, optional): If reader() should remember the converted content of every file and only read it again if the file changed (True) or always read the file (False) (default: False)
         """
 		self.allowed_path_seperator = allowed_path_seperator
 		self.forbidden_path_seperator = forbidden_path_seperator
 		self.base_directory = base_directory if base_directory.endswith(self.allowed_path_seperator) else ''.join([base_directory, self.allowed_path_seperator])
 		self._writer_lock = threading.Lock()
+		self._cache_enabled = cache
+		self._cache = {}  # file path -> (mtime_ns, size, type_name, converted content)
 
 
 	# ======================== PRIVATE METHODS =======================
@@ -84,6 +88,62 @@ class FileR:
 		return file_name
 
 
+	def _invalidate(self, file_path: str) -> None:
+		"""
+		Forgets the cached content of a file
+
+		Args:
+			file_path (str): The complete path to the file
+
+		Returns:
+			None
+		"""
+		self._cache.pop(file_path, None)
+
+
+	def _write_temp(self, file_path: str, text: str) -> str:
+		"""
+		Writes the text into a temporary file next to the target and makes sure the content is on the disk (fdatasync). The target itself is not touched yet
+
+		Args:
+			file_path (str): The complete path to the file that should get replaced later
+			text (str): The new content
+
+		Returns:
+			str: The path of the temporary file
+		"""
+		temp_path = f'{file_path}.{os.getpid()}.tmp'  # same folder -> os.replace() can swap it in one step
+		try:
+			with open(temp_path, 'w') as f:
+				f.write(text)
+				f.flush()
+				os.fdatasync(f.fileno())
+			if os.path.exists(file_path):
+				os.chmod(temp_path, os.stat(file_path).st_mode & 0o7777)  # keep the permissions of the old file
+		except Exception:
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+			raise
+		return temp_path
+
+
+	def _sync_directory(self, folder: str) -> None:
+		"""
+		Makes sure the renames inside of a folder are on the disk
+
+		Args:
+			folder (str): The folder
+
+		Returns:
+			None
+		"""
+		fd = os.open(folder or '.', os.O_RDONLY)
+		try:
+			os.fsync(fd)
+		finally:
+			os.close(fd)
+
+
 	# ======================== GETTER =======================
 	def get_base_directory(self) -> str:
 		"""
@@ -97,7 +157,33 @@ class FileR:
 		"""
 		return self.base_directory
 
+	def is_cache_enabled(self) -> bool:
+		"""
+		Lets you see if reader() caches the content of the files
+
+		Args:
+			None
+
+		Returns:
+			bool: If the cache is used (True) or not (False)
+		"""
+		return self._cache_enabled
+
 	# ======================== SETTER =======================
+	def set_cache(self, enabled: bool) -> None:
+		"""
+		Turns the cache of reader() on or off (turning it off also forgets everything that got cached)
+
+		Args:
+			enabled (bool): If the cache should be used (True) or not (False)
+
+		Returns:
+			None
+		"""
+		self._cache_enabled = enabled
+		if not enabled:
+			self._cache.clear()
+
 	def set_base_directory(self, path: str) -> None:
 		"""
 		Set a new base path which this instance should reference all the time
@@ -141,24 +227,35 @@ class FileR:
 
 	def reader(self, file_name: str, type_name: str = 'str'):
 		"""
-        read the content of a file
+        read the content of a file. With the cache turned on, the file only gets read again if its modification time or size changed (one os.stat instead of opening and converting it)
 
         Args:
             file_name (str): the file (and/or path) to the desired file
             type_name (str, optional): the type of value which you want to get returned
 
         Returns:
-            content of the file
+            content of the file (a copy for lists, dicts, sets and bytearrays, so the cache cannot get changed by accident)
         """
 		file_path = self._build_file_path(file_name)
 		try:
-			with open(file_path, 'r') as f:
-				text = f.read()
-				return getattr(builtins, type_name)(text)
+			if not self._cache_enabled:
+				with open(file_path, 'r') as f:
+					return getattr(builtins, type_name)(f.read())
+
+			stat = os.stat(file_path)
+			cached = self._cache.get(file_path)
+			if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size and cached[2] == type_name:
+				value = cached[3]
+			else:
+				with open(file_path, 'r') as f:
+					stat = os.fstat(f.fileno())  # the stat of exactly the content that gets read
+					value = getattr(builtins, type_name)(f.read())
+				self._cache[file_path] = (stat.st_mtime_ns, stat.st_size, type_name, value)
+			return copy.deepcopy(value) if isinstance(value, (list, dict, set, bytearray)) else value
 		except Exception as e:
 			log(file_path + ': ' + str(e), important=True, in_exception=True)
 
-	def writer(self, file_name: str, mode: str, msg: str) -> None:
+	def writer(self, file_name: str, mode: str, msg: str, atomic: bool = False) -> bool:
 		"""
         Writes / appends / ... content to a file.
 
@@ -166,20 +263,37 @@ class FileR:
             file_name (str): the file (and/or path) to the desired file
             mode (str): the mode in which the file should be opened.See (for example) this website for more information: https://www.freecodecamp.org/news/file-handling-in-python
             msg (str): the message that needs to get into the file
+            atomic (bool, optional): If the file should get replaced in one step, so a power cut leaves either the old or the new content behind but never an empty file (True) or written in place (False). Only works with mode 'w', every other mode writes nothing and returns False (default: False)
 
         See Also:
         	https://www.freecodecamp.org/news/file-handling-in-python
 
         Returns:
-            None
+            bool: If the content got written (True) or not (False)
     	"""
+		if atomic and mode != 'w':
+			log(f'atomic writes only work with mode "w", not "{mode}"', in_exception=True)
+			return False
+
+		temp_path = None
 		try:
 			file_path = self._build_file_path(file_name)
 			with self._writer_lock:
-				with open(file_path, mode) as f:
-					f.write(str(msg))
+				if atomic:
+					temp_path = self._write_temp(file_path, str(msg))
+					os.replace(temp_path, file_path)
+					temp_path = None
+					self._sync_directory(os.path.dirname(file_path))
+				else:
+					with open(file_path, mode) as f:
+						f.write(str(msg))
+				self._invalidate(file_path)
+			return True
 		except Exception as e:
 			log(str(e), important=True, in_exception=True)
+			if temp_path is not None and os.path.exists(temp_path):
+				os.remove(temp_path)
+			return False
 
 	def cleaner(self, file_name: str) -> None:
 		"""
@@ -194,6 +308,7 @@ class FileR:
 		try:
 			file_path = self._build_file_path(file_name)
 			open(file_path, 'w').close()
+			self._invalidate(file_path)
 		except Exception as e:
 			log(str(e), important=True, in_exception=True)
 
@@ -213,6 +328,7 @@ class FileR:
 			return
 
 		os.remove(file_path)
+		self._invalidate(file_path)
 		log(f'Successfully removed file: {file_path}')
 
 	def transfer(self, from_file: str, to_file: str, create_to_transfer_file: bool = False) -> None:
@@ -0,0 +1,561 @@
+#!/usr/bin/python3
+import sys
+sys.path.append("/usr/lib")
+
+from logger import *  # selfmade
+
+# Author: Joel Kalkusch
+# Email: kalkusch.joel@gmail.com
+# Notice: feel free to write me for questions or help!
+# Date of creation: 2026-10-17
+
+try:
+    import math
+    import random
+    import threading
+    import time
+except Exception as e:
+    log(f'Import Exception: {str(e)}', important=True, in_exception=True)
+
+
+AXES = ('x', 'y', 'z')
+
+
+class KiprSimulation:
+    DIFFERENTIAL = 'differential'
+    MECANUM = 'mecanum'
+    MAX_STEP = 0.001  # 1ms  -> biggest time step the physics get integrated with
+
+    def __init__(self,
+                 drive: str = DIFFERENTIAL,
+                 motor_ports: tuple = (0, 1),
+                 wheel_diameter_mm: float = 70,
+                 ticks_per_revolution: int = 1500,
+                 track_width_mm: float = 150,
+                 wheel_base_mm: float = 150,
+                 motor_time_constant: float = 0.05,
+                 freeze_time_constant: float = 0.01,
+                 up_axis: str = 'z',
+                 gyro_scale: float = 8.0,
+                 accel_scale: float = 512.0,
+                 gyro_bias: dict = None,
+                 accel_bias: dict = None,
+                 gyro_noise: float = 0.0,
+                 accel_noise: float = 0.0,
+                 servo_speed: float = 1500.0,
+                 time_scale: float = 1.0,
+                 real_sleep: bool = False,
+                 seed: int = None):
+        """
+        Not for basic users! Simulated replacement of the _kipr module, so the library can run (and get profiled) without a wombat. Motors, wheel counters, the IMU, servos and the analog / digital ports are modelled.
+
+        Args:
+            drive (str, optional): "differential" (two wheels) or "mecanum" (four wheels) (default: "differential")
+            motor_ports (tuple, optional): differential: (left_port, right_port); mecanum: (fl_port, fr_port, bl_port, br_port) (default: (0, 1))
+            wheel_diameter_mm (float, optional): diameter of every wheel in mm (default: 70)
+            ticks_per_revolution (int, optional): motor position counter ticks for one wheel revolution (default: 1500)
+            track_width_mm (float, optional): distance between the left and right wheels in mm (default: 150)
+            wheel_base_mm (float, optional): distance between the front and rear wheels in mm (only mecanum) (default: 150)
+            motor_time_constant (float, optional): time constant (in seconds) of how fast a motor reaches the commanded velocity (default: 0.05)
+            freeze_time_constant (float, optional): time constant (in seconds) of how fast a frozen motor comes to a halt (default: 0.01)
+            up_axis (str, optional): the axis of the controller that points upwards ("x", "y" or "z"). This axis gets gravity and the yaw rate (default: "z")
+            gyro_scale (float, optional): raw gyro units per degree per second (default: 8.0)
+            accel_scale (float, optional): raw accelerometer units per g (default: 512.0)
+            gyro_bias (dict, optional): raw bias per axis, e.g. {'z': 3.5} (default: None -> no bias)
+            accel_bias (dict, optional): raw bias per axis, e.g. {'x': -12} (default: None -> no bias)
+            gyro_noise (float, optional): standard deviation of the raw gyro noise (default: 0.0)
+            accel_noise (float, optional): standard deviation of the raw accelerometer noise (default: 0.0)
+            servo_speed (float, optional): how many servo ticks per second a servo travels (default: 1500.0)
+            time_scale (float, optional): how fast the simulated clock runs compared to the real clock (default: 1.0)
+            real_sleep (bool, optional): If msleep should really sleep (True) or only advance the simulated clock (False -> faster than real time) (default: False)
+            seed (int, optional): seed for the noise, so runs can be repeated (default: None)
+        """
+        if drive not in (self.DIFFERENTIAL, self.MECANUM):
+            log(f'drive can only be "{self.DIFFERENTIAL}" or "{self.MECANUM}"', in_exception=True)
+            raise ValueError(f'drive can only be "{self.DIFFERENTIAL}" or "{self.MECANUM}"')
+
+        needed_ports = 2 if drive == self.DIFFERENTIAL else 4
+        if len(motor_ports) != needed_ports:
+            log(f'A {drive} drive needs exactly {needed_ports} motor ports', in_exception=True)
+            raise ValueError(f'A {drive} drive needs exactly {needed_ports} motor ports')
+
+        if up_axis not in AXES:
+            log(f'up_axis can only be one of {AXES}', in_exception=True)
+            raise ValueError(f'up_axis can only be one of {AXES}')
+
+        self.drive = drive
+        self.motor_ports = tuple(motor_ports)
+        self.mm_per_tick = math.pi * wheel_diameter_mm / ticks_per_revolution
+        self.track_width_mm = track_width_mm
+        self.wheel_base_mm = wheel_base_mm
+        self.motor_time_constant = motor_time_constant
+        self.freeze_time_constant = freeze_time_constant
+        self.up_axis = up_axis
+        self.forward_axis, self.side_axis = [axis for axis in AXES if axis != up_axis]
+        self.gyro_scale = gyro_scale
+        self.accel_scale = accel_scale
+        self.gyro_bias = {axis: 0.0 for axis in AXES}
+        self.gyro_bias.update(gyro_bias or {})
+        self.accel_bias = {axis: 0.0 for axis in AXES}
+        self.accel_bias.update(accel_bias or {})
+        self.gyro_noise = gyro_noise
+        self.accel_noise = accel_noise
+        self.servo_speed = servo_speed
+        self.time_scale = time_scale
+        self.real_sleep = real_sleep
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self.analog_ports = {}
+        self.digital_ports = {}
+        self.reset()
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _now(self) -> float:
+        """
+        Current time of the simulated clock
+
+        Args:
+            None
+
+        Returns:
+            float: simulated seconds since the last reset
+        """
+        return (time.monotonic() - self._start) * self.time_scale + self._skipped
+
+    def _wheel_speeds_mm(self) -> list:
+        """
+        Current velocity of every drive wheel, in the order of motor_ports
+
+        Args:
+            None
+
+        Returns:
+            list[float]: velocity of every wheel in mm/s
+        """
+        return [self._velocity.get(port, 0.0) * self.mm_per_tick for port in self.motor_ports]
+
+    def _body_velocity(self) -> tuple:
+        """
+        Velocity of the robot in its own frame calculated from the wheel velocities
+
+        Args:
+            None
+
+        Returns:
+            tuple[
+                float: forward velocity in mm/s
+                float: velocity to the left in mm/s
+                float: turning rate in rad/s (counter-clockwise is positive)
+            ]
+        """
+        speeds = self._wheel_speeds_mm()
+
+        if self.drive == self.DIFFERENTIAL:
+            left, right = speeds
+            return (left + right) / 2, 0.0, (right - left) / self.track_width_mm
+
+        fl, fr, bl, br = speeds
+        forward = (fl + fr + bl + br) / 4
+        left = (-fl + fr + bl - br) / 4
+        turn = (-fl + fr - bl + br) / (2 * (self.track_width_mm + self.wheel_base_mm))
+        return forward, left, turn
+
+    def _integrate(self, dt: float) -> None:
+        """
+        Moves the motors, the robot pose and the servos forward in time by one step
+
+        Args:
+            dt (float): time step in seconds
+
+        Returns:
+            None
+        """
+        for port in set(self._velocity) | set(self._command):
+            command = self._command.get(port, 0)
+            velocity = self._velocity.get(port, 0.0)
+            if command is None:  # motor is off and rolls out
+                command = 0
+                tau = self.motor_time_constant * 4
+            elif self._frozen.get(port, False):
+                tau = self.freeze_time_constant
+            else:
+                tau = self.motor_time_constant
+            velocity += (command - velocity) * (1 - math.exp(-dt / tau))
+            self._velocity[port] = velocity
+            self._position[port] = self._position.get(port, 0.0) + velocity * dt
+
+        forward, left, turn = self._body_velocity()
+        self._body_accel = ((forward - self._last_body[0]) / dt, (left - self._last_body[1]) / dt)
+        self._last_body = (forward, left)
+        self._turn_rate = turn
+
+        cos_h = math.cos(self.heading)
+        sin_h = math.sin(self.heading)
+        self.x_mm += (forward * cos_h - left * sin_h) * dt
+        self.y_mm += (forward * sin_h + left * cos_h) * dt
+        self.heading += turn * dt
+
+        for port, target in self._servo_target.items():
+            if not self._servo_enabled.get(port, False):
+                continue
+            actual = self._servo_actual.get(port, 1024.0)
+            step = self.servo_speed * dt
+            if abs(target - actual) <= step:
+                actual = float(target)
+            else:
+                actual += step if target > actual else -step
+            self._servo_actual[port] = actual
+
+    def _advance(self) -> None:
+        """
+        Brings the whole simulation up to the current simulated time
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        now = self._now()
+        remaining = now - self._last_update
+        while remaining > 0:
+            dt = min(remaining, self.MAX_STEP)
+            self._integrate(dt)
+            remaining -= dt
+        self._last_update = now
+
+    def _gyro(self, axis: str) -> int:
+        """
+        Raw value of one gyro axis
+
+        Args:
+            axis (str): "x", "y" or "z"
+
+        Returns:
+            int: raw gyro value
+        """
+        with self._lock:
+            self._advance()
+            value = self.gyro_bias[axis]
+            if axis == self.up_axis:
+                value += math.degrees(self._turn_rate) * self.gyro_scale
+            if self.gyro_noise:
+                value += self._random.gauss(0, self.gyro_noise)
+            return int(round(value))
+
+    def _accel(self, axis: str) -> int:
+        """
+        Raw value of one accelerometer axis
+
+        Args:
+            axis (str): "x", "y" or "z"
+
+        Returns:
+            int: raw accelerometer value
+        """
+        with self._lock:
+            self._advance()
+            value = self.accel_bias[axis]
+            if axis == self.up_axis:
+                value += self.accel_scale
+            elif axis == self.forward_axis:
+                value += self._body_accel[0] / 9806.65 * self.accel_scale
+            else:
+                value += self._body_accel[1] / 9806.65 * self.accel_scale
+            if self.accel_noise:
+                value += self._random.gauss(0, self.accel_noise)
+            return int(round(value))
+
+
+    # ======================== GETTER ========================
+    def get_pose(self) -> tuple:
+        """
+        Lets you see where the simulated robot is right now (starting pose is 0, 0, 0)
+
+        Args:
+            None
+
+        Returns:
+            tuple[
+                float: x position in mm (forward at the start)
+                float: y position in mm (left at the start)
+                float: heading in degrees (counter-clockwise is positive)
+            ]
+        """
+        with self._lock:
+            self._advance()
+            return self.x_mm, self.y_mm, math.degrees(self.heading)
+
+    def get_servo_actual(self, port: int) -> int:
+        """
+        Lets you see where the simulated servo physically is, not where it got commanded to
+
+        Args:
+            port (int): the servo port
+
+        Returns:
+            int: physical servo position
+        """
+        with self._lock:
+            self._advance()
+            return int(round(self._servo_actual.get(port, 1024.0)))
+
+
+    # ======================== SETTER ========================
+    def set_analog(self, port: int, value) -> None:
+        """
+        Sets what an analog port returns
+
+        Args:
+            port (int): the analog port
+            value (int | callable): either a fixed value or a function that gets the simulation and returns the value
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.analog_ports[port] = value
+
+    def set_digital(self, port: int, value) -> None:
+        """
+        Sets what a digital port returns
+
+        Args:
+            port (int): the digital port
+            value (int | bool | callable): either a fixed value or a function that gets the simulation and returns the value
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.digital_ports[port] = value
+
+
+    # ======================== PUBLIC METHODS =======================
+    def reset(self) -> None:
+        """
+        Puts the robot back to the start pose, stops every motor and restarts the simulated clock
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._start = time.monotonic()
+            self._skipped = 0.0
+            self._last_update = 0.0
+            self._command = {}
+            self._frozen = {}
+            self._velocity = {}
+            self._position = {}
+            self._counter_offset = {}
+            self._servo_target = {}
+            self._servo_actual = {}
+            self._servo_enabled = {}
+            self._body_accel = (0.0, 0.0)
+            self._last_body = (0.0, 0.0)
+            self._turn_rate = 0.0
+            self.x_mm = 0.0
+            self.y_mm = 0.0
+            self.heading = 0.0
+
+    def read_port(self, ports: dict, port: int, default: int = 0) -> int:
+        """
+        Evaluates a port model of the analog or digital ports
+
+        Args:
+            ports (dict): analog_ports or digital_ports
+            port (int): the port
+            default (int, optional): value if the port has no model (default: 0)
+
+        Returns:
+            int: value of the port
+        """
+        with self._lock:
+            self._advance()
+            model = ports.get(port, default)
+            value = model(self) if callable(model) else model
+            return int(value)
+
+    def sleep(self, millis: float) -> None:
+        """
+        Lets the simulated time pass
+
+        Args:
+            millis (float): time in milliseconds
+
+        Returns:
+            None
+        """
+        if millis <= 0:
+            return
+        if self.real_sleep:
+            time.sleep(millis / 1000 / self.time_scale)
+        else:
+            with self._lock:
+                self._skipped += millis / 1000
+
+
+SIMULATION = KiprSimulation()
+
+
+def install(**config) -> KiprSimulation:
+    """
+    Registers this module as the _kipr module. Needs to be called before any other module of the library gets imported
+
+    Args:
+        **config: every argument of KiprSimulation (default: the standard simulation)
+
+    Returns:
+        KiprSimulation: the simulation that answers every _kipr call
+    """
+    global SIMULATION
+    if config:
+        SIMULATION = KiprSimulation(**config)
+    sys.modules['_kipr'] = sys.modules[__name__]
+    return SIMULATION
+
+
+# ======================== _kipr FUNCTIONS ========================
+def seconds() -> float:
+    return SIMULATION._now()
+
+
+def millis() -> int:
+    return int(SIMULATION._now() * 1000)
+
+
+def msleep(msecs: int) -> None:
+    SIMULATION.sleep(msecs)
+
+
+def mav(port: int, velocity: int) -> None:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        SIMULATION._command[port] = max(-1500, min(1500, int(velocity)))
+        SIMULATION._frozen[port] = False
+
+
+def move_at_velocity(port: int, velocity: int) -> None:
+    mav(port, velocity)
+
+
+def motor(port: int, percent: int) -> None:
+    mav(port, int(percent * 15))
+
+
+def freeze(port: int) -> None:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        SIMULATION._command[port] = 0
+        SIMULATION._frozen[port] = True
+
+
+def off(port: int) -> None:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        SIMULATION._command[port] = None
+        SIMULATION._frozen[port] = False
+
+
+def ao() -> None:
+    with SIMULATION._lock:
+        for port in list(SIMULATION._command):
+            off(port)
+
+
+def alloff() -> None:
+    ao()
+
+
+def gmpc(port: int) -> int:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        return int(SIMULATION._position.get(port, 0.0) - SIMULATION._counter_offset.get(port, 0.0))
+
+
+def get_motor_position_counter(port: int) -> int:
+    return gmpc(port)
+
+
+def cmpc(port: int) -> None:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        SIMULATION._counter_offset[port] = SIMULATION._position.get(port, 0.0)
+
+
+def clear_motor_position_counter(port: int) -> None:
+    cmpc(port)
+
+
+def gyro_x() -> int:
+    return SIMULATION._gyro('x')
+
+
+def gyro_y() -> int:
+    return SIMULATION._gyro('y')
+
+
+def gyro_z() -> int:
+    return SIMULATION._gyro('z')
+
+
+def accel_x() -> int:
+    return SIMULATION._accel('x')
+
+
+def accel_y() -> int:
+    return SIMULATION._accel('y')
+
+
+def accel_z() -> int:
+    return SIMULATION._accel('z')
+
+
+def analog(port: int) -> int:
+    return SIMULATION.read_port(SIMULATION.analog_ports, port)
+
+
+def digital(port: int) -> int:
+    return SIMULATION.read_port(SIMULATION.digital_ports, port)
+
+
+def enable_servo(port: int) -> None:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        SIMULATION._servo_enabled[port] = True
+
+
+def disable_servo(port: int) -> None:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        SIMULATION._servo_enabled[port] = False
+
+
+def enable_servos() -> None:
+    with SIMULATION._lock:
+        for port in range(4):
+            enable_servo(port)
+
+
+def disable_servos() -> None:
+    with SIMULATION._lock:
+        for port in range(4):
+            disable_servo(port)
+
+
+def get_servo_enabled(port: int) -> int:
+    return int(SIMULATION._servo_enabled.get(port, False))
+
+
+def set_servo_position(port: int, position: int) -> None:
+    with SIMULATION._lock:
+        SIMULATION._advance()
+        SIMULATION._servo_target[port] = max(0, min(2047, int(position)))
+
+
+def get_servo_position(port: int) -> int:
+    return SIMULATION._servo_target.get(port, 1024)
@@ -0,0 +1,368 @@
+#!/usr/bin/python3
+import os, sys
+sys.path.append("/usr/lib")
+
+from logger import *  # selfmade
+
+# Author: Joel Kalkusch
+# Email: kalkusch.joel@gmail.com
+# Notice: feel free to write me for questions or help!
+# Date of creation: 2026-10-17
+
+try:
+    import atexit
+    import bisect
+    import importlib
+    import struct
+    import threading
+    import time
+    from collections import defaultdict
+    from types import ModuleType
+except Exception as e:
+    log(f'Import Exception: {str(e)}', important=True, in_exception=True)
+
+
+MAGIC = b'KTRC'
+VERSION = 1
+RECORD = struct.Struct('<dBBd')  # time since start (s), function id, port, value -> 18 bytes per call
+NO_PORT = 255
+FLUSH_SIZE = 64 * 1024  # bytes that get collected before they get written into the file
+FLUSH_INTERVAL = 0.5  # 500ms  -> the records get written at least this often, so a power cut only loses the last moment
+
+READS = ('analog', 'digital', 'gyro_x', 'gyro_y', 'gyro_z', 'accel_x', 'accel_y', 'accel_z', 'gmpc', 'get_servo_position', 'seconds')
+WRITES = ('mav', 'freeze', 'off', 'ao', 'cmpc', 'clear_motor_position_counter', 'enable_servo', 'disable_servo', 'set_servo_position')
+FUNCTIONS = READS + WRITES
+PORTLESS = ('gyro_x', 'gyro_y', 'gyro_z', 'accel_x', 'accel_y', 'accel_z', 'seconds', 'ao')
+
+
+class TraceRecorder(ModuleType):
+    def __init__(self, path: str, kipr_module: ModuleType = None):
+        """
+        Not for basic users! Stands in for the _kipr module and writes every sensor read and actuator write with a timestamp into a compact binary trace. Every other _kipr function gets passed through untouched.
+
+        Args:
+            path (str): the file the trace gets written into
+            kipr_module (ModuleType, optional): the real _kipr module (default: None -> imports _kipr)
+        """
+        super().__init__('_kipr')
+        self._kipr = kipr_module if kipr_module is not None else importlib.import_module('_kipr')
+        self._path = path
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        self._start = time.monotonic()
+        self._last_flush = self._start
+        self.records = 0
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(path, 'wb')
+        names = '\n'.join(FUNCTIONS).encode()
+        self._file.write(MAGIC + struct.pack('<BH', VERSION, len(names)) + names)
+
+        for func_id, name in enumerate(FUNCTIONS):
+            if hasattr(self._kipr, name):
+                setattr(self, name, self._wrap(func_id, name, getattr(self._kipr, name)))
+
+    def __getattr__(self, name):
+        return getattr(self._kipr, name)
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _wrap(self, func_id: int, name: str, func):
+        """
+        Creates the recording version of one _kipr function
+
+        Args:
+            func_id (int): the id of the function inside the trace
+            name (str): the name of the function
+            func (callable): the real _kipr function
+
+        Returns:
+            callable: function that calls the real function and records the call
+        """
+        is_read = name in READS
+        has_port = name not in PORTLESS
+
+        def recorded(*args):
+            result = func(*args)
+            if is_read:
+                value = result
+            else:
+                value = args[1] if len(args) > 1 else 0
+            port = args[0] if has_port and args else NO_PORT
+            self._append(func_id, port, value)
+            return result
+
+        recorded.__name__ = name
+        return recorded
+
+    def _append(self, func_id: int, port: int, value) -> None:
+        """
+        Adds one call to the trace
+
+        Args:
+            func_id (int): the id of the function inside the trace
+            port (int): the port of the call (NO_PORT if the function has no port)
+            value (int | float): the read value or the written value
+
+        Returns:
+            None
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._file is None:
+                return
+            self._buffer += RECORD.pack(now - self._start, func_id, port & 0xFF, value)
+            self.records += 1
+            if len(self._buffer) >= FLUSH_SIZE or now - self._last_flush > FLUSH_INTERVAL:
+                self._flush()
+
+    def _flush(self) -> None:
+        """
+        Writes the collected records into the file (the lock needs to be held)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            self._file.write(self._buffer)
+            self._file.flush()
+        except Exception as e:
+            log(f'Trace write Exception: {str(e)}', important=True, in_exception=True)
+        self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+
+    # ======================== PUBLIC METHODS =======================
+    def stop(self) -> None:
+        """
+        Writes everything that is left and closes the trace. Further calls still reach the real _kipr module, but they are not recorded anymore
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.close()
+            self._file = None
+        log(f'Trace with {self.records} records saved to {self._path}')
+
+
+class TraceReplay(ModuleType):
+    SEQUENCE = 'sequence'
+    TIME = 'time'
+
+    def __init__(self, path: str, mode: str = SEQUENCE, real_sleep: bool = False):
+        """
+        Not for basic users! Stands in for the _kipr module and feeds a recorded trace back into the library, so a run can be reproduced and profiled without the robot
+
+        Args:
+            path (str): the trace that should be replayed
+            mode (str, optional): "sequence" -> every read returns the next recorded value of the same function and port (exact reproduction). "time" -> every read returns the value that was recorded at the same time since the start (default: "sequence")
+            real_sleep (bool, optional): If msleep should really sleep (True) or return immediately (False) (default: False)
+        """
+        super().__init__('_kipr')
+        if mode not in (self.SEQUENCE, self.TIME):
+            log(f'mode can only be "{self.SEQUENCE}" or "{self.TIME}"', in_exception=True)
+            raise ValueError(f'mode can only be "{self.SEQUENCE}" or "{self.TIME}"')
+
+        self._mode = mode
+        self._real_sleep = real_sleep
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._values = defaultdict(list)
+        self._times = defaultdict(list)
+        self._position = defaultdict(int)
+        self.recorded_writes = []
+        self.writes = []
+        self.exhausted = 0
+        self._load(path)
+
+        for name in READS:
+            setattr(self, name, self._reader(name))
+        for name in WRITES:
+            setattr(self, name, self._writer(name))
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return lambda *args: 0  # every function that is not part of the trace does nothing
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _load(self, path: str) -> None:
+        """
+        Reads the whole trace and sorts the reads by function and port
+
+        Args:
+            path (str): the trace file
+
+        Returns:
+            None
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if data[:4] != MAGIC:
+            log(f'{path} is not a trace file', in_exception=True)
+            raise ValueError(f'{path} is not a trace file')
+
+        version, names_length = struct.unpack_from('<BH', data, 4)
+        if version != VERSION:
+            log(f'Trace version {version} is not supported (supported: {VERSION})', in_exception=True)
+            raise ValueError(f'Trace version {version} is not supported (supported: {VERSION})')
+
+        offset = 4 + struct.calcsize('<BH')
+        names = data[offset:offset + names_length].decode().split('\n')
+        offset += names_length
+        usable = offset + (len(data) - offset) // RECORD.size * RECORD.size  # a cut off record at the end (power loss) gets ignored
+
+        for timestamp, func_id, port, value in RECORD.iter_unpack(data[offset:usable]):
+            name = names[func_id]
+            if name in READS:
+                self._values[(name, port)].append(value)
+                self._times[(name, port)].append(timestamp)
+            else:
+                self.recorded_writes.append((timestamp, name, port, value))
+
+    def _next_value(self, name: str, port: int):
+        """
+        Receive the value for one read depending on the replay mode
+
+        Args:
+            name (str): the read function
+            port (int): the port of the read
+
+        Returns:
+            int | float | None: the recorded value (None if the function and port got never recorded)
+        """
+        key = (name, port)
+        values = self._values.get(key)
+        if not values:
+            return None
+
+        with self._lock:
+            if self._mode == self.SEQUENCE:
+                index = self._position[key]
+                if index >= len(values):
+                    self.exhausted += 1
+                    index = len(values) - 1
+                else:
+                    self._position[key] = index + 1
+            else:
+                index = bisect.bisect_right(self._times[key], time.monotonic() - self._start) - 1
+                index = max(index, 0)
+        return values[index]
+
+    def _reader(self, name: str):
+        """
+        Creates the replaying version of one read function
+
+        Args:
+            name (str): the read function
+
+        Returns:
+            callable: function that returns the recorded values
+        """
+        has_port = name not in PORTLESS
+        as_float = name == 'seconds'
+
+        def read(*args):
+            value = self._next_value(name, args[0] & 0xFF if has_port and args else NO_PORT)
+            if value is None:
+                return time.monotonic() - self._start if as_float else 0
+            return value if as_float else int(value)
+
+        read.__name__ = name
+        return read
+
+    def _writer(self, name: str):
+        """
+        Creates the replaying version of one write function, which only remembers the write
+
+        Args:
+            name (str): the write function
+
+        Returns:
+            callable: function that remembers the write
+        """
+        has_port = name not in PORTLESS
+
+        def write(*args):
+            port = args[0] & 0xFF if has_port and args else NO_PORT
+            value = args[1] if len(args) > 1 else 0
+            with self._lock:
+                self.writes.append((time.monotonic() - self._start, name, port, value))
+
+        write.__name__ = name
+        return write
+
+
+    # ======================== PUBLIC METHODS =======================
+    def msleep(self, msecs: int) -> None:
+        if self._real_sleep and msecs > 0:
+            time.sleep(msecs / 1000)
+
+    def millis(self) -> int:
+        return int(self.seconds() * 1000)
+
+    def first_divergence(self):
+        """
+        Compares the writes of the replay with the recorded writes (without the timestamps)
+
+        Args:
+            None
+
+        Returns:
+            int | None: index of the first write that differs from the recording (None if every write is the same)
+        """
+        recorded = [write[1:] for write in self.recorded_writes]
+        replayed = [write[1:] for write in self.writes]
+        for index, (a, b) in enumerate(zip(recorded, replayed)):
+            if a != b:
+                return index
+        if len(recorded) != len(replayed):
+            return min(len(recorded), len(replayed))
+        return None
+
+
+def record(path: str) -> TraceRecorder:
+    """
+    Starts recording every _kipr sensor read and actuator write. Needs to be called before any other module of the library gets imported
+
+    Args:
+        path (str): the file the trace gets written into
+
+    Returns:
+        TraceRecorder: the recorder (call stop() to finish, otherwise it gets finished at exit)
+    """
+    recorder = TraceRecorder(path)
+    sys.modules['_kipr'] = recorder
+    atexit.register(recorder.stop)
+    return recorder
+
+
+def replay(path: str, mode: str = TraceReplay.SEQUENCE, real_sleep: bool = False) -> TraceReplay:
+    """
+    Replaces the _kipr module with a replay of a recorded trace. Needs to be called before any other module of the library gets imported
+
+    Args:
+        path (str): the trace that should be replayed
+        mode (str, optional): "sequence" or "time" (see TraceReplay) (default: "sequence")
+        real_sleep (bool, optional): If msleep should really sleep (default: False)
+
+    Returns:
+        TraceReplay: the replay backend
+    """
+    backend = TraceReplay(path, mode, real_sleep)
+    sys.modules['_kipr'] = backend
+    return backend
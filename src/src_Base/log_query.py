@@ -0,0 +1,228 @@
+#!/usr/bin/python3
+import os, sys
+sys.path.append("/usr/lib")
+
+# Author: Joel Kalkusch
+# Email: kalkusch.joel@gmail.com
+# Notice: feel free to write me for questions or help!
+# Date of creation: 2026-10-17
+
+from logger import *  # selfmade
+
+try:
+    import argparse
+    import bisect
+    import json
+    import mmap
+    import re
+except Exception as e:
+    log(f'Import Exception: {str(e)}', important=True, in_exception=True)
+
+
+BLOCK_SIZE = 64 * 1024  # 64KB  -> one index entry per block, blocks without a wanted level get skipped without parsing a single line
+LEVELS = ('DEBUG', 'INFO', 'WARN', 'ERROR', 'EXCEPTION')
+
+
+class LogIndex:
+    def __init__(self, path: str, block_size: int = BLOCK_SIZE):
+        """
+        Memory maps a log file that got written with set_log_format(JSON) and builds a sparse index over it (first time and contained levels of every block), so filtering a big log only parses the blocks that can match
+
+        Args:
+            path (str): the log file
+            block_size (int, optional): bytes per index entry (default: 64KB)
+        """
+        self.path = path
+        self._block_size = block_size
+        self._offsets = []  # byte offset where each block starts (always at the start of a line)
+        self._times = []  # time of the first entry of each block
+        self._levels = []  # bitmask of the levels that appear in each block
+        self.after_found = False  # if the "after" message of the last query() got found
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(path) > 0 else b''
+        self._build()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _build(self) -> None:
+        """
+        Splits the file into blocks and remembers the first time and the levels of every block. Only the first line of a block gets parsed, the levels get found with a plain byte search
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        size = len(self._map)
+        patterns = [f'"level": "{level}"'.encode() for level in LEVELS]
+        offset = 0
+        while offset < size:
+            end = self._line_start(offset + self._block_size)
+            newline = self._map.find(b'\n', offset, end)
+            first = self._parse(self._map[offset:newline if newline != -1 else end])
+            mask = 0
+            for bit, pattern in enumerate(patterns):
+                if self._map.find(pattern, offset, end) != -1:
+                    mask |= 1 << bit
+            self._offsets.append(offset)
+            self._times.append(first['time'] if first else (self._times[-1] if self._times else ''))
+            self._levels.append(mask)
+            offset = end
+
+    def _line_start(self, offset: int) -> int:
+        """
+        Receive the start of the first line at or after an offset
+
+        Args:
+            offset (int): byte offset
+
+        Returns:
+            int: byte offset of the line start (the file size if there is none)
+        """
+        size = len(self._map)
+        if offset >= size:
+            return size
+        newline = self._map.find(b'\n', offset - 1)
+        return size if newline == -1 else newline + 1
+
+    @staticmethod
+    def _parse(line: bytes) -> dict:
+        """
+        Parses one line of the log file
+
+        Args:
+            line (bytes): the line
+
+        Returns:
+            dict | None: the entry (None if the line is not a JSON entry, e.g. a text entry from before set_log_format())
+        """
+        if not line.startswith(b'{'):
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+
+    # ======================== PUBLIC METHODS ========================
+    def query(self, since: str = None, until: str = None, levels: list = None, class_name: str = None, function: str = None, thread: str = None, contains: str = None, after: str = None):
+        """
+        Receive every entry that matches all given filters
+
+        Args:
+            since (str, optional): earliest time, a prefix is enough, e.g. "2026-10-17 14:05" (default: None -> from the start)
+            until (str, optional): latest time, a prefix is enough (default: None -> until the end)
+            levels (list, optional): wanted levels, e.g. ["EXCEPTION", "WARN"] (default: None -> every level)
+            class_name (str, optional): only entries from this class (default: None)
+            function (str, optional): only entries from this function (default: None)
+            thread (str, optional): only entries from this thread (default: None)
+            contains (str, optional): regular expression that has to appear in the message (default: None)
+            after (str, optional): regular expression, only entries after the first entry whose message matches it (default: None)
+
+        Returns:
+            generator: the matching entries (dicts)
+        """
+        mask = 0
+        if levels:
+            for level in levels:
+                if level not in LEVELS:
+                    log(f'{level} is not a valid level. Valid: {list(LEVELS)}', in_exception=True)
+                    raise ValueError(f'{level} is not a valid level. Valid: {list(LEVELS)}')
+                mask |= 1 << LEVELS.index(level)
+        contains = re.compile(contains) if contains else None
+        after = re.compile(after) if after else None
+        self.after_found = after is None
+        until_key = until + '\uffff' if until else None  # "14:05" includes everything inside of 14:05
+
+        block = max(bisect.bisect_right(self._times, since) - 1, 0) if since else 0
+        for index in range(block, len(self._offsets)):
+            if until_key and self._times[index] > until_key:
+                break
+            if mask and not self._levels[index] & mask and after is None:
+                continue
+
+            start = self._offsets[index]
+            end = self._offsets[index + 1] if index + 1 < len(self._offsets) else len(self._map)
+            for line in self._map[start:end].splitlines():
+                entry = self._parse(line)
+                if entry is None:
+                    continue
+                if after is not None:
+                    if after.search(entry['message']):
+                        after = None
+                        self.after_found = True
+                    continue
+                if since and entry['time'] < since:
+                    continue
+                if until_key and entry['time'] > until_key:
+                    return
+                if levels and entry['level'] not in levels:
+                    continue
+                if class_name and entry['class'] != class_name:
+                    continue
+                if function and entry['function'] != function:
+                    continue
+                if thread and entry['thread'] != thread:
+                    continue
+                if contains and not contains.search(entry['message']):
+                    continue
+                yield entry
+
+    def close(self) -> None:
+        """
+        Closes the memory map and the file
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    @staticmethod
+    def format_entry(entry: dict) -> str:
+        """
+        Receive an entry as one readable line
+
+        Args:
+            entry (dict): the entry
+
+        Returns:
+            str: the line
+        """
+        location = f"{entry['class']}.{entry['function']}" if entry['class'] else f"{entry['file']}.{entry['function']}"
+        return f"{entry['time']} [{location}] [{entry['thread']}] - [{entry['level']}] {entry['message']}"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Filters log files that got written with set_log_format(JSON)')
+    parser.add_argument('files', nargs='*', default=[LOG_FILE], help='log files, oldest first (default: the current log file)')
+    parser.add_argument('--since', help='earliest time, a prefix is enough (e.g. "2026-10-17 14:05")')
+    parser.add_argument('--until', help='latest time, a prefix is enough')
+    parser.add_argument('--level', action='append', choices=LEVELS, help='wanted level (can be given more than once)')
+    parser.add_argument('--class', dest='class_name', help='only entries from this class')
+    parser.add_argument('--function', help='only entries from this function')
+    parser.add_argument('--thread', help='only entries from this thread')
+    parser.add_argument('--contains', help='regular expression that has to appear in the message')
+    parser.add_argument('--after', help='regular expression, only entries after the first message that matches it')
+    parser.add_argument('--json', action='store_true', help='print the entries as JSON lines')
+    args = parser.parse_args()
+
+    set_log_level(WARN)  # the tool itself should not fill the log file
+    after = args.after
+    for path in args.files:
+        with LogIndex(path) as index:
+            for entry in index.query(args.since, args.until, args.level, args.class_name, args.function, args.thread, args.contains, after):
+                print(json.dumps(entry, ensure_ascii=False) if args.json else LogIndex.format_entry(entry))
+            if index.after_found:
+                after = None  # the next files continue after the match
@@ -12,36 +12,166 @@ try:
     import _kipr as k
     import threading
     import time
+    import math
+    import json
+    import atexit
+    import bisect
     import inspect
-    from collections import defaultdict
     from stop_manager import stop_manager  # selfmade
 except Exception as e:
     log(f'Import Exception: {str(e)}', important=True, in_exception=True)
 
+
+class _Histogram:
+    EDGES_MS = (0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500)  # upper edges of the buckets (everything above the last edge lands in the overflow bucket)
+
+    def __init__(self, edges: tuple = EDGES_MS):
+        """
+        Not for basic users! Histogram with a fixed amount of buckets, so recording a value never needs more memory
+
+        Args:
+            edges (tuple, optional): upper edges of the buckets in milliseconds (default: EDGES_MS)
+        """
+        self.edges = edges
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Removes every recorded value
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.counts = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """
+        Adds one value to the histogram
+
+        Args:
+            value (float): the value in milliseconds
+
+        Returns:
+            None
+        """
+        self.counts[bisect.bisect_left(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> float:
+        """
+        Receive the upper edge of the bucket that contains the percentile
+
+        Args:
+            percent (float): the percentile (0 - 100)
+
+        Returns:
+            float: upper edge of the bucket in milliseconds (at most the maximum)
+        """
+        needed = self.count * percent / 100
+        seen = 0
+        for index, amount in enumerate(self.counts):
+            seen += amount
+            if amount and seen >= needed:
+                return min(self.edges[index], self.max) if index < len(self.edges) else self.max
+        return 0.0
+
+    def summary(self) -> dict:
+        """
+        Lets you see everything that got recorded
+
+        Args:
+            None
+
+        Returns:
+            dict: {'count': int, 'mean_ms': float, 'p50_ms': float, 'p99_ms': float, 'max_ms': float, 'buckets': {'<=edge': int, ..., '>last_edge': int}}
+        """
+        buckets = {f'<={edge}': amount for edge, amount in zip(self.edges, self.counts)}
+        buckets[f'>{self.edges[-1]}'] = self.counts[-1]
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max,
+            'buckets': buckets
+        }
+
+
+class _MotorSlot:
+    __slots__ = ('owner', 'speed', 'last_update', 'output', 'rate', 'acceleration', 'jerk', 'requested')
+
+    def __init__(self):
+        """
+        Not for basic users! The command of one motor port: who owns the port, at which speed it should go and when that got requested. Gets updated in place, so changing a speed does not create anything new
+        """
+        self.owner = None
+        self.speed = 0  # target speed
+        self.last_update = 0.0
+        self.output = 0.0  # speed that currently gets written (differs from the target while ramping)
+        self.rate = 0.0  # current acceleration of the s-curve
+        self.acceleration = None
+        self.jerk = None
+        self.requested = None  # time.monotonic() of the first speed change that did not reach the loop yet
+
+
 class MotorScheduler:
     AUTO_STOP_TIMEOUT = 0.3  # 300ms  -> time after which the port will reduce its speed to 0
     AUTO_SHUTDOWN_TIMEOUT = 0.4  # 400ms  - > time after which every motor immediately will shut off when no valid ID sent a new request (it will boot up automatically again, when there is a new command)
     TIME_RECOGNIZER = 0.5  # 500ms  -> time when a new tid will be created with the same thread id
-
-    def __init__(self):
+    TICK_RATE = 500  # 500Hz  -> how often per second the loop refreshes the motors (useful: 200Hz - 1000Hz)
+    KEEP_ALIVE_INTERVAL = 0.25  # 250ms  -> time after which an unchanged speed gets written to the hardware again (None -> never)
+    MOTOR_PORTS = 4  # motor ports 0 - 3 of the wombat
+    ACCELERATION = None  # ticks/s²  -> how fast the speed may change (None -> jumps to the new speed immediately)
+    JERK = None  # ticks/s³  -> how fast the acceleration may change (None -> trapezoidal profile, otherwise s-curve profile)
+    MAX_RAMP_STEP = 0.05  # 50ms  -> longest time one ramp step may cover (after the loop was sleeping)
+
+    def __init__(self, tick_rate: int = TICK_RATE, keep_alive_interval: float = KEEP_ALIVE_INTERVAL, acceleration: float = ACCELERATION, jerk: float = JERK):
         """
         Not for basic users! Schedules every motor that makes them threadsafe. Blocks old activities so only the newest calls can use the motor
 
         Args:
-            None
+            tick_rate (int, optional): how often per second the loop refreshes the motors (default: TICK_RATE)
+            keep_alive_interval (float, optional): time (in seconds) after which an unchanged speed gets written to the hardware again (None -> only changed speeds get written) (default: KEEP_ALIVE_INTERVAL)
+            acceleration (float, optional): acceleration limit of every port in ticks/s² (None -> no ramping) (default: ACCELERATION)
+            jerk (float, optional): jerk limit of every port in ticks/s³ (None -> trapezoidal profile) (default: JERK)
         """
         self._lock = threading.RLock()
-        self._commands = {}
-        self._old_funcs = set()
+        self._slots = tuple(_MotorSlot() for _ in range(self.MOTOR_PORTS))  # port -> current owner and command
         self._running = False
         self.last_activity = None
+        self._generation = 0  # newest token that got handed out
+        self._valid_from = 0  # every token below this one is old and gets blocked
+        self._threads = threading.local()  # token and time of the last call of each thread (disappears with the thread)
         self._last_tid = None
-        self._last_valid_tid = None
-        self._all_tid = defaultdict(list)
-        self._tid_counter = 0
-        self.id_dict = {}
-        self.id_set = set()
+        self._owner_tid = None
+        self._blocked_tid = None
         self.skip_next_time_refresh = False
+        self._wake = threading.Event()
+        self._tick_period = 1 / self.TICK_RATE
+        self.set_tick_rate(tick_rate)
+        self.reset_tick_jitter()
+        self.keep_alive_interval = keep_alive_interval
+        self._written = {}  # port -> (speed, time) of the last hardware write
+        self._issued_writes = 0
+        self._suppressed_writes = 0
+        self.set_motion_profile(acceleration, jerk)
+        self._latency = _Histogram()  # set_speed -> mav
+        self._pass_period = _Histogram()  # time between two passes of the loop
+        self._auto_stops = 0
+        self._auto_shutdowns = 0
+        self._telemetry_at_exit = False
+        self._telemetry_path = None
+        self._telemetry_dumped = False  # the final dump only happens once, no matter if sys_end() or the exit handler comes first
+        atexit.register(self.dump_telemetry_at_exit)
         self._thread = threading.Thread(target=self._loop)
 
 
@@ -57,43 +187,218 @@ class MotorScheduler:
             None
         """
         self._running = True
+        self._written.clear()  # nobody knows what happened to the motors while the loop was not running
         self._thread = threading.Thread(target=self._loop)
         self._thread.start()
 
-    def _get_ID(self) -> str:
+    def _write_speed(self, port: int, speed: int, now: float) -> None:
+        """
+        Writes the speed to the motor, but only if it differs from the last written speed or the keep alive interval is over
+
+        Args:
+            port (int): the corresponding port of where the motor is plugged into
+            speed (int): the speed the motor should go
+            now (float): the current time (time.monotonic())
+
+        Returns:
+            None
+        """
+        written = self._written.get(port)
+        if written is not None and written[0] == speed and \
+                (self.keep_alive_interval is None or now - written[1] < self.keep_alive_interval):
+            self._suppressed_writes += 1
+            return
+
+        k.mav(port, speed)
+        self._written[port] = (speed, now)
+        self._issued_writes += 1
+
+    def _freeze(self, port: int) -> None:
+        """
+        Stops the motor immediately and remembers that it stands still (the lock needs to be held)
+
+        Args:
+            port (int): the corresponding port of where the motor is plugged into
+
+        Returns:
+            None
+        """
+        k.freeze(port)
+        self._written[port] = (0, time.monotonic())
+        self._issued_writes += 1
+        slot = self._slots[port]
+        slot.output = 0.0
+        slot.rate = 0.0
+
+    def _ramp(self, slot: _MotorSlot, dt: float) -> int:
+        """
+        Moves the output of a port one step towards its target speed, limited by the acceleration (trapezoidal profile) and the jerk (s-curve profile) of the port (the lock needs to be held)
+
+        Args:
+            slot (_MotorSlot): the slot of the port
+            dt (float): time (in seconds) since the last step
+
+        Returns:
+            int: the speed that should get written now
+        """
+        error = slot.speed - slot.output
+        if slot.acceleration is None or error == 0:
+            slot.output = slot.speed
+            slot.rate = 0.0
+            return slot.speed
+
+        if slot.jerk is None:
+            step = slot.acceleration * dt
+            slot.output = slot.speed if abs(error) <= step else slot.output + math.copysign(step, error)
+        else:
+            wanted = math.copysign(min(slot.acceleration, math.sqrt(2 * slot.jerk * abs(error))), error)  # accelerate less when getting close, so the acceleration is 0 when reaching the target
+            change = slot.jerk * dt
+            slot.rate += max(-change, min(change, wanted - slot.rate))
+            slot.output += slot.rate * dt
+            if (slot.speed - slot.output) * error <= 0:  # reached or passed the target
+                slot.output = slot.speed
+                slot.rate = 0.0
+        return int(round(slot.output))
+
+    def _revoke_owners(self, keep: int = None, stop: bool = True) -> bool:
+        """
+        Marks every token older than keep as old, so their commands get ignored from now on (the lock needs to be held)
+
+        Args:
+            keep (int, optional): oldest token that stays valid (default: None -> every token that got handed out so far is old)
+            stop (bool, optional): If every registered port should get stopped immediately afterwards (default: True)
+
+        Returns:
+            bool: If there was any registered port (True) or not (False)
+        """
+        self._valid_from = max(self._valid_from, self._generation + 1 if keep is None else keep)
+
+        registered = any(slot.owner is not None for slot in self._slots)
+        if registered and stop:
+            self._stop_all_internal()
+        return registered
+
+    def _refresh_activity(self, now: float) -> None:
+        """
+        Remembers the time of the latest command, unless the refresh should be skipped once (the lock needs to be held)
+
+        Args:
+            now (float): the current time (time.time())
+
+        Returns:
+            None
         """
-        Creates an ID based of the current thread ID including a counter. The counter gets increased if the same thread is called again after some time (TIME_RECOGNIZER constant)
+        if not self.skip_next_time_refresh:
+            self.last_activity = now
+        else:
+            self.skip_next_time_refresh = False
+
+    def _check_port(self, port: int, speed: int, token: int):
+        """
+        Checks if the token is allowed to set the speed of the port, without changing anything (the lock needs to be held)
 
         Args:
+            port (int): the corresponding port of where the motor is plugged into
+            speed (int): the speed the motor should go
+            token (int): token of the calling thread
+
+        Returns:
+            bool | None: If an older thread owns the port and needs to get revoked first (True), if the speed can be set right away (False) or if it is getting blocked (None)
+        """
+        if not 0 <= port < self.MOTOR_PORTS:
+            log(f'There is no motor port {port} (valid: 0 - {self.MOTOR_PORTS - 1})', in_exception=True)
+            return None
+
+        slot = self._slots[port]
+        if slot.owner == token:
+            return False
+        if slot.owner is not None and slot.owner >= self._valid_from and (slot.speed != 0 or speed != 0):
+            if slot.owner > token:  # a newer thread owns the port
+                return None
+            return True
+        return False
+
+    def _set_slot(self, port: int, speed: int, token: int, now: float) -> None:
+        """
+        Puts the speed into the slot of the port and wakes the loop if something changed (the lock needs to be held, check the port with _check_port() first)
+
+        Args:
+            port (int): the corresponding port of where the motor is plugged into
+            speed (int): the speed the motor should go
+            token (int): token of the calling thread
+            now (float): the current time (time.time())
+
+        Returns:
             None
+        """
+        slot = self._slots[port]
+        if slot.owner != token or slot.speed != speed:
+            if slot.requested is None:
+                slot.requested = time.monotonic()
+            self._wake.set()
+        slot.owner = token
+        slot.speed = speed
+        slot.last_update = now
+
+    def _apply_speeds(self, speeds: dict, token: int, now: float) -> bool:
+        """
+        Puts the speeds into the slots of the ports, but only if the token is allowed to use every one of them. Either all speeds get set or none (the lock needs to be held)
+
+        Args:
+            speeds (dict): port -> speed the motor should go
+            token (int): token of the calling thread
+            now (float): the current time (time.time())
 
         Returns:
-            str: ID consisting of {thread_id}-{counter_of_thread}
+            bool: If the values are set (True) or if they are getting blocked from being set (False)
         """
-        tid = threading.current_thread().ident
+        takes_over = False
+        for port, speed in speeds.items():
+            if 0 <= port < self.MOTOR_PORTS and self._slots[port].owner == token:  # already owned (the usual case inside of a driving loop)
+                continue
+            check = self._check_port(port, speed, token)
+            if check is None:
+                return False
+            takes_over = takes_over or check
+        if takes_over:
+            self._revoke_owners(token)  # somebody new takes over -> every older command stops (before anything new gets set)
+
+        for port, speed in speeds.items():
+            slot = self._slots[port]
+            if slot.owner == token and slot.speed == speed:  # nothing changed (the usual case inside of a driving loop)
+                slot.last_update = now
+            else:
+                self._set_slot(port, speed, token, now)
+        return True
+
+    def _get_token(self) -> int:
+        """
+        Receive the token of the calling thread. A thread gets a new (bigger) token if it calls again after some time (TIME_RECOGNIZER constant) and another thread used the motors in between. The thread which lost the motors last can not get a new token until another thread takes over
 
-        if self._last_valid_tid != tid and tid not in self.id_set and \
-                (tid not in self.id_dict or time.time() - self.id_dict[tid] > self.TIME_RECOGNIZER):
-            if tid not in self._all_tid:
-                if len(self._all_tid[tid]) == 0 or self._all_tid[tid][-1] != self._tid_counter:  # does not exist yet
-                    self._tid_counter += 1
-                    self._all_tid[tid].append(self._tid_counter)
-            elif self._all_tid[tid][-1] - 1 != self._all_tid[self._last_valid_tid][-1]:  # exists, but is not up-to-date
-                self._tid_counter += 1
-                self._all_tid[tid].append(self._tid_counter)
+        Args:
+            None
+
+        Returns:
+            int: token of the current thread (the bigger, the newer)
+        """
+        tid = threading.get_ident()
+        now = time.monotonic()
+        token = getattr(self._threads, 'token', None)
 
-            if self._last_valid_tid in self.id_set:  # free the last tid from being blocked
-                self.id_set.remove(self._last_valid_tid)
-            self._last_valid_tid = tid
-            self.id_set.add(self._last_tid)  # block last tid from entering this function
+        if token is None or (tid != self._owner_tid and tid != self._blocked_tid and now - self._threads.last_call > self.TIME_RECOGNIZER):
+            self._generation += 1
+            token = self._threads.token = self._generation
+            self._blocked_tid = self._last_tid if self._last_tid != tid else None  # block last tid from getting a new token
+            self._owner_tid = tid
 
-        self.id_dict[tid] = time.time()
+        self._threads.last_call = now
         self._last_tid = tid
-        return f'{tid}-{self._all_tid[tid][-1]}'
+        return token
 
     def _loop(self) -> None:
         """
         Loop which repeatedly calls a motor function, but only if the ID is currently available and ignores every old ID. This makes it so only the latest command will get executed.
+        The loop runs at a fixed rate (tick_rate) and sleeps in between, but wakes up immediately if a speed got changed.
 
         Args:
             None
@@ -102,32 +407,280 @@ class MotorScheduler:
             None
         """
         try:
+            next_tick = time.monotonic()
+            last_pass = None
+            woken = False
             while self._running:
-                with self._lock:
-                    commands_copy = self._commands.copy()
+                if not woken:
+                    self._record_jitter(time.monotonic() - next_tick)
 
+                with self._lock:
+                    now = time.monotonic()
+                    if last_pass is not None:
+                        self._pass_period.record((now - last_pass) * 1000)
+                    dt = min(now - last_pass, self.MAX_RAMP_STEP) if last_pass is not None else 0.0
+                    last_pass = now
+                    commands = [(slot.owner, slot.speed, slot.last_update, self._ramp(slot, dt), self._take_request(slot)) for slot in self._slots]
+
+                ramping = False
                 now = time.time()
-                for key, data in list(commands_copy.items()):
-                    port = data['port']
-                    fid = key[1]
+                for port, (owner, speed, last_update, output, requested) in enumerate(commands):
+                    if owner is None or owner < self._valid_from:
+                        continue
 
-                    if fid in self._old_funcs:
+                    if now - last_update > self.AUTO_STOP_TIMEOUT and speed != 0:
+                        self._auto_stops += 1
+                        self._stop_motor_internal(port)
                         continue
 
-                    if now - data['last_update'] > self.AUTO_STOP_TIMEOUT or data['speed'] == 0:
-                        if now - data['last_update'] > self.AUTO_STOP_TIMEOUT and data['speed'] != 0:
-                            if data['speed'] != 0:
-                                self._stop_motor_internal(port)
+                    if speed == 0 and output == 0 and self._written.get(port, (0,))[0] == 0:  # already stands still
                         continue
 
-                    k.mav(port, data['speed'])
+                    ramping = ramping or output != speed
+                    self._write_speed(port, output, time.monotonic())
+                    if requested is not None:
+                        self._latency.record((time.monotonic() - requested) * 1000)
 
-                if self.last_activity and time.time() - self.last_activity > self.AUTO_SHUTDOWN_TIMEOUT:
+                if not ramping and self.last_activity and time.time() - self.last_activity > self.AUTO_SHUTDOWN_TIMEOUT:
+                    self._auto_shutdowns += 1
                     self.shutdown()
 
+                if not woken:
+                    next_tick += self._tick_period
+                now = time.monotonic()
+                if next_tick < now:  # the pass took longer than one tick -> do not try to catch up on the missed ticks
+                    next_tick = now
+                woken = self._wake.wait(next_tick - now)
+                if woken:
+                    self._wake.clear()
+
         except Exception as e:
             log(str(e), in_exception=True)
 
+    def _take_request(self, slot: _MotorSlot):
+        """
+        Receive the time of the oldest speed change of a port that did not reach the loop yet and forget it (the lock needs to be held)
+
+        Args:
+            slot (_MotorSlot): the slot of the port
+
+        Returns:
+            float | None: time.monotonic() of the speed change (None if nothing changed)
+        """
+        requested = slot.requested
+        slot.requested = None
+        return requested
+
+    def _record_jitter(self, lateness: float) -> None:
+        """
+        Remembers how late a tick started compared to its deadline
+
+        Args:
+            lateness (float): time (in seconds) between the deadline and the actual start of the tick
+
+        Returns:
+            None
+        """
+        lateness = max(lateness, 0.0)
+        self._tick_count += 1
+        self._jitter_sum += lateness
+        self._jitter_last = lateness
+        if lateness > self._jitter_max:
+            self._jitter_max = lateness
+
+
+    # ======================== GETTER ========================
+    def get_tick_rate(self) -> float:
+        """
+        Lets you see how often per second the loop refreshes the motors
+
+        Args:
+            None
+
+        Returns:
+            float: ticks per second
+        """
+        return 1 / self._tick_period
+
+    def get_tick_jitter(self) -> dict:
+        """
+        Lets you see how late the ticks of the loop started compared to their deadline (ticks that got woken up early by a new speed are not counted)
+
+        Args:
+            None
+
+        Returns:
+            dict: {'ticks': int, 'last_ms': float, 'mean_ms': float, 'max_ms': float}
+        """
+        ticks = self._tick_count
+        return {
+            'ticks': ticks,
+            'last_ms': self._jitter_last * 1000,
+            'mean_ms': self._jitter_sum / ticks * 1000 if ticks else 0.0,
+            'max_ms': self._jitter_max * 1000
+        }
+
+
+    def get_write_counters(self) -> dict:
+        """
+        Lets you see how many motor writes reached the hardware and how many got skipped, since they would not have changed anything
+
+        Args:
+            None
+
+        Returns:
+            dict: {'issued': int, 'suppressed': int}
+        """
+        return {
+            'issued': self._issued_writes,
+            'suppressed': self._suppressed_writes
+        }
+
+
+    def get_telemetry(self) -> dict:
+        """
+        Lets you see how long a new speed needs until it reaches the motor, how often the loop really runs and how often the watchdogs fired
+
+        Args:
+            None
+
+        Returns:
+            dict: {'latency': histogram, 'pass_period': histogram, 'loop_hz': float, 'auto_stops': int, 'auto_shutdowns': int} (histogram: see _Histogram.summary())
+        """
+        with self._lock:
+            pass_period = self._pass_period.summary()
+            return {
+                'latency': self._latency.summary(),
+                'pass_period': pass_period,
+                'loop_hz': 1000 / pass_period['mean_ms'] if pass_period['mean_ms'] else 0.0,
+                'auto_stops': self._auto_stops,
+                'auto_shutdowns': self._auto_shutdowns
+            }
+
+    def get_motion_profile(self, port: int) -> dict:
+        """
+        Lets you see how the speed of a port gets ramped
+
+        Args:
+            port (int): the corresponding port of where the motor is plugged into
+
+        Returns:
+            dict: {'acceleration': float | None, 'jerk': float | None}
+        """
+        slot = self._slots[port]
+        return {
+            'acceleration': slot.acceleration,
+            'jerk': slot.jerk
+        }
+
+
+    # ======================== SETTER ========================
+    def set_tick_rate(self, tick_rate: int) -> None:
+        """
+        Change how often per second the loop refreshes the motors
+
+        Args:
+            tick_rate (int): ticks per second (useful: 200 - 1000)
+
+        Returns:
+            None
+        """
+        if tick_rate <= 0:
+            log(f'tick_rate needs to be bigger than 0, not {tick_rate}', in_exception=True)
+            raise ValueError(f'tick_rate needs to be bigger than 0, not {tick_rate}')
+        self._tick_period = 1 / tick_rate
+
+    def reset_tick_jitter(self) -> None:
+        """
+        Starts the jitter measurement from the beginning
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._tick_count = 0
+        self._jitter_sum = 0.0
+        self._jitter_last = 0.0
+        self._jitter_max = 0.0
+
+    def set_keep_alive_interval(self, keep_alive_interval: float) -> None:
+        """
+        Change after which time an unchanged speed gets written to the hardware again
+
+        Args:
+            keep_alive_interval (float): time in seconds (None -> only changed speeds get written)
+
+        Returns:
+            None
+        """
+        self.keep_alive_interval = keep_alive_interval
+
+    def reset_telemetry(self) -> None:
+        """
+        Starts the telemetry from the beginning
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._latency.reset()
+            self._pass_period.reset()
+            self._auto_stops = 0
+            self._auto_shutdowns = 0
+
+    def set_telemetry_dump(self, at_exit: bool, path: str = None) -> None:
+        """
+        Change if the telemetry gets dumped when the program ends
+
+        Args:
+            at_exit (bool): If the telemetry should get dumped at the end (True) or not (False)
+            path (str, optional): json file the telemetry gets written into (default: None -> into the log)
+
+        Returns:
+            None
+        """
+        self._telemetry_at_exit = at_exit
+        self._telemetry_path = path
+
+    def set_motion_profile(self, acceleration: float = None, jerk: float = None, port: int = None) -> None:
+        """
+        Change how the speed of a port moves towards a new speed. Without an acceleration the speed jumps immediately (like before), with an acceleration it follows a trapezoidal profile and with an additional jerk it follows an s-curve profile
+
+        Args:
+            acceleration (float, optional): maximum change of the speed in ticks/s², e.g. 3000 -> from 0 to 1500 in 0.5s (default: None -> no ramping)
+            jerk (float, optional): maximum change of the acceleration in ticks/s³ (default: None -> trapezoidal profile)
+            port (int, optional): the port which should get this profile (default: None -> every port)
+
+        Returns:
+            None
+        """
+        if (acceleration is not None and acceleration <= 0) or (jerk is not None and jerk <= 0):
+            log('acceleration and jerk need to be bigger than 0 (or None)', in_exception=True)
+            raise ValueError('acceleration and jerk need to be bigger than 0 (or None)')
+
+        with self._lock:
+            for slot in (self._slots if port is None else (self._slots[port],)):
+                slot.acceleration = acceleration
+                slot.jerk = jerk
+
+    def reset_write_counters(self) -> None:
+        """
+        Starts counting the issued and suppressed writes from the beginning
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._issued_writes = 0
+        self._suppressed_writes = 0
+
 
     # ======================== PUBLIC METHODS =======================
     def set_speed(self, port: int, speed: int) -> bool:
@@ -144,38 +697,40 @@ class MotorScheduler:
         try:
             now = time.time()
             with self._lock:
-                func_id = self._get_ID()
-                if func_id in self._old_funcs:
+                token = self._get_token()
+                if token < self._valid_from:
+                    return False
+
+                if not self._running:
+                    self._setup_loop()
+                self._refresh_activity(now)
+
+                return self._apply_speeds({port: speed}, token, now)
+        except Exception as e:
+            log(str(e), in_exception=True)
+
+    def set_speeds(self, speeds: dict) -> bool:
+        """
+        Sets the speed of multiple motors at once, so all of them get written in the same tick and the wheels can not run out of sync. The newest call has priority, no matter which kind of Thread you are in. Either every speed gets set or none of them
+
+        Args:
+            speeds (dict): port -> speed the motor should go (e.g.: {0: 1000, 3: 1000})
+
+        Returns:
+            bool: If every value is set (True) or if at least one port is getting blocked, so nothing got set (False)
+        """
+        try:
+            now = time.time()
+            with self._lock:
+                token = self._get_token()
+                if token < self._valid_from:
                     return False
 
                 if not self._running:
                     self._setup_loop()
+                self._refresh_activity(now)
 
-                key = (port, func_id)
-
-                if not self.skip_next_time_refresh:
-                    self.last_activity = now
-                else:
-                    self.skip_next_time_refresh = False
-
-                if key in self._commands:
-                    self._commands[key].update({
-                        'speed': speed,
-                        'last_update': now
-                    })
-                    return True
-                for old_key, data in list(self._commands.items()):
-                    if data['port'] == port and (data['speed'] != 0 or speed != 0):
-                        self.clear_list_internal()
-                        break
-
-                self._commands[key] = {
-                    'port': port,
-                    'speed': speed,
-                    'func_id': func_id,
-                    'last_update': now
-                }
-                return True
+                return self._apply_speeds(speeds, token, now)
         except Exception as e:
             log(str(e), in_exception=True)
 
@@ -192,11 +747,10 @@ class MotorScheduler:
         """
         try:
             with self._lock:
-                for key, data in list(self._commands.items()):
-                    if data['port'] == port:
-                        self._commands[key]['speed'] = 0
-                        k.freeze(port)
-                        break
+                slot = self._slots[port]
+                if slot.owner is not None:
+                    slot.speed = 0
+                    self._freeze(port)
         except Exception as e:
             log(str(e), in_exception=True)
 
@@ -212,14 +766,11 @@ class MotorScheduler:
         """
         try:
             with self._lock:
-                commands_copy = self._commands.copy()
-
-            for key, data in list(commands_copy.items()):
-                if data['port'] == port:
-                    with self._lock:
-                        self._commands[key]['speed'] = 0
-                    k.freeze(port)
-                    break
+                slot = self._slots[port]
+                if slot.owner is None:
+                    return
+                slot.speed = 0
+                self._freeze(port)
         except Exception as e:
             log(str(e), in_exception=True)
 
@@ -235,9 +786,10 @@ class MotorScheduler:
         """
         try:
             with self._lock:
-                for key, data in list(self._commands.items()):
-                    self._commands[key]['speed'] = 0
-                    k.freeze(data['port'])
+                for port, slot in enumerate(self._slots):
+                    if slot.owner is not None:
+                        slot.speed = 0
+                        self._freeze(port)
         except Exception as e:
             log(str(e), in_exception=True)
 
@@ -253,13 +805,54 @@ class MotorScheduler:
         """
         try:
             with self._lock:
-                for key, data in list(self._commands.items()):
-                    self.skip_next_time_refresh = True
-                    self.set_speed(data['port'], 0)
-                    k.freeze(data['port'])
+                for port, slot in enumerate(self._slots):
+                    if slot.owner is not None:
+                        self.skip_next_time_refresh = True
+                        self.set_speed(port, 0)
+                        self._freeze(port)
         except Exception as e:
             log(str(e), in_exception=True)
 
+    def dump_telemetry(self, path: str = None) -> None:
+        """
+        Writes the current telemetry (see get_telemetry()) into a json file or into the log
+
+        Args:
+            path (str, optional): json file the telemetry gets written into (default: None -> into the log)
+
+        Returns:
+            None
+        """
+        telemetry = self.get_telemetry()
+        if path is None:
+            latency = telemetry['latency']
+            log(f"MotorScheduler telemetry: latency mean {latency['mean_ms']:.2f}ms, p99 <= {latency['p99_ms']}ms, max {latency['max_ms']:.2f}ms | "
+                f"loop {telemetry['loop_hz']:.0f}Hz (max pass period {telemetry['pass_period']['max_ms']:.2f}ms) | "
+                f"auto stops: {telemetry['auto_stops']}, auto shutdowns: {telemetry['auto_shutdowns']}", important=True)
+            return
+
+        try:
+            with open(path, 'w') as f:
+                json.dump(telemetry, f, indent=4)
+        except Exception as e:
+            log(f'Telemetry Exception: {str(e)}', important=True, in_exception=True)
+
+    def dump_telemetry_at_exit(self) -> None:
+        """
+        Dumps the telemetry one final time when the program ends, if it is wanted (see set_telemetry_dump()). Gets called at exit and by stop_manager.sys_end(), but only the first call dumps
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._telemetry_dumped or not self._telemetry_at_exit:
+                return
+            self._telemetry_dumped = True
+        self.dump_telemetry(self._telemetry_path)
+
     def shutdown(self) -> None:
         """
         Lets you externally end the loop at any moment
@@ -271,6 +864,7 @@ class MotorScheduler:
             None
         """
         self._running = False
+        self._wake.set()
 
     def clear_list_internal(self) -> None:
         """
@@ -284,11 +878,7 @@ class MotorScheduler:
         """
         try:
             with self._lock:
-                if len(self._commands) != 0:
-                    for old_key, data in list(self._commands.items()):
-                        self._old_funcs.add(data['func_id'])
-
-                    self._stop_all_internal()
+                self._revoke_owners()
         except Exception as e:
             log(str(e), in_exception=True)
 
@@ -304,10 +894,7 @@ class MotorScheduler:
         """
         try:
             with self._lock:
-                if len(self._commands) != 0:
-                    for old_key, data in list(self._commands.items()):
-                        self._old_funcs.add(data['func_id'])
-
+                if self._revoke_owners(stop=False):
                     self.stop_all()
         except Exception as e:
             log(str(e), in_exception=True)
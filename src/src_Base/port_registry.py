@@ -0,0 +1,386 @@
+#!/usr/bin/python3
+import os, sys
+sys.path.append("/usr/lib")
+
+from logger import *  # selfmade
+from fileR import FileR  # selfmade
+
+# Author: Joel Kalkusch
+# Email: kalkusch.joel@gmail.com
+# Notice: feel free to write me for questions or help!
+# Date of creation: 2026-10-17
+
+try:
+    import threading
+except Exception as e:
+    log(f'Import Exception: {str(e)}', important=True, in_exception=True)
+
+
+UTIL_FOLDER = '/home/kipr/BotBall-data/util_files'
+
+
+class PortRegistry:
+    FILE = 'port_file.txt'
+    SEPERATOR = '{SEPERATOR}'  # category{SEPERATOR}name{SEPERATOR}number per line
+
+    def __init__(self, folder: str = UTIL_FOLDER):
+        """
+        Not for basic users! Keeps the entries of the port file in memory with one index per way to look them up (name, category, number, category + number), so no lookup needs to read or scan the file.
+        The file only gets read again if another process changed it, new entries get appended to it and only overwriting or removing an entry rewrites it
+
+        Args:
+            folder (str, optional): the folder of the port file (default: '/home/kipr/BotBall-data/util_files')
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, self.FILE)
+        self.file_manager = FileR(folder)
+        self._lock = threading.RLock()
+        self._signature = None  # (mtime_ns, size) of the file the indexes got built from (None -> nothing loaded)
+        self._names = {}  # name -> (number, category)
+        self._categories = {}  # category -> {name: number}
+        self._numbers = {}  # number -> {name: category}
+        self._ports = {}  # (category, number) -> name
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _stat(self):
+        """
+        Receive the signature of the port file
+
+        Args:
+            None
+
+        Returns:
+            tuple | None: (mtime_ns, size) (None if the file does not exist)
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> None:
+        """
+        Loads the port file if it changed since the last time (the lock needs to be held)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        signature = self._stat()
+        if signature != self._signature:
+            self._load(signature)
+
+    def _load(self, signature) -> None:
+        """
+        Reads the port file, builds the indexes and reports every duplicate or conflicting entry (the lock needs to be held)
+
+        Args:
+            signature (tuple | None): (mtime_ns, size) of the file before it got read
+
+        Returns:
+            None
+        """
+        self._names = {}
+        self._signature = signature
+        if signature is not None:
+            try:
+                with open(self.path, 'r') as f:
+                    lines = f.read().split('\n')
+            except Exception as e:
+                log(f'{self.path}: {str(e)}', important=True, in_exception=True)
+                lines = []
+
+            for line in lines:
+                if not line:
+                    continue
+                try:
+                    category, name, number = line.split(self.SEPERATOR)
+                    number = int(number)
+                except ValueError:
+                    log(f'{self.FILE}: broken entry "{line}" gets ignored', important=True, level=WARN)
+                    continue
+                if name in self._names:
+                    if self._names[name] == (number, category):
+                        log(f'{self.FILE}: "{name}" is saved more than once', level=WARN)
+                    else:
+                        old_number, old_category = self._names[name]
+                        log(f'{self.FILE}: "{name}" is saved as "{old_category}" #{old_number} and as "{category}" #{number}, the last one gets used', important=True, level=WARN)
+                self._names[name] = number, category
+        self._build_indexes()
+
+        for name, (number, category) in self._names.items():
+            owner = self._ports[(category, number)]
+            if owner != name:
+                log(f'{self.FILE}: "{category}" #{number} is used by "{owner}" and "{name}", "{owner}" gets used', important=True, level=WARN)
+
+    def _build_indexes(self) -> None:
+        """
+        Builds the category, number and port index out of the names (the lock needs to be held)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._categories = {}
+        self._numbers = {}
+        self._ports = {}
+        for name, (number, category) in self._names.items():
+            self._index(name, number, category)
+
+    def _index(self, name: str, number: int, category: str) -> None:
+        """
+        Adds one entry to the category, number and port index (the lock needs to be held)
+
+        Args:
+            name (str): port name
+            number (int): port number
+            category (str): category of the port
+
+        Returns:
+            None
+        """
+        self._categories.setdefault(category, {})[name] = number
+        self._numbers.setdefault(number, {})[name] = category
+        self._ports.setdefault((category, number), name)  # the first name keeps a port that is used twice
+
+    def _line(self, name: str, number: int, category: str) -> str:
+        """
+        Receive one entry the way it is written into the port file
+
+        Args:
+            name (str): port name
+            number (int): port number
+            category (str): category of the port
+
+        Returns:
+            str: the line (with line break)
+        """
+        return f'{category}{self.SEPERATOR}{name}{self.SEPERATOR}{number}\n'
+
+    def _append(self, name: str, number: int, category: str) -> None:
+        """
+        Writes a new entry at the end of the port file and adds it to the indexes (the lock needs to be held)
+
+        Args:
+            name (str): port name
+            number (int): port number
+            category (str): category of the port
+
+        Returns:
+            None
+        """
+        line = self._line(name, number, category)
+        expected_size = (self._signature[1] if self._signature else 0) + len(line.encode())
+        if not self.file_manager.writer(self.FILE, 'a', line):
+            return
+        self._names[name] = number, category
+        self._index(name, number, category)
+        signature = self._stat()
+        self._signature = signature if signature is not None and signature[1] == expected_size else None  # somebody else wrote in between -> load again next time
+
+    def _rewrite(self) -> None:
+        """
+        Replaces the port file with the entries in memory (the lock needs to be held)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        text = ''.join(self._line(name, number, category) for name, (number, category) in self._names.items())
+        self.file_manager.writer(self.FILE, 'w', text, atomic=True)
+        self._build_indexes()
+        self._signature = self._stat()
+
+
+    # ======================== GETTER ========================
+    def exists(self) -> bool:
+        """
+        Lets you see if the port file exists
+
+        Args:
+            None
+
+        Returns:
+            bool: If there is a port file (True) or not (False)
+        """
+        with self._lock:
+            self._refresh()
+            return self._signature is not None
+
+    def get_entries(self) -> dict:
+        """
+        Receive every entry
+
+        Args:
+            None
+
+        Returns:
+            dict: name -> (number, category)
+        """
+        with self._lock:
+            self._refresh()
+            return dict(self._names)
+
+    def get_by_name(self, name: str):
+        """
+        Receive the number and category of a port
+
+        Args:
+            name (str): port name
+
+        Returns:
+            tuple | None: (number, category) (None if there is no such port)
+        """
+        with self._lock:
+            self._refresh()
+            return self._names.get(name)
+
+    def get_by_category(self, category: str) -> dict:
+        """
+        Receive every port of a category
+
+        Args:
+            category (str): category of the ports
+
+        Returns:
+            dict: name -> number
+        """
+        with self._lock:
+            self._refresh()
+            return dict(self._categories.get(category, {}))
+
+    def get_by_number(self, number: int) -> dict:
+        """
+        Receive every port with a number
+
+        Args:
+            number (int): port number
+
+        Returns:
+            dict: name -> category
+        """
+        with self._lock:
+            self._refresh()
+            return dict(self._numbers.get(number, {}))
+
+    def get_by_port(self, category: str, number: int):
+        """
+        Receive the name of a port
+
+        Args:
+            category (str): category of the port
+            number (int): port number
+
+        Returns:
+            str | None: port name (None if there is no such port)
+        """
+        with self._lock:
+            self._refresh()
+            return self._ports.get((category, number))
+
+    def get_categories(self) -> set:
+        """
+        Receive every category
+
+        Args:
+            None
+
+        Returns:
+            set: all categories
+        """
+        with self._lock:
+            self._refresh()
+            return set(self._categories)
+
+    def get_names(self) -> set:
+        """
+        Receive every port name
+
+        Args:
+            None
+
+        Returns:
+            set: all names
+        """
+        with self._lock:
+            self._refresh()
+            return set(self._names)
+
+
+    # ======================== PUBLIC METHODS ========================
+    def add(self, name: str, category: str, number: int) -> bool:
+        """
+        Saves a port. A new port gets appended to the file, a port whose name or category + number already exists gets overwritten
+
+        Args:
+            name (str): unique port name
+            category (str): category of the port
+            number (int): port number
+
+        Returns:
+            bool: If the port got appended (True) or an old entry got overwritten (False)
+        """
+        with self._lock:
+            self._refresh()
+            if self._signature is None:
+                os.makedirs(self.folder, exist_ok=True)
+            if name not in self._names and (category, number) not in self._ports:
+                self._append(name, number, category)
+                return True
+
+            names = {}
+            for old_name, (old_number, old_category) in self._names.items():
+                if old_name == name or (old_category, old_number) == (category, number):
+                    names[name] = number, category
+                else:
+                    names[old_name] = old_number, old_category
+            self._names = names
+            self._rewrite()
+            return False
+
+    def remove(self, name: str = None, category: str = None, number: int = None):
+        """
+        Removes a port by its name or by its category and number. By category and number, every name that uses this port gets removed
+
+        Args:
+            name (str, optional): port name (default: None)
+            category (str, optional): category of the port (default: None)
+            number (int, optional): port number (default: None)
+
+        Returns:
+            list: (name, number, category) of every removed port (empty if there was no such port)
+        """
+        with self._lock:
+            self._refresh()
+            if name:
+                names = [name] if name in self._names else []
+            else:
+                names = [old_name for old_name, port in self._names.items() if port == (number, category)]
+            if not names:
+                return []
+            removed = [(old_name,) + self._names.pop(old_name) for old_name in names]
+            self._rewrite()
+            return removed
+
+    def reload(self) -> None:
+        """
+        Reads the port file again, even if it did not change
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._load(self._stat())
+
+
+PORT_REGISTRY = PortRegistry()
@@ -12,7 +12,6 @@ from logger import *  # selfmade
 # Date of creation: 2025-09-15
 
 try:
-    import _kipr as k
     import threading
     import uuid
     from typing import Optional
@@ -22,6 +21,8 @@ except Exception as e:
     log(f'Import Exception in WifiConnector: {str(e)}', important=True, in_exception=True)
 
 class ServoX:
+    RANGE_VELOCITY = 500  # ticks per second for every step of multi in range_to_pos()
+
     def __init__(self, port: int, max_value: int = 2047, min_value: int = 0, name: str = ''):
         """
         Class for using the servos. HINT: You can use this class for micro servos as well, just set the min and max values to fit the micro servo
@@ -119,7 +120,7 @@ class ServoX:
 
     def get_pos(self) -> int:
         """
-        The position where the servo is set at the moment
+        The position where the servo is set at the moment (comes from the scheduler, no hardware call)
 
         Args:
             None
@@ -127,10 +128,37 @@ class ServoX:
         Returns:
             int: The position of the servo
         """
-        return k.get_servo_position(self.port)
+        return SERVO_SCHEDULER.get_position(self.port)
+
+    def get_estimated_pos(self) -> int:
+        """
+        The position where the servo physically is at the moment, estimated from its travel time (more exact after calibrate_travel_time())
+
+        Args:
+            None
+
+        Returns:
+            int: The estimated position of the servo
+        """
+        return SERVO_SCHEDULER.get_estimated_position(self.port)
 
 
     # ======================== PUBLIC METHODS ========================
+    def calibrate_travel_time(self, reached, end: int, distances: tuple = (250, 500, 1000, 1500), repeats: int = 3) -> tuple:
+        """
+        Measures how fast this servo really moves and saves it, so every move only waits as long as the servo really needs (see ServoScheduler.calibrate_travel_time())
+
+        Args:
+            reached (callable): function without arguments that returns True as soon as the servo is at the end position (e.g. button.is_pressed)
+            end (int): the position where reached() becomes True
+            distances (tuple, optional): distances (in ticks) from where the servo starts (default: (250, 500, 1000, 1500))
+            repeats (int, optional): how often every distance gets measured (default: 3)
+
+        Returns:
+            tuple: (dead_ms, ms_per_tick) of the new model
+        """
+        return SERVO_SCHEDULER.calibrate_travel_time(self.port, reached, end, distances, repeats, min_value=self.min_value, max_value=self.max_value)
+
     def set_pos(self, value: int) -> None:
         """
         Sets the position of the servo
@@ -158,58 +186,120 @@ class ServoX:
         position = new_pos if self._valid_range(new_pos) else self.new_pos_val
         self._set_pos_internal(position)
 
-    def range_to_pos(self, value: int, multi: int = 2) -> None:
+    def range_to_pos(self, value: int, multi: int = 2, wait: bool = True) -> None:
         """
         Changes the position smoothly from the current position to the position given
 
         Args:
             value (int): the value where it has to be at the end of the transition
-            multi (int, optional): the multiplicative on how fast it should get (hint: the higher the multi, the faster but less smooth it gets) (default: 2)
+            multi (int, optional): the multiplicative on how fast it should get (hint: the higher the multi, the faster it gets -> multi * RANGE_VELOCITY ticks per second) (default: 2)
+            wait (bool, optional): If it should return once the servo is there (True) or immediately (False) (default: True)
 
         Returns:
             None
         """
-        curr_pos = self.get_pos()
         value = value if self._valid_range(value) else self.new_pos_val
 
         if multi < 1:
             multi = 1
 
-        if value-curr_pos < 0:
-            multi = -multi
-
-        if (curr_pos == self.max_value and multi > 0) or (curr_pos == self.min_value and multi < 0):
-            return
-
-        counter = int(multi)
-        last_pos = self.get_pos()
-        if multi > 0:
-            while self.get_pos() < value:
-                self.add_to_pos(counter)
-                if last_pos == self.get_pos():  # did not move last time
-                    counter += 1
-                elif abs(counter) != abs(multi):
-                    counter -= 1
-                last_pos = self.get_pos()
-        else:
-            while self.get_pos() > value:
-                self.add_to_pos(counter)
-                if last_pos == self.get_pos():  # did not move last time
-                    counter -= 1
-                elif abs(counter) != abs(multi):
-                    counter += 1
-                last_pos = self.get_pos()
+        SERVO_SCHEDULER.move_profile(self.port, int(value), profile=SERVO_SCHEDULER.VELOCITY, velocity=multi * self.RANGE_VELOCITY, wait=wait)
+
+    def move_to_pos(self, value: int, millis: int, profile: str = 'ease', wait: bool = True) -> None:
+        """
+        Moves the servo to the position in exactly the given time along a motion profile
 
-    def range_from_to_pos(self, interval: list, multi: int = 2) -> None:
+        Args:
+            value (int): the value where it has to be at the end of the move
+            millis (int): how long the move should take (in milliseconds)
+            profile (str, optional): "linear" (same speed the whole time) or "ease" (slow start and slow end) (default: "ease")
+            wait (bool, optional): If it should return once the servo is there (True) or immediately (False) (default: True)
+
+        Returns:
+            None
+        """
+        value = value if self._valid_range(value) else self.new_pos_val
+        SERVO_SCHEDULER.move_profile(self.port, int(value), millis=millis, profile=profile, wait=wait)
+
+    def range_from_to_pos(self, interval: list, multi: int = 2, wait: bool = True) -> None:
         """
         Changes the position smoothly from the first position in the interval to the second position in the interval
 
         Args:
             interval (list(int1, int2)): the values from where (int1 in the list) the servo has to go smoothly to (int2 in the list)
-            multi (int, optional): the multiplicative on how fast it should get (hint: the higher the multi, the faster but less smooth it gets) (default: 2)
+            multi (int, optional): the multiplicative on how fast it should get (hint: the higher the multi, the faster it gets) (default: 2)
+            wait (bool, optional): If it should return once the servo is at the second position (True) or immediately after the first position (False) (default: True)
 
         Returns:
             None
         """
         self.set_pos(interval[0])
-        self.range_to_pos(interval[1], multi)
\ No newline at end of file
+        self.range_to_pos(interval[1], multi, wait)
+
+
+class ServoGroup:
+    def __init__(self, *servos: ServoX):
+        """
+        Class for moving multiple servos together (e.g. a claw and a shovel), so all of them start and arrive at the same time
+
+        Args:
+            *servos (ServoX): the servos of the group
+        """
+        for servo in servos:
+            stop_manager.check_servo_instance(servo)
+        self.servos = servos
+        self._done = None
+
+
+    # ======================== GETTER ========================
+    def get_servos(self) -> tuple:
+        """
+        Lets you see the servos of the group
+
+        Args:
+            None
+
+        Returns:
+            tuple: every ServoX of the group
+        """
+        return self.servos
+
+
+    # ======================== PUBLIC METHODS ========================
+    def set_pos(self, *values: int, millis: int = None, profile: str = 'linear', wait: bool = True) -> bool:
+        """
+        Moves every servo of the group to its position on one shared timeline. The move takes as long as the slowest servo needs
+
+        Args:
+            *values (int): the position of every servo (same order as the servos of the group)
+            millis (int, optional): how long the move should take (default: None -> as long as the slowest servo needs)
+            profile (str, optional): "linear" or "ease" (slow start and slow end) (default: "linear")
+            wait (bool, optional): If it should return once every servo is there (True) or immediately (False) (default: True)
+
+        Returns:
+            bool: If the move got started (True) or if it is getting blocked (False)
+        """
+        if len(values) != len(self.servos):
+            log(f'{len(values)} positions given, but the group has {len(self.servos)} servos', in_exception=True)
+            raise ValueError(f'{len(values)} positions given, but the group has {len(self.servos)} servos')
+
+        targets = {}
+        for servo, value in zip(self.servos, values):
+            targets[servo.port] = int(value) if servo._valid_range(value) else servo.new_pos_val
+
+        self._done = SERVO_SCHEDULER.move_group(targets, millis, profile, wait)
+        return self._done is not None
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Waits until every servo of the last group move is done
+
+        Args:
+            timeout (float, optional): maximum time to wait in seconds (default: None -> no limit)
+
+        Returns:
+            bool: If the move is done (True) or the timeout was reached (False)
+        """
+        if self._done is None:
+            return True
+        return self._done.wait(timeout)
@@ -154,6 +154,7 @@ class StopManager:
                 log(f"Error stopping servo: {e}", important=True, in_exception=True)
         self.is_stopped = True
         log("Everything stopped!", important=True)
+        flush_log()  # the program might get killed right after the emergency stop
 
     def check_stopped(self) -> bool:
         """
@@ -196,6 +197,14 @@ class StopManager:
                 print(self.working_dir + '/src/__pycache__', flush=True)
         except Exception as e:
             log(f'Ending Exception: {str(e)}', important=True, in_exception=True)
+        try:  # os._exit() skips the exit handlers, so everything that is still in memory gets written here
+            from motor_scheduler import MOTOR_SCHEDULER  # selfmade
+            from calibration_store import CALIBRATION_STORE  # selfmade
+            MOTOR_SCHEDULER.dump_telemetry_at_exit()
+            CALIBRATION_STORE.flush()
+        except Exception as e:
+            log(f'Ending Exception: {str(e)}', important=True, in_exception=True)
+        flush_log()
         os._exit(0)
 
 
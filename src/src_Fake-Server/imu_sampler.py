@@ -0,0 +1,343 @@
+#!/usr/bin/python3
+import os, sys
+sys.path.append("/usr/lib")
+
+from logger import *  # selfmade
+
+# Author: Joel Kalkusch
+# Email: kalkusch.joel@gmail.com
+# Notice: feel free to write me for questions or help!
+# Date of creation: 2026-10-17
+
+try:
+    import _kipr as k
+    import threading
+    import time
+    from array import array
+except Exception as e:
+    log(f'ImuSampler Import Exception: {str(e)}', important=True, in_exception=True)
+
+
+class ImuSampler:
+    AXES = ('gyro_x', 'gyro_y', 'gyro_z', 'accel_x', 'accel_y', 'accel_z')
+    RATE = 200  # 200Hz  -> samples per second of all six axes
+    SIZE = 1024  # samples in the ring buffer (~5s at 200Hz), older ones get overwritten
+    AUTO_SHUTDOWN_TIMEOUT = 5  # 5s  -> time without any reader after which the thread ends (it will boot up automatically again, when somebody reads)
+    START_TIMEOUT = 0.5  # 500ms  -> maximum time a reader waits for the first sample after the thread got started
+
+    def __init__(self, rate: int = RATE, size: int = SIZE):
+        """
+        Not for basic users! One thread reads all six IMU axes at a fixed rate into a preallocated ring buffer with monotonic timestamps. Everybody who needs the gyro or accel reads from here instead of the hardware, so every consumer sees the same data and no value gets read twice
+
+        Args:
+            rate (int, optional): samples per second (default: 200)
+            size (int, optional): samples the ring buffer keeps (default: 1024)
+        """
+        self._rate = rate
+        self._size = size
+        self._times = array('d', bytes(8 * size))  # time.monotonic() of every sample
+        self._values = {axis: array('i', bytes(4 * size)) for axis in self.AXES}
+        self._count = 0  # samples written so far (the sequence number of the next sample)
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._running = False
+        self.last_activity = time.monotonic()
+        self._thread = None
+
+
+    # ======================== PRIVATE METHODS ========================
+    def _setup_loop(self) -> None:
+        """
+        Start the sampling thread and wait until the first new sample is there (the lock needs to be held)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        start = self._count
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        self._condition.wait_for(lambda: self._count > start or not self._running, self.START_TIMEOUT)
+
+    def _ensure_running(self) -> None:
+        """
+        Remembers that somebody reads and starts the sampling thread if it is not running
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.last_activity = time.monotonic()
+        if not self._running:
+            with self._condition:
+                if not self._running:
+                    self._setup_loop()
+
+    def _loop(self) -> None:
+        """
+        Loop which reads every axis once per period. Ends automatically if nobody read for some time
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        me = threading.current_thread()
+        try:
+            next_sample = time.monotonic()
+            while self._running and self._thread is me:  # a restarted sampler has a new thread -> the old one ends
+                now = time.monotonic()
+                if now - self.last_activity > self.AUTO_SHUTDOWN_TIMEOUT:
+                    break
+
+                sample = k.gyro_x(), k.gyro_y(), k.gyro_z(), k.accel_x(), k.accel_y(), k.accel_z()
+                with self._condition:
+                    index = self._count % self._size
+                    self._times[index] = now
+                    for axis, value in zip(self.AXES, sample):
+                        self._values[axis][index] = value
+                    self._count += 1
+                    self._condition.notify_all()
+
+                next_sample += 1 / self._rate
+                delay = next_sample - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_sample = time.monotonic()  # too slow -> keep the rate instead of catching up with a burst of reads
+        except Exception as e:
+            log(str(e), in_exception=True)
+        finally:
+            with self._condition:
+                if self._thread is me:
+                    self._running = False
+                self._condition.notify_all()
+
+    def _check_axis(self, axis: str) -> None:
+        """
+        Makes sure the axis exists
+
+        Args:
+            axis (str): one of AXES
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If there is no such axis
+        """
+        if axis not in self._values:
+            log(f'{axis} is not a valid axis. Valid: {list(self.AXES)}', in_exception=True)
+            raise ValueError(f'{axis} is not a valid axis. Valid: {list(self.AXES)}')
+
+    def _first(self, sequence: int) -> int:
+        """
+        Receive the oldest sequence number at or after the given one that is still in the ring buffer (the lock needs to be held)
+
+        Args:
+            sequence (int): wanted sequence number
+
+        Returns:
+            int: sequence number
+        """
+        return min(max(sequence, self._count - self._size, 0), self._count)
+
+    def _reset_after_fork(self) -> None:
+        """
+        The child process gets its own lock and starts its own thread with the first read
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._running = False
+        self._thread = None
+
+
+    # ======================== GETTER ========================
+    def get_rate(self) -> int:
+        """
+        Receive the current sampling rate
+
+        Args:
+            None
+
+        Returns:
+            int: samples per second
+        """
+        return self._rate
+
+    def get_sequence(self) -> int:
+        """
+        Receive the sequence number of the next sample. Give it to get_since() later to receive every sample that came in after this call
+
+        Args:
+            None
+
+        Returns:
+            int: sequence number
+        """
+        self._ensure_running()
+        return self._count
+
+    def get_latest(self, axis: str) -> int:
+        """
+        Receive the newest value of one axis (without touching the hardware)
+
+        Args:
+            axis (str): 'gyro_x', 'gyro_y', 'gyro_z', 'accel_x', 'accel_y' or 'accel_z'
+
+        Returns:
+            int: the value
+        """
+        self._check_axis(axis)
+        self._ensure_running()
+        return self._values[axis][(self._count - 1) % self._size]
+
+    def get_sample(self) -> tuple:
+        """
+        Receive the newest sample of every axis
+
+        Args:
+            None
+
+        Returns:
+            tuple: (time, gyro_x, gyro_y, gyro_z, accel_x, accel_y, accel_z)
+        """
+        self._ensure_running()
+        with self._lock:
+            index = (self._count - 1) % self._size
+            return (self._times[index],) + tuple(self._values[axis][index] for axis in self.AXES)
+
+    def get_since(self, sequence: int, axis: str) -> tuple:
+        """
+        Receive every value of one axis since a sequence number (samples that already got overwritten are skipped)
+
+        Args:
+            sequence (int): the sequence number of get_sequence() or of the last get_since() call
+            axis (str): 'gyro_x', 'gyro_y', 'gyro_z', 'accel_x', 'accel_y' or 'accel_z'
+
+        Returns:
+            tuple[
+                int: the sequence number for the next call
+                list: the values (oldest first)
+            ]
+        """
+        self._check_axis(axis)
+        self._ensure_running()
+        values = self._values[axis]
+        with self._lock:
+            end = self._count
+            return end, [values[index % self._size] for index in range(self._first(sequence), end)]
+
+    def get_samples_since(self, sequence: int) -> tuple:
+        """
+        Receive every sample of every axis since a sequence number (samples that already got overwritten are skipped)
+
+        Args:
+            sequence (int): the sequence number of get_sequence() or of the last get_samples_since() call
+
+        Returns:
+            tuple[
+                int: the sequence number for the next call
+                list: (time, gyro_x, gyro_y, gyro_z, accel_x, accel_y, accel_z) of every sample (oldest first)
+            ]
+        """
+        self._ensure_running()
+        columns = [self._values[axis] for axis in self.AXES]
+        with self._lock:
+            end = self._count
+            samples = []
+            for index in range(self._first(sequence), end):
+                index %= self._size
+                samples.append((self._times[index],) + tuple(column[index] for column in columns))
+            return end, samples
+
+    def get_window(self, axis: str, seconds: float) -> tuple:
+        """
+        Receive the values of one axis from the last few seconds
+
+        Args:
+            axis (str): 'gyro_x', 'gyro_y', 'gyro_z', 'accel_x', 'accel_y' or 'accel_z'
+            seconds (float): how far to look back (at most SIZE samples)
+
+        Returns:
+            tuple[
+                list: time.monotonic() of every sample (oldest first)
+                list: the values
+            ]
+        """
+        self._check_axis(axis)
+        self._ensure_running()
+        values = self._values[axis]
+        with self._lock:
+            since = time.monotonic() - seconds
+            times, result = [], []
+            for index in range(self._first(0), self._count):
+                index %= self._size
+                if self._times[index] >= since:
+                    times.append(self._times[index])
+                    result.append(values[index])
+            return times, result
+
+
+    # ======================== SETTER ========================
+    def set_rate(self, rate: int) -> None:
+        """
+        Change the sampling rate (takes effect with the next sample)
+
+        Args:
+            rate (int): samples per second
+
+        Returns:
+            None
+        """
+        if rate <= 0:
+            log(f'rate needs to be bigger than 0, not {rate}', in_exception=True)
+            raise ValueError(f'rate needs to be bigger than 0, not {rate}')
+        self._rate = rate
+
+
+    # ======================== PUBLIC METHODS ========================
+    def wait(self, sequence: int, timeout: float = None) -> bool:
+        """
+        Waits until a sample with this sequence number (or a newer one) is there, instead of polling in a tight loop
+
+        Args:
+            sequence (int): the sequence number that is wanted
+            timeout (float, optional): maximum time to wait in seconds (default: None -> no limit)
+
+        Returns:
+            bool: If the sample is there (True) or the timeout was reached (False)
+        """
+        self._ensure_running()
+        with self._condition:
+            return self._condition.wait_for(lambda: self._count > sequence or not self._running, timeout) and self._count > sequence
+
+    def shutdown(self) -> None:
+        """
+        Stop the sampling thread (it starts again with the next read)
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+
+IMU_SAMPLER = ImuSampler()
+os.register_at_fork(after_in_child=IMU_SAMPLER._reset_after_fork)
@@ -1,5 +1,5 @@
 #!/usr/bin/python3
-import os, sys
+import sys
 sys.path.append("/usr/lib")
 
 from logger import *  # selfmade
@@ -13,7 +13,7 @@ try:
     from typing import Optional
     import math
     import _kipr as k
-    from fileR import FileR  # selfmade
+    from calibration_store import CALIBRATION_STORE  # selfmade
     from analog import Analog  # selfmade
 except Exception as e:
     log(f'Import Exception: {str(e)}', important=True, in_exception=True)
@@ -38,7 +38,6 @@ class LightSensor(Analog):
         self.bias = bias
         self.std_white_file_name = 'light_sensor_white_'
         self.std_black_file_name = 'light_sensor_black_'
-        self.file_manager = FileR('/home/kipr/BotBall-data/bias_files')
         
         if self.val_white is None:
             self.val_white = self._white_load_from_file()
@@ -56,12 +55,9 @@ class LightSensor(Analog):
             None
 
         Returns:
-            int | None: If the file exists, it returns an int, otherwise it returns None
+            int | None: If it got calibrated, it returns an int, otherwise it returns None
         '''
-        file_path = os.path.join(self.std_black_file_name + self.position + '.txt')
-        if self.file_manager.exists(file_path):
-            return self.file_manager.reader(file_path, 'int')
-        return None  # You cannot raise an Exception here, since if you did not calibrate in the beginning, then you will always receive an exception
+        return CALIBRATION_STORE.get(self.std_black_file_name + self.position)  # You cannot raise an Exception here, since if you did not calibrate in the beginning, then you will always receive an exception
 
     def _white_load_from_file(self) -> Optional[int]:
         '''
@@ -71,12 +67,9 @@ class LightSensor(Analog):
             None
 
         Returns:
-            int | None: If the file exists, it returns an int, otherwise it returns None
+            int | None: If it got calibrated, it returns an int, otherwise it returns None
         '''
-        file_path = os.path.join(self.std_white_file_name + self.position + '.txt')
-        if self.file_manager.exists(file_path):
-            return int(self.file_manager.reader(file_path, 'int'))
-        return None  # You can not raise an Exception here, since if you did not calibrate in the beginning, then you will always receive an exception
+        return CALIBRATION_STORE.get(self.std_white_file_name + self.position)  # You can not raise an Exception here, since if you did not calibrate in the beginning, then you will always receive an exception
 
     def _calibrate_bias(self) -> Optional[int]:
         '''
@@ -139,12 +132,12 @@ class LightSensor(Analog):
         if measured_value is None:
             measured_value = self.current_value()
 
-        file_name = os.path.join(f'{self.std_black_file_name + self.position}.txt')
+        key = self.std_black_file_name + self.position
         try:
-            if self.file_manager.exists(file_name):
-                old_val = self.file_manager.reader(file_name, 'int')
+            old_val = CALIBRATION_STORE.get(key)
+            if old_val is not None:
                 measured_value = int(old_val * 0.25 + measured_value * 0.75)
-            self.file_manager.writer(file_name, 'w', str(measured_value))
+            CALIBRATION_STORE.set(key, measured_value)
             self.val_black = measured_value
         except Exception as e:
             log(str(e), in_exception=True)
@@ -162,12 +155,12 @@ class LightSensor(Analog):
         if measured_value is None:
             measured_value = self.current_value()
 
-        file_name = os.path.join(f'{self.std_white_file_name + self.position}.txt')
+        key = self.std_white_file_name + self.position
         try:
-            if self.file_manager.exists(file_name):
-                old_val = self.file_manager.reader(file_name, 'int')
+            old_val = CALIBRATION_STORE.get(key)
+            if old_val is not None:
                 measured_value = int(old_val * 0.25 + measured_value * 0.75)
-            self.file_manager.writer(file_name, 'w', str(measured_value))
+            CALIBRATION_STORE.set(key, measured_value)
             self.val_white = measured_value
         except Exception as e:
             log(str(e), in_exception=True)
@@ -186,9 +179,8 @@ class LightSensor(Analog):
         """
         if isinstance(self.val_black, int):
             return self.val_black
-        file_name = os.path.join(f'light_sensor_black_{self.position}.txt')
         try:
-            val = int(self.file_manager.reader(file_name))
+            val = int(CALIBRATION_STORE.get(self.std_black_file_name + self.position))
             self.val_black = val
             return val
         except Exception as e:
@@ -206,9 +198,8 @@ class LightSensor(Analog):
         """
         if isinstance(self.val_white, int):
             return self.val_white
-        file_name = os.path.join(f'light_sensor_white_{self.position}.txt')
         try:
-            val = int(self.file_manager.reader(file_name))
+            val = int(CALIBRATION_STORE.get(self.std_white_file_name + self.position))
             self.val_white = val
             return val
         except Exception as e:
@@ -227,9 +218,8 @@ class LightSensor(Analog):
         self.check_bias()
         if isinstance(self.val_black, int):
             return self.val_black - self.bias
-        file_name = os.path.join(f'light_sensor_black_{self.position}.txt')
         try:
-            val = int(self.file_manager.reader(file_name))
+            val = int(CALIBRATION_STORE.get(self.std_black_file_name + self.position))
             self.val_black = val
             return val - self.bias
         except Exception as e:
@@ -248,9 +238,8 @@ class LightSensor(Analog):
         self.check_bias()
         if isinstance(self.val_white, int):
             return self.val_white + self.bias
-        file_name = os.path.join(f'light_sensor_white_{self.position}.txt')
         try:
-            val = int(self.file_manager.reader(file_name))
+            val = int(CALIBRATION_STORE.get(self.std_white_file_name + self.position))
             self.val_white = val
             return val + self.bias
         except Exception as e:
@@ -12,12 +12,14 @@ from logger import *  # selfmade
 
 try:
     import _kipr as k
-    import inspect
     import time
     import os
+    import subprocess
     import threading
     from scipy.interpolate import interp1d
     from fileR import FileR  # selfmade
+    from port_registry import PORT_REGISTRY  # selfmade
+    from imu_sampler import IMU_SAMPLER  # selfmade
     from digital import Digital  # selfmade
     from light_sensor import LightSensor  # selfmade
     from distance_sensor import DistanceSensor  # selfmade
@@ -33,10 +35,9 @@ port_file_logable_function_name = None
 def Port_File_Logging(func):
     def wrapper(*args, **kwargs):
         global port_file_logable_function_name
-        frame = inspect.stack()[1]
-        module = inspect.getmodule(frame[0])
+        caller_file = sys._getframe(1).f_globals.get('__file__')  # inspect.stack() would read the source of every frame
 
-        if FILE_PATH != module.__file__:  # another file than this one
+        if FILE_PATH != caller_file:  # another file than this one
             port_file_logable_function_name = func.__name__  # only allow port file functions to log if they are the ones who got called
 
         result = func(*args, **kwargs)
@@ -62,9 +63,10 @@ class Util:
         self.light_sensor_start = Instance_light_sensor_start
         self.distance_sensor = Instance_distance_sensor
 
-        self.file_manager = FileR(UTIL_FOLDER)
+        self.file_manager = FileR(UTIL_FOLDER, cache=True)  # the IMU stopper files get read over and over again (the port file is in the port registry)
         self.port_file_name = 'port_file.txt'
         self.port_file_seperator = '{SEPERATOR}'
+        self.port_registry = PORT_REGISTRY  # every instance shares the same port file
         self.isClose = False
         self.running_allowed = True
 
@@ -94,60 +96,45 @@ class Util:
         counter = cat_exists + pname_exists + pnumber_exists
 
 
-        if not os.path.exists(self.file_manager.get_base_directory() + self.port_file_name):
+        if not self.port_registry.exists():
             if port_file_logable_function_name == "get_port_file_entries":
                 log('No entries created just yet', in_exception=True)
             raise FileNotFoundError('No entries created just yet')
 
-        port_names = dict()
-        entries = self.file_manager.reader(self.port_file_name).split('\n')
-
-        for entry in entries:
-            if entry:
-                cat, pname, pnumber = entry.split(self.port_file_seperator)
-                port_names[pname] = int(pnumber), cat
-
         if counter == 0:  # nothing is given -> everything is wanted
-            return port_names  # return everything
+            return self.port_registry.get_entries()  # return everything
 
         elif cat_exists and pnumber_exists:  # category and port number are given -> name is wanted
-            for name, (number, cat) in port_names.items():
-                if number == port_number and cat == category:
-                    return name
+            name = self.port_registry.get_by_port(category, port_number)
+            if name is not None:
+                return name
             if port_file_logable_function_name == "get_port_file_entries":
                 log(f'Category "{category}" with port number #{port_number}" does not exist', important=True)
 
         elif cat_exists and pname_exists:  # category and port name are given -> number is wanted
-            for name, (number, cat) in port_names.items():
-                if port_name == name and cat == category:
-                    return number
+            entry = self.port_registry.get_by_name(port_name)
+            if entry is not None and entry[1] == category:
+                return entry[0]
             if port_file_logable_function_name == "get_port_file_entries":
                 log(f'Category "{category}" with port name "{port_name}" does not exist', important=True)
 
         elif cat_exists:  # category is given -> name and numbers are wanted
-            res = dict()
-            for name, (number, cat) in port_names.items():
-                if cat == category:
-                    res[name] = number
-            return res
+            return self.port_registry.get_by_category(category)
 
         elif pnumber_exists and pname_exists:  # number and name given -> category is wanted
-            for name, (number, cat) in port_names.items():
-                if port_name == name and number == port_number:
-                    return cat
+            entry = self.port_registry.get_by_name(port_name)
+            if entry is not None and entry[0] == port_number:
+                return entry[1]
             if port_file_logable_function_name == "get_port_file_entries":
                 log(f'Port number #{port_number} with port name "{port_name}" does not exist', important=True)
 
         elif pnumber_exists:  # number is given -> category and port name is wanted
-            res = dict()
-            for name, (number, cat) in port_names.items():
-                if port_number == number:
-                    res[name] = cat
-            return res
+            return self.port_registry.get_by_number(port_number)
 
         elif pname_exists:  # name is given -> category and number is wanted
-            if port_name in list(port_names.keys()):
-                return port_names[port_name]
+            entry = self.port_registry.get_by_name(port_name)
+            if entry is not None:
+                return entry
             if port_file_logable_function_name == "get_port_file_entries":
                 log(f'Port name "{port_name}" does not exist', important=True)
 
@@ -168,20 +155,12 @@ class Util:
         Raises:
             FileNotFoundError: If there is no entry that got created
         """
-        if not self.file_manager.exists(self.port_file_name):
+        if not self.port_registry.exists():
             if port_file_logable_function_name == "get_port_file_categories":
                 log('No entries created just yet', in_exception=True)
             raise FileNotFoundError('No entries created just yet')
 
-        categories = set()
-        entries = self.file_manager.reader(self.port_file_name).split('\n')
-
-        for entry in entries:
-            if entry:
-                cat, pname, pnumber = entry.split(self.port_file_seperator)
-                categories.add(cat)
-
-        return categories
+        return self.port_registry.get_categories()
 
 
     @Port_File_Logging
@@ -200,20 +179,12 @@ class Util:
         Raises:
             FileNotFoundError: If there is no entry that got created
         """
-        if not self.file_manager.exists(self.port_file_name):
+        if not self.port_registry.exists():
             if port_file_logable_function_name == "get_port_file_names":
                 log('No entries created just yet', in_exception=True)
             raise FileNotFoundError('No entries created just yet')
 
-        names = set()
-        entries = self.file_manager.reader(self.port_file_name).split('\n')
-
-        for entry in entries:
-            if entry:
-                cat, pname, pnumber = entry.split(self.port_file_seperator)
-                names.add(pname)
-
-        return names
+        return self.port_registry.get_names()
 
     # ======================== SETTER ========================
     def set_instance_distance_sensor(self, Instance_distance_sensor: DistanceSensor) -> None:
@@ -322,12 +293,14 @@ class Util:
         """
         startTime = k.seconds()
         touched: bool = False
-        while (k.gyro_z() <= 20 and k.gyro_z() >= -20) and k.seconds() - startTime < max_waiting_millis / 1000:
+        gyro_z = IMU_SAMPLER.get_latest('gyro_z')
+        while (gyro_z <= 20 and gyro_z >= -20) and k.seconds() - startTime < max_waiting_millis / 1000:
             print(waiting_millis, flush=True)
             k.msleep(1)
             if waiting_millis > 0:
                 waiting_millis -= 1
-            if k.gyro_z() >= 20 or k.gyro_z() <= -20:  # @TODO -> check, if that is still accurate
+            gyro_z = IMU_SAMPLER.get_latest('gyro_z')
+            if gyro_z >= 20 or gyro_z <= -20:  # @TODO -> check, if that is still accurate
                 touched = True
         if touched:
             log('touched')
@@ -388,13 +361,17 @@ class Util:
 
             threading.Thread(target=look_at_file).start()
 
+            sequence = IMU_SAMPLER.get_sequence()
             while not self.IMU_stop:
-                IMU_gyro_x += k.gyro_x()
-                IMU_gyro_y += k.gyro_y()
-                IMU_gyro_z += k.gyro_z()
-                IMU_accel_x += k.accel_x()
-                IMU_accel_y += k.accel_y()
-                IMU_accel_z += k.accel_z()
+                IMU_SAMPLER.wait(sequence, 0.1)
+                sequence, samples = IMU_SAMPLER.get_samples_since(sequence)  # every sample once, no matter how fast this loop runs
+                for _, gyro_x, gyro_y, gyro_z, accel_x, accel_y, accel_z in samples:
+                    IMU_gyro_x += gyro_x
+                    IMU_gyro_y += gyro_y
+                    IMU_gyro_z += gyro_z
+                    IMU_accel_x += accel_x
+                    IMU_accel_y += accel_y
+                    IMU_accel_z += accel_z
 
             log(f"\nTotal IMU values:\n"
                 f"\tgyro x: {IMU_gyro_x}\n"
@@ -510,27 +487,9 @@ class Util:
         Returns:
             None, but writes into a file
         """
-        if not self.file_manager.exists(self.port_file_name):
-            self.file_manager.writer(self.port_file_name, 'w', '')
-
-        if not self.exist_port_file_entry(port_name=port_name) and not self.exist_port_file_entry(category=category, port_number=port_number):
-            msg = category + self.port_file_seperator + port_name + self.port_file_seperator + str(port_number) + '\n'
-            self.file_manager.writer(self.port_file_name, 'a', msg)
+        if self.port_registry.add(port_name, category, port_number):  # new entries get appended, overwriting rewrites the file
             log_msg = f'Successfully added new entry: {port_name}'
         else:
-            entries = self.get_port_file_entries()  # dict
-            self.file_manager.cleaner(self.port_file_name)
-            for name, (number, cat) in entries.items():
-                if name == port_name:
-                    number = port_number
-                    cat = category
-
-                elif number == port_number and cat == category:
-                    name = port_name
-
-                msg = cat + self.port_file_seperator + name + self.port_file_seperator + str(number) + '\n'
-                self.file_manager.writer(self.port_file_name, 'a', msg)
-
             log_msg = f'Successfully overwritten old entry with port name "{port_name}" to category "{category}" and port number #{port_number}'
 
         if port_file_logable_function_name == "create_port_file_entry":
@@ -558,53 +517,15 @@ class Util:
                 log('You need to either know the port name or at least two other parameters!', in_exception=True)
             raise ValueError('You need to either know the port name or at least two other parameters!')
 
-        if port_name:
-            existing = self.exist_port_file_entry(port_name=port_name)
-
-        else:  # category and isinstance(port_number, int):  got basically checked
-            existing = self.exist_port_file_entry(category=category, port_number=port_number)
-
-        if existing:
-            entries = self.get_port_file_entries()  # dict
-            self.file_manager.cleaner(self.port_file_name)
-            for name, (number, cat) in entries.items():
-                if port_name and name == port_name:
-                    found = True
-                elif (category and isinstance(port_number, int)) and (number == port_number and cat == category):
-                    found = True
-                else:
-                    found = False
-
-                if not found:
-                    msg = cat + self.port_file_seperator + name + self.port_file_seperator + str(number) + '\n'
-                    self.file_manager.writer(self.port_file_name, 'a', msg)
-                else:
-                    port_name = name
-                    category = cat
-                    port_number = number
-
-            if port_name:
-                existing = self.exist_port_file_entry(port_name=port_name)
-
-            else:  # category and isinstance(port_number, int):
-                existing = self.exist_port_file_entry(category=category, port_number=port_number)
-
-            if not existing:
-                if port_file_logable_function_name == "remove_port_file_entry":
-                    log(f'Successfully removed entry with port name "{port_name}".')
-            elif port_name and not self.exist_port_file_entry(port_name=port_name):
-                if port_file_logable_function_name == "remove_port_file_entry":
-                    log(f'Failed to remove entry - category: "{category}", port number: #{port_number}', important=True)
+        removed = self.port_registry.remove(port_name, category, port_number)
+        if port_file_logable_function_name == "remove_port_file_entry":
+            if removed:
+                names = ', '.join(f'"{entry[0]}"' for entry in removed)
+                log(f'Successfully removed entry with port name {names}.')
+            elif port_name:
+                log(f'Entry with name "{port_name}" does not exist', important=True)
             else:
-                if port_file_logable_function_name == "remove_port_file_entry":
-                    log(f'Failed to remove entry - port name: "{port_name}"', important=True)
-        else:
-            if port_file_logable_function_name == "remove_port_file_entry":
-                if port_name:
-                    log_msg = f'Entry with name "{port_name}" does not exist'
-                else:
-                    log_msg = f'Entry with category "{category}" and port number #{port_number} does not exist'
-                log(log_msg, important=True)
+                log(f'Entry with category "{category}" and port number #{port_number} does not exist', important=True)
 
 
 
@@ -629,19 +550,9 @@ class Util:
                 log('You need to either know the port name or at least two other parameters!', in_exception=True)
             raise ValueError('You need to either know the port name or at least two other parameters!')
 
-        try:
-            if port_name:
-                entry = self.get_port_file_entries(port_name=port_name)
-                return True if isinstance(entry[0], int) and entry[1] else False
-
-            if category and isinstance(port_number, int):
-                entry = self.get_port_file_entries(category=category, port_number=port_number)
-                return True if entry else False
-
-            return False
-
-        except Exception as e:
-            return False
+        if port_name:
+            return self.port_registry.get_by_name(port_name) is not None
+        return self.port_registry.get_by_port(category, port_number) is not None
 
     def shutdown_wombat(self) -> None:
         """
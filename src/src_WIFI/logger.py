@@ -9,104 +9,462 @@ sys.path.append("/usr/lib")
 # Date of creation: 2025-09-05
 
 from datetime import datetime
-import inspect
-import subprocess
+import atexit
+import json
+import queue
+import shutil
+import threading
+import time
 import traceback
 
 LOG_FOLDER = "/home/kipr/BotBall-data/logger_log"
 LOG_FILE = os.path.join(LOG_FOLDER, "log_file.txt")
-os.makedirs(LOG_FOLDER, exist_ok=True)
-subprocess.run(["sudo", "chmod", "-R", "777", LOG_FOLDER], check=True)
 
-
-def log(message: str, with_print: bool = True, important: bool = False, in_exception: bool = False) -> None:
+FLUSH_INTERVAL = 0.1  # 100ms  -> the writer thread flushes the log file at least this often while there is something new
+FLUSH_TIMEOUT = 2  # 2s  -> maximum time flush_log() waits for the writer thread before it writes everything itself
+MAX_LOG_SIZE = 1000000  # 1MB  -> size after which log_file.txt gets renamed to log_file_1.txt and a new one gets started
+LOG_SEGMENTS = 3  # number of old log files (log_file_1.txt is the newest) that are kept, the oldest one gets deleted
+
+DEBUG = 10
+INFO = 20
+WARN = 30
+ERROR = 40
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARN: "WARN", ERROR: "ERROR"}
+
+TEXT = 'text'
+JSON = 'json'
+
+__all__ = ['log', 'set_log_level', 'get_log_level', 'set_log_format', 'flush_log', 'backup_log',
+           'DEBUG', 'INFO', 'WARN', 'ERROR', 'LEVEL_NAMES', 'TEXT', 'JSON',
+           'LOG_FOLDER', 'LOG_FILE', 'FLUSH_INTERVAL', 'FLUSH_TIMEOUT', 'MAX_LOG_SIZE', 'LOG_SEGMENTS']
+
+_threshold = INFO  # every log() call below this level gets ignored
+_callers = {}  # code object -> (if there is a local "self", function name, file name) of the function
+_format = TEXT
+_second = None  # the timestamp only gets formatted once per second
+_timestamp = ''
+_queue = queue.SimpleQueue()  # (time, caller, label, message, important, in_exception, with_print, thread) of every log() call, or a threading.Event from flush_log()
+_write_lock = threading.Lock()  # only one thread at a time writes into the log file
+_writer = None
+_file = None
+_file_size = 0  # bytes in the log file, counted while writing so the file never has to be read
+_folder_ready = False  # the log folder gets created with the first write, not at import
+_write_through = False  # a forked child process (multiprocessing) never runs the exit handlers, so it writes right away
+
+
+def log(message: str, with_print: bool = True, important: bool = False, in_exception: bool = False, level: int = None) -> None:
     """
-    write the message in the log file and print it to the screen
+    write the message in the log file and print it to the screen. Returns right away if the level is below the threshold (see set_log_level()), so DEBUG logs in loops cost almost nothing
 
     Args:
         message (str): The message that should be written into the file
         with_print (bool, optional): If True (default), it prints out the message as well, otherwise it just writes into the log file
         important (bool, optional): If True, it will be marked with some "=", otherwise (False, default) just the message given to the function
         in_exception (bool, optional): If True, the additional label will tell you that an exception was thrown and also sets important automatically to True, otherwise (False, default) it tells you that it's only an information
+        level (int, optional): DEBUG, INFO, WARN or ERROR (default: None -> ERROR if in_exception is True, otherwise INFO)
 
     Returns:
         None
     """
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    frame = inspect.currentframe()
-    caller_frame = frame.f_back
-    func_name = caller_frame.f_code.co_name
-    class_name = None
+    if level is None:
+        level = ERROR if in_exception else INFO
+    if level < _threshold:
+        return
 
+    caller_frame = sys._getframe(1)
     if in_exception:
         important = True
         label = "EXCEPTION"
-        frame_info = inspect.stack()[1]
-        filename = os.path.basename(frame_info.filename)
-        func_name = frame_info.function
+        if sys.exc_info()[1] is not None:  # the stack only gets formatted if there really is an exception
+            message = f"{message}\nStacktrace:\n{traceback.format_exc()}"
+    else:
+        label = LEVEL_NAMES[level]
 
-        if "self" in caller_frame.f_locals:
-            class_name = caller_frame.f_locals["self"].__class__.__name__
+    _queue.put((time.time(), _caller(caller_frame), label, message, important, in_exception, with_print, threading.current_thread().name))
+    if _write_through:
+        flush_log()
+    elif _writer is None:
+        _start_writer()
 
-        if class_name:
-            location = f"{class_name}.{func_name}"
-        else:
-            location = f"{filename}.{func_name}"
 
-        tb = traceback.format_exc()
-        if tb and tb != 'NoneType: None\n':
-            message += f"\nStacktrace:\n{tb}"
+def set_log_level(level: int) -> None:
+    """
+    sets the threshold below which every log() call gets ignored
 
-    else:
-        label = "INFO"
-        if "self" in caller_frame.f_locals:
-            class_name = caller_frame.f_locals["self"].__class__.__name__
-        if class_name:
-            location = f"{class_name}.{func_name}"
-        else:
-            filename = caller_frame.f_code.co_filename
-            location = func_name if func_name != "<module>" else os.path.basename(filename)
+    Args:
+        level (int): DEBUG, INFO, WARN or ERROR
+
+    Returns:
+        None
+    """
+    global _threshold
+    if level not in LEVEL_NAMES:
+        log(f'level can only be one of {list(LEVEL_NAMES)}', in_exception=True)
+        raise ValueError(f'level can only be one of {list(LEVEL_NAMES)}')
+    _threshold = level
+
+
+def get_log_level() -> int:
+    """
+    lets you see the threshold below which every log() call gets ignored
+
+    Args:
+        None
+
+    Returns:
+        int: DEBUG, INFO, WARN or ERROR
+    """
+    return _threshold
+
+
+def _caller(frame) -> tuple:
+    """
+    receive class, function and file of the caller. Function and file only get built once per function and are cached afterwards. The class is the class of the instance (self), so a method of a parent class gets logged with the name of the class it got called on
+
+    Args:
+        frame (frame): the frame of the caller
+
+    Returns:
+        tuple: (class name or None, function name, file name)
+    """
+    code = frame.f_code
+    caller = _callers.get(code)
+    if caller is None:
+        caller = _callers[code] = _describe(code)
+
+    has_self, func_name, filename = caller
+    if has_self:  # only functions with a "self" need the locals of the frame
+        instance = frame.f_locals.get('self')
+        if instance is not None:
+            return instance.__class__.__name__, func_name, filename
+    return None, func_name, filename
+
+
+def _describe(code) -> tuple:
+    """
+    finds out if a function can have a "self" and its function and file name
+
+    Args:
+        code (code): the code object of the function
+
+    Returns:
+        tuple: (if there is a local "self", function name, file name)
+    """
+    has_self = 'self' in code.co_varnames or 'self' in code.co_cellvars or 'self' in code.co_freevars
+    return has_self, code.co_name, os.path.basename(code.co_filename)
 
+
+def _location(caller: tuple, in_exception: bool) -> str:
+    """
+    builds the location which gets shown in a text log entry
+
+    Args:
+        caller (tuple): (class name or None, function name, file name)
+        in_exception (bool): exceptions always name the file if there is no class
+
+    Returns:
+        str: "class.function", "file.function" (exceptions), "function" or "file" (module level)
+    """
+    class_name, func_name, filename = caller
+    if class_name:
+        return f"{class_name}.{func_name}"
     if in_exception:
+        return f"{filename}.{func_name}"
+    return func_name if func_name != "<module>" else filename
+
+
+def _format_record(record: tuple) -> tuple:
+    """
+    builds the text of a log entry for the file and the screen (gets done by the writer thread, not by the caller of log())
+
+    Args:
+        record (tuple): the record of a log() call
+
+    Returns:
+        tuple: (log entry, print text or None)
+    """
+    global _second, _timestamp
+    created, caller, label, message, important, in_exception, with_print, thread = record
+    second = int(created)
+    if second != _second:
+        _second, _timestamp = second, datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+    now = _timestamp
+    location = _location(caller, in_exception)
+
+    if _format == JSON:
+        log_entry = json.dumps({
+            'time': f"{now}.{int(created % 1 * 1000):03d}",
+            'level': label,
+            'class': caller[0],
+            'function': caller[1],
+            'file': caller[2],
+            'thread': thread,
+            'message': str(message)
+        }, ensure_ascii=False) + "\n"
+    elif in_exception:
         log_entry = f"{'=' * 50} \n{'=' * 10} \n{now} [{location}] - [{label}] \n {message}{'=' * 10}\n{'=' * 50}\n"
     else:
         if important:
-            message = '=' * 10 + message + '=' * 10
+            message = '=' * 10 + str(message) + '=' * 10
         log_entry = f"{now} [{location}] - [{label}] {message}\n"
 
-    with open(LOG_FILE, 'a') as fwriter:
-        fwriter.write(log_entry)
+    print_text = None
+    if with_print:
+        if in_exception:
+            print_text = f"=================================\n[{location}] - [{label}]\n{message}\n================================="
+        else:
+            if important and _format == JSON:
+                message = '=' * 10 + str(message) + '=' * 10
+            print_text = f"[{location}] - [{label}] {message}"
+    return log_entry, print_text
 
-    print_text = f"[{location}] - [{label}] {message}" if not in_exception else f"=================================\n[{location}] - [{label}]\n{message}\n================================="
 
-    if with_print:
-        print(print_text, flush=True)
+def set_log_format(log_format: str) -> None:
+    """
+    sets how the entries get written into the log file. "text" is easy to read, "json" writes one JSON object per line (time, level, class, function, file, thread, message) which can be filtered with log_query.py
+
+    Args:
+        log_format (str): TEXT ("text") or JSON ("json")
+
+    Returns:
+        None
+    """
+    global _format
+    if log_format not in (TEXT, JSON):
+        log(f'log_format can only be "{TEXT}" or "{JSON}"', in_exception=True)
+        raise ValueError(f'log_format can only be "{TEXT}" or "{JSON}"')
+    flush_log()  # the entries that are already waiting get written in the old format
+    _format = log_format
+
+
+def flush_log() -> None:
+    """
+    waits until everything that got logged so far is written into the log file and printed (gets called automatically at exit and by the emergency stop)
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    writer = _writer
+    if writer is not None and writer.is_alive() and writer is not threading.current_thread():
+        done = threading.Event()
+        _queue.put(done)
+        if done.wait(FLUSH_TIMEOUT):
+            return
+    with _write_lock:  # no writer thread (anymore) -> write everything in this thread
+        _write_batch([])
+
+
+def _start_writer() -> None:
+    """
+    starts the thread which writes the log entries into the file in the background
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    global _writer
+    with _write_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_writer_loop, name='log_writer', daemon=True)
+            _writer.start()
+
+
+def _reset_after_fork() -> None:
+    """
+    a forked child process does not have the writer thread of its parent and gets killed without the exit handlers, so it writes every entry right away. The entries the parent did not write yet stay with the parent
+
+    Args:
+        None
 
-    _log_handler()
+    Returns:
+        None
+    """
+    global _writer, _file, _write_lock, _queue, _write_through
+    _writer = None
+    _file = None  # the child opens the log file itself, so its size gets taken from the file (see _open_log())
+    _write_lock = threading.Lock()
+    _queue = queue.SimpleQueue()
+    _write_through = True
 
 
-def _log_handler(max_entries: int = 10000, trim_size: int = 500) -> None:
+def _write_batch(records: list) -> None:
     """
-    handles the file, so there won't be too many entries, otherwise deletes the oldest entries
+    writes the given records and everything else that is waiting in the queue with one write into the log file and flushes it (the write lock needs to be held)
 
     Args:
-        max_entries (int, optional): The maximum number of newlines
-        trim_size (int, optional): The number of newlines getting deleted
+        records (list): records that already got taken out of the queue
 
     Returns:
         None
     """
+    global _file_size
+    waiting = []
+    while True:
+        try:
+            record = _queue.get_nowait()
+        except queue.Empty:
+            break
+        if isinstance(record, threading.Event):
+            waiting.append(record)
+        else:
+            records.append(record)
+
     try:
-        with open(LOG_FILE, 'r') as f:
-            lines = f.readlines()
+        if records:
+            records = [_format_record(record) for record in records]
+            texts = [text for _, text in records if text is not None]
+            if texts:
+                print('\n'.join(texts), flush=True)
+            _check_file()
+            chunk = []
+            for entry, _ in records:
+                data = entry.encode()
+                if _file_size > 0 and _file_size + len(data) > MAX_LOG_SIZE:  # split the batch, so no file gets bigger than MAX_LOG_SIZE
+                    _file.write(b''.join(chunk))
+                    chunk = []
+                    _rotate()
+                chunk.append(data)
+                _file_size += len(data)
+            _file.write(b''.join(chunk))
+        if _file is not None:
+            _file.flush()
+    except Exception as e:
+        print(f'Log write Exception: {str(e)}', flush=True)
+    finally:
+        for done in waiting:
+            done.set()
+
+
+def _writer_loop() -> None:
+    """
+    loop of the writer thread. Collects the log entries and writes them in batches, so the callers of log() never wait for the file or the screen
 
-        if len(lines) > max_entries:
-            new_lines = lines[trim_size:]
-            with open(LOG_FILE, 'w') as f:
-                f.writelines(new_lines)
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    while True:
+        record = _queue.get()
+        if not isinstance(record, threading.Event):
+            time.sleep(FLUSH_INTERVAL)  # let the entries of the next moments pile up, so they get written together
+        with _write_lock:
+            if isinstance(record, threading.Event):
+                _write_batch([])
+                record.set()
+            else:
+                _write_batch([record])
+
+
+def _check_file() -> None:
+    """
+    opens the log file or takes its size from the file. The parent and its forked children write into the same file, so the size one process counted is not enough, and if another process already rotated the file, it gets opened again (the write lock needs to be held)
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    global _file_size
+    if _file is None:
+        _open_log()
+        return
+    opened = os.fstat(_file.fileno())
+    try:
+        current = os.stat(LOG_FILE)
     except FileNotFoundError:
-        pass
+        current = None
+    if current is None or (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino):
+        _file.close()
+        _open_log()
+    else:
+        _file_size = opened.st_size
+
+
+def _segment_path(number: int) -> str:
+    """
+    path of an old log file
+
+    Args:
+        number (int): 1 is the newest old log file, LOG_SEGMENTS the oldest one
+
+    Returns:
+        str: path of the log file
+    """
+    return os.path.join(LOG_FOLDER, f"log_file_{number}.txt")
+
+
+def _rotate() -> None:
+    """
+    handles the file, so it won't get too big. Renames the full log file to log_file_1.txt (and every older one by one number up), the oldest one gets deleted. Only renames, nothing gets read (the write lock needs to be held)
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    _file.close()
+    for number in range(LOG_SEGMENTS - 1, 0, -1):
+        if os.path.exists(_segment_path(number)):
+            os.replace(_segment_path(number), _segment_path(number + 1))
+    if LOG_SEGMENTS > 0:
+        os.replace(LOG_FILE, _segment_path(1))
+    else:
+        os.remove(LOG_FILE)
+    _open_log()
+
+
+def _open_log() -> None:
+    """
+    opens the log file for the writer. The folder gets created the first time (once per process) and everything that gets created here can be written by every user, so the scripts work with and without sudo. No subprocess needed (the write lock needs to be held)
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    global _file, _file_size, _folder_ready
+    if not _folder_ready:
+        if not os.path.isdir(LOG_FOLDER):
+            os.makedirs(LOG_FOLDER, exist_ok=True)
+            _share(LOG_FOLDER, 0o777)
+        _folder_ready = True
+
+    created = not os.path.exists(LOG_FILE)
+    _file = open(LOG_FILE, 'ab')  # binary, so the bytes that get written are the bytes that get counted
+    if created:
+        _share(LOG_FILE, 0o666)
+    _file_size = os.fstat(_file.fileno()).st_size
+
+
+def _share(path: str, mode: int) -> None:
+    """
+    gives a file or folder that this process created to every user (the umask would remove the rights of the others)
+
+    Args:
+        path (str): the file or folder
+        mode (int): e.g. 0o666 for files, 0o777 for folders
+
+    Returns:
+        None
+    """
+    try:
+        os.chmod(path, mode)
+    except OSError as e:
+        print(f'Log permission Exception: {str(e)}', flush=True)
+
+
+atexit.register(flush_log)  # registered first -> runs last, so the logs of every other exit handler get written as well
+os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 def backup_log() -> None:
@@ -119,6 +477,7 @@ def backup_log() -> None:
     Returns:
         None
     """
+    flush_log()
     if not os.path.exists(LOG_FILE):
         log('No backup file existing')
         return
@@ -135,9 +494,9 @@ def backup_log() -> None:
     next_num = max(numbers) + 1 if numbers else 1
     backup_file = os.path.join(LOG_FOLDER, f"backup_log_file_{next_num}.txt")
 
-    with open(LOG_FILE, 'r') as freader:
-        with open(backup_file, 'w') as fwriter:
-            fwriter.writelines(freader.readlines())
+    with _write_lock:  # the writer thread must not rotate the file in the middle of the copy
+        shutil.copyfile(LOG_FILE, backup_file)
+        _share(backup_file, 0o666)
 
     log("Backup successful!", important=True)
 